@@ -0,0 +1,64 @@
+"""
+Measures the import time of the scraper entry point modules with
+`python -X importtime`, and lists any heavy optional dependency that was
+imported eagerly.
+
+Usage: python -m benchmarks.import_time [--runs N] [module ...]
+"""
+import sys
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List
+
+DEFAULT_MODULES = [
+    "scraper.cmd.cli",
+    "scraper.config.validator",
+    "scraper.etl.runtime",
+    "scraper.etl.ocr",
+]
+
+# Loaded on first use only; none should appear in an import trace
+LAZY_DEPENDENCIES = ["pandas", "numpy", "PIL", "pytesseract", "docker", "psutil", "requests"]  # noqa:E501
+
+
+def import_trace(module: str) -> Dict[str, int]:
+    """
+    Imports a module in a fresh interpreter and returns the cumulative
+    import time (in microseconds) of every module that was loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    trace = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            trace[name.strip()] = int(cumulative)
+    return trace
+
+
+def eager_dependencies(trace: Dict[str, int]) -> List[str]:
+    """Returns the lazy dependencies that were imported in a trace."""
+    return [name for name in LAZY_DEPENDENCIES if name in trace]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper import time benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    args = parser.parse_args()
+
+    print(f"{'module':<28}{'median ms':>10}  eager dependencies")
+    for module in args.modules:
+        traces = [import_trace(module) for _ in range(args.runs)]
+        median = statistics.median(trace[module] for trace in traces) / 1000
+        eager = ", ".join(eager_dependencies(traces[0])) or "-"
+        print(f"{module:<28}{median:>10.1f}  {eager}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Measures the time StructuredLogger.info spends on the scraping thread per
+page of the ExtractionManager pagination loop, for each logging mode.
+
+The fake driver sleeps for --latency seconds per page_source read to stand
+in for the WebDriver round trip, during which a background writer can run.
+
+Usage: python -m benchmarks.logging_overhead [--pages N] [--latency S]
+"""
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from scraper.config.validator import LoggingConfig, Extraction
+from scraper.config.logging import StructuredLogger
+from scraper.etl.extraction import ExtractionManager
+
+
+class FakeDriver(MagicMock):
+    latency = 0.0
+
+    @property
+    def page_source(self) -> str:
+        time.sleep(self.latency)
+        return "<html></html>"
+
+
+def run_extraction(logger: StructuredLogger, pages: int, latency: float) -> float:  # noqa:E501
+    """
+    Runs a paginated 'source' extraction over N fake pages, returning the mean
+    time (in seconds) spent inside logger.info per call.
+    """
+    driver = FakeDriver()
+    driver.latency = latency
+    extraction = Extraction(
+        type="source",
+        locator="body",
+        locator_type="tag name",
+        wait_interval=0,
+        pagination_locator="next",
+        pagination_locator_type="id",
+        output_type="csv",
+        output_file=Path("unused.csv"),
+    )
+    manager = ExtractionManager(logger, driver)
+    more_pages = [True] * (pages - 1) + [False]
+    info = logger.info
+    spent = []
+
+    def timed_info(*args, **kwargs):
+        start = time.perf_counter()
+        info(*args, **kwargs)
+        spent.append(time.perf_counter() - start)
+
+    with patch.object(logger, "info", side_effect=timed_info), \
+         patch("scraper.etl.extraction.paginate", side_effect=more_pages):
+        manager._perform_paginated_extraction(extraction)
+    return sum(spent) / len(spent)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StructuredLogger overhead benchmark")  # noqa:E501
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.001)
+    args = parser.parse_args()
+
+    modes = {
+        "filtered (level ERROR)": {"log_level": "ERROR"},
+        "sync": {"log_level": "INFO"},
+        "async": {"log_level": "INFO", "log_async": True},
+    }
+    with tempfile.TemporaryDirectory() as log_directory:
+        results = {}
+        for mode, overrides in modes.items():
+            cfg = LoggingConfig(
+                log_directory=Path(log_directory),
+                log_format="json",
+                log_max_size="100MB",
+                **{"log_level": "INFO", **overrides},
+            )
+            logger = StructuredLogger("benchmark", cfg)
+            results[mode] = run_extraction(logger, args.pages, args.latency)
+            logger.close()
+
+    print(f"{'mode':<24}{'us/info call':>14}")
+    for mode, per_call in results.items():
+        print(f"{mode:<24}{per_call * 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares the NumPy preprocessing pipeline with the previous Pillow
+implementation (upscale, median filter, grayscale, threshold) on synthetic
+element captures, per image and as a batch, and reports how many output
+pixels agree. The default order matches the legacy output; the opt-in fast
+order is timed and compared too.
+
+Usage: python -m benchmarks.ocr_preprocess [--images N] [--size WxH] [--repeat R]
+"""  # noqa:E501
+import time
+import argparse
+import numpy as np
+from io import BytesIO
+from PIL import Image, ImageDraw, ImageFilter, ImageOps
+
+from scraper.etl.preprocessing import Preprocessor
+
+
+def legacy_preprocess(raw_image: bytes) -> Image.Image:
+    """The Pillow pipeline used before the NumPy one, without the crop."""
+    image = Image.open(BytesIO(raw_image)).convert("RGB")
+    resized_image = image.resize((image.width * 3, image.height * 3), Image.Resampling.LANCZOS)  # noqa:E501
+    median_filtered_image = resized_image.filter(ImageFilter.MedianFilter(size=3))  # noqa:E501
+    grayscale_image = ImageOps.grayscale(median_filtered_image)
+    return grayscale_image.point(lambda p: p > 230 and 255)
+
+
+def make_images(count: int, width: int, height: int) -> list:
+    """Renders noisy captcha-like PNGs with dark text on a light background."""
+    rng = np.random.default_rng(0)
+    images = []
+    for index in range(count):
+        image = Image.new("RGB", (width, height), (245, 245, 245))
+        ImageDraw.Draw(image).text((width // 8, height // 3), f"{index:06d}", fill=(20, 20, 20))  # noqa:E501
+        pixels = np.asarray(image, dtype=np.int16)
+        noise = rng.integers(-40, 40, pixels.shape)
+        pixels = np.clip(pixels + noise, 0, 255).astype(np.uint8)
+        buffer = BytesIO()
+        Image.fromarray(pixels).save(buffer, format="PNG")
+        images.append(buffer.getvalue())
+    return images
+
+
+def best_of(repeat: int, function, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR preprocessing benchmark")  # noqa:E501
+    parser.add_argument("--images", type=int, default=200)
+    parser.add_argument("--size", default="120x40")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    width, height = map(int, args.size.lower().split("x"))
+
+    images = make_images(args.images, width, height)
+    preprocessor = Preprocessor()
+    fast = Preprocessor(fast=True)
+    results = {
+        "pillow (legacy)": best_of(args.repeat, lambda: [legacy_preprocess(image) for image in images]),  # noqa:E501
+        "numpy per image": best_of(args.repeat, lambda: [preprocessor(image) for image in images]),  # noqa:E501
+        "numpy batch": best_of(args.repeat, preprocessor.batch, images),
+        "numpy fast batch": best_of(args.repeat, fast.batch, images),
+    }
+
+    legacy = np.stack([np.asarray(legacy_preprocess(image)) for image in images])  # noqa:E501
+    current = np.stack([np.asarray(image) for image in preprocessor.batch(images)])  # noqa:E501
+    fast_current = np.stack([np.asarray(image) for image in fast.batch(images)])  # noqa:E501
+
+    print(f"{args.images} images of {width}x{height}, best of {args.repeat}")
+    print(f"{'pipeline':<20}{'ms/image':>10}{'speedup':>10}")
+    baseline = results["pillow (legacy)"]
+    for name, seconds in results.items():
+        print(f"{name:<20}{seconds / args.images * 1e3:>10.3f}{baseline / seconds:>9.1f}x")  # noqa:E501
+    print(f"pixel agreement with legacy output: {(legacy == current).mean():.2%} (fast: {(legacy == fast_current).mean():.2%})")  # noqa:E501
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
 from scraper.etl.runtime import run_scraper
+from scraper.etl.daemon import run_daemon
 from scraper.cmd.cli import run_cli
 from scraper.web.controller import setup_controller
+from scraper.telemetry.exporter import start_exporters, stop_exporters
+from scraper.telemetry import tracing
+from scraper.telemetry.profiling import Profiler
+from scraper.telemetry.locators import PROFILER as LOCATOR_PROFILER
 
 
 def main():
@@ -10,16 +15,30 @@ def main():
         return
 
     logger.info("Starting Web Scraper")
+    exporters = []
 
     try:
+        exporters = start_exporters(logger, cfg["metrics"])
+        tracing.configure(cfg["tracing"].output_file)
         controller = setup_controller(logger, cfg)
         targets = cfg["target"]
-        run_scraper(logger, controller, targets)
+        if cfg["daemon"].enabled:
+            run_daemon(logger, controller, targets, cfg["daemon"], cfg["ocr"])
+        else:
+            profiler = None
+            if cfg["logging"].log_profile:
+                profiler = Profiler(logger, cfg["logging"].log_directory / "profiles")  # noqa:E501
+            run_scraper(logger, controller, targets, profiler, cfg["ocr"])
     except Exception as e:
         logger.critical(f"Fatal Error: {e}", exc_info=True)
         return
 
     finally:
+        stop_exporters(exporters)
+        tracing.shutdown()
+        report_file = logger.log_directory / f"locators_{logger.log_file.stem}.txt"
+        if LOCATOR_PROFILER.write_report(report_file):
+            logger.info(f"Locator report written to: {report_file}")
         logger.info("Scraper Exited")
         logger.close()  # Ensure the log file is properly closed
 
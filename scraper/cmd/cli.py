@@ -7,9 +7,19 @@ from scraper.config.validator import (
     DockerConfig,
     ProxyConfig,
     DriverConfig,
+    MetricsConfig,
+    TracingConfig,
+    PreflightConfig,
+    DaemonConfig,
+    OCRConfig,
+    SessionConfig,
     TargetConfig,
 )
 from scraper.config.logging import StructuredLogger
+from scraper.config.preflight import run_preflight
+from scraper.config.cache import load_cached_config
+
+CONFIG_CACHE_DIR = Path("files/configs/.cache")
 
 
 def parse_arguments():
@@ -34,6 +44,26 @@ def parse_arguments():
         action="store_true",
         help="Enable debug logging",
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write pstats and collapsed stack profiles per target to the log directory",  # noqa:E501
+    )
+    parser.add_argument(
+        "--skip-preflight",
+        action="store_true",
+        help="Skip the Docker, network and resource checks before the run",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run targets on their schedules and keep browsers warm between runs",
+    )
+    parser.add_argument(
+        "--no-config-cache",
+        action="store_true",
+        help="Always re-parse and re-validate the config file",
+    )
     return parser.parse_args()
 
 
@@ -42,6 +72,7 @@ def run_cli():
     target_type = args.target_type
     config_format = args.config_format.lower()
     debug_mode = args.debug
+    profile_mode = args.profile
 
     # Convert config format to file extension
     if config_format in ["yaml", "json", "toml"]:
@@ -57,6 +88,12 @@ def run_cli():
             "docker": DockerConfig(),
             "proxy": ProxyConfig(),
             "driver": DriverConfig(),
+            "metrics": MetricsConfig(),
+            "tracing": TracingConfig(),
+            "preflight": PreflightConfig(),
+            "daemon": DaemonConfig(),
+            "ocr": OCRConfig(),
+            "session": SessionConfig(),
             "target": [
                 TargetConfig(),
                 TargetConfig(
@@ -69,10 +106,19 @@ def run_cli():
     else:
         config_file = Path(f"files/configs/{target_type}{config_format}")
         try:
-            cfg = load_config(config_file)
+            if args.no_config_cache:
+                cfg = load_config(config_file)
+            else:
+                cfg = load_cached_config(config_file, CONFIG_CACHE_DIR)
         except Exception as e:
             print(f"Fatal Error (config.load_config): {e}")
             return None, None
+        if not args.skip_preflight:
+            try:
+                run_preflight(cfg)
+            except Exception as e:
+                print(f"Fatal Error (config.preflight): {e}")
+                return None, None
 
     logger_cfg = cfg["logging"]
 
@@ -81,6 +127,17 @@ def run_cli():
     else:
         logger_cfg.log_level = "ERROR"
 
+    if profile_mode:
+        logger_cfg.log_profile = True
+
+    if args.daemon:
+        cfg["daemon"].enabled = True
+
+    if logger_cfg.log_profile and cfg["daemon"].enabled:
+        # Profiles are written per section of a one-shot run, daemon runs would go unprofiled  # noqa:E501
+        print("Fatal Error: Profiling is not supported in daemon mode")
+        return None, None
+
     logger = StructuredLogger(target_type, logger_cfg)
 
     return logger, cfg
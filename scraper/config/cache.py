@@ -0,0 +1,117 @@
+import os
+import pickle
+import ast
+import hashlib
+import pydantic
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from . import validator
+from .validator import load_config
+
+CACHE_FORMAT = 1
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _schema_modules() -> List[Path]:
+    """
+    Returns validator.py and the package modules it imports, directly or
+    through each other, e.g. schedule.py for parse_schedule. The runtime
+    modules of the package do not shape the models and are left out.
+    """
+    package = Path(validator.__file__).parent
+    pending, modules = [Path(validator.__file__)], set()
+    while pending:
+        module = pending.pop()
+        if module in modules or not module.is_file():
+            continue
+        modules.add(module)
+        for node in ast.walk(ast.parse(module.read_bytes())):
+            if isinstance(node, ast.ImportFrom) and node.level == 1:
+                names = [node.module] if node.module else [alias.name for alias in node.names]  # noqa:E501
+                pending += [package / f"{name.split('.')[0]}.py" for name in names]  # noqa:E501
+    return sorted(modules)
+
+
+def _schema_hash() -> str:
+    """
+    Hashes the model definitions, so cached models are dropped when they
+    change. Covers the modules the models call into while validating, e.g.
+    parse_schedule.
+    """
+    digest = hashlib.sha256(f"{CACHE_FORMAT}:{pydantic.VERSION}".encode())
+    for module in _schema_modules():
+        digest.update(module.name.encode() + b"\0" + module.read_bytes())
+    return digest.hexdigest()
+
+
+def _referenced_paths(config: Dict) -> List[Path]:
+    """Returns the files and directories the validated config depends on."""
+    paths = [config["logging"].log_directory, config["proxy"].input_file]
+    paths += [target.input_file for target in config["target"] if target.input_file]  # noqa:E501
+    return paths
+
+
+def _fingerprint(path: Path) -> Optional[str]:
+    if path.is_file():
+        return _hash_bytes(path.read_bytes())
+    if path.is_dir():
+        return "directory"
+    return None
+
+
+def _cache_file(filename: Path, cache_dir: Path) -> Path:
+    path_hash = _hash_bytes(str(filename.resolve()).encode())[:12]
+    return cache_dir / f"{filename.name}.{path_hash}.pickle"
+
+
+def load_cached_config(filename: Path, cache_dir: Path) -> Dict:
+    """
+    Loads a configuration like load_config, reusing the validated models of
+    a previous run if neither the config file, the files it references nor
+    the model definitions have changed since.
+
+    Args:
+        filename (Path): The configuration file.
+        cache_dir (Path): Directory compiled configs are stored in.
+
+    Returns:
+        Dict: The validated configuration.
+
+    Raises:
+        ConfigError: If the configuration cannot be loaded.
+    """
+    try:
+        config_hash = _hash_bytes(filename.read_bytes())
+    except OSError:
+        return load_config(filename)  # reports the missing file
+    schema_hash = _schema_hash()
+    cache_file = _cache_file(filename, cache_dir)
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+        if (cached["config_hash"] == config_hash and cached["schema_hash"] == schema_hash  # noqa:E501
+                and all(_fingerprint(Path(path)) == fingerprint for path, fingerprint in cached["references"].items())):  # noqa:E501
+            return cached["config"]
+    except Exception:
+        pass  # missing, stale or unreadable cache entries are rebuilt
+
+    config = load_config(filename)
+    entry = {
+        "config_hash": config_hash,
+        "schema_hash": schema_hash,
+        "references": {str(path): _fingerprint(path) for path in _referenced_paths(config)},  # noqa:E501
+        "config": config,
+    }
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        partial = cache_file.with_name(cache_file.name + ".part")
+        with open(partial, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, cache_file)
+    except OSError:
+        pass  # caching is best effort
+    return config
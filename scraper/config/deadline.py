@@ -0,0 +1,73 @@
+import time
+import contextvars
+from contextlib import contextmanager
+from typing import Optional
+
+
+class DeadlineExceeded(Exception):
+    """Raised at a checkpoint once the time budget of the work has run out."""
+
+
+class Deadline:
+    """
+    Time budget of a unit of work, e.g. scraping a single link.
+
+    Attributes:
+        name (str): What the budget is for, used in messages.
+        timeout (float): The budget (in seconds).
+        expires_at (float): Monotonic time the budget runs out at.
+        aborted (bool): Set once a watchdog has aborted the work.
+    """
+
+    def __init__(self, name: str, timeout: float) -> None:
+        self.name = name
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+        self.aborted = False
+
+    @property
+    def expired(self) -> bool:
+        return self.aborted or time.monotonic() >= self.expires_at
+
+    def remaining(self) -> float:
+        """Returns the time (in seconds) left, zero once expired."""
+        if self.aborted:
+            return 0
+        return max(0, self.expires_at - time.monotonic())
+
+    def check(self) -> None:
+        if self.expired:
+            raise DeadlineExceeded(f"'{self.name}' exceeded its {self.timeout:g}s budget")  # noqa:E501
+
+
+_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("deadline", default=None)  # noqa:E501
+
+
+def current() -> Optional[Deadline]:
+    """Returns the deadline set by the enclosing scope, if any."""
+    return _deadline.get()
+
+
+def check() -> None:
+    """
+    Checkpoint between stages of the work: raises DeadlineExceeded if the
+    deadline of the enclosing scope has expired, and does nothing without one.
+    """
+    deadline = _deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+@contextmanager
+def scope(deadline: Optional[Deadline]):
+    """
+    Sets the deadline checked within the block.
+
+    Args:
+        deadline (Optional[Deadline]): The deadline, None for no budget.
+    """
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
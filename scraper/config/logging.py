@@ -1,6 +1,12 @@
-import os
-import logging
+import copy
+import gzip
 import json
+import queue
+import shutil
+import logging
+import threading
+import logging.handlers
+from pathlib import Path
 from datetime import datetime
 
 from .validator import LoggingConfig
@@ -14,6 +20,16 @@ class JsonFormatter(logging.Formatter):
     to parse and analyze log data.
     """
 
+    def __init__(self, compact: bool = False):
+        """
+        Initializes the formatter.
+
+        Args:
+            compact: If True, records are serialised on a single line without padding.
+        """  # noqa:E501
+        super().__init__()
+        self.compact = compact
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Formats a log record into a JSON string.
@@ -24,6 +40,21 @@ class JsonFormatter(logging.Formatter):
         Returns:
             A JSON-formatted string representing the log record.
         """
+        log_record = self._to_dict(record)
+        if self.compact:
+            return json.dumps(log_record, separators=(",", ":")) + ","
+        return json.dumps(log_record, indent=4) + ","
+
+    def _to_dict(self, record: logging.LogRecord) -> dict:
+        """
+        Collects the fields of a log record into a dictionary.
+
+        Args:
+            record: The log record to convert.
+
+        Returns:
+            A dictionary of the serialised record fields.
+        """
         log_record = {
             "time": datetime.fromtimestamp(record.created).isoformat(),
             "name": record.name,
@@ -33,7 +64,189 @@ class JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_record, indent=4) + ","
+        return log_record
+
+
+class JsonLinesFormatter(JsonFormatter):
+    """
+    Formats log records as single-line JSON objects for JSON Lines files.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Formats a log record into a single-line JSON string.
+
+        Args:
+            record: The log record to format.
+
+        Returns:
+            A compact JSON string without a trailing delimiter.
+        """
+        return json.dumps(self._to_dict(record), separators=(",", ":"))
+
+
+class JsonFileHandler(logging.FileHandler):
+    """
+    Writes formatted records to a JSON array log file, rotating by size.
+
+    The handler owns the log file lifecycle: it opens each file with '[',
+    keeps a running count of the bytes written so rotation never has to stat
+    the file, and closes the array with ']' when the file is rotated or the
+    handler is closed. Rotated files can be gzipped in the background.
+    """
+
+    suffix = ".json"
+
+    def __init__(self, log_directory: Path, max_bytes: int, compress: bool = False):  # noqa:E501
+        """
+        Initializes the handler and opens the first log file.
+
+        Args:
+            log_directory: Directory the log files are written to.
+            max_bytes: Size (in bytes) at which the log file is rotated.
+            compress: If True, rotated log files are gzipped.
+        """
+        self.log_directory = log_directory
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.bytes_written = 0
+        self._compressors = []
+        super().__init__(self._get_new_log_file(), mode="a", delay=True)
+        self._open_log_file()
+
+    def _get_new_log_file(self) -> Path:
+        """
+        Generates a new log file path with a timestamp, adding a counter if a
+        file with the same timestamp already exists.
+
+        Returns:
+            A Path object representing the new log file path.
+        """
+        stem = datetime.now().strftime('%Y%m%d_%H%M%S')
+        log_file = self.log_directory / f"{stem}{self.suffix}"
+        count = 1
+        while log_file.exists() or log_file.with_name(log_file.name + ".gz").exists():  # noqa:E501
+            log_file = self.log_directory / f"{stem}_{count}{self.suffix}"
+            count += 1
+        return log_file
+
+    @property
+    def log_file(self) -> Path:
+        return Path(self.baseFilename)
+
+    def _open_log_file(self) -> None:
+        """Opens the current log file and starts the JSON array."""
+        self.stream = self._open()
+        self.stream.write("[")
+        self.stream.flush()
+        self.bytes_written = 1
+
+    def _finalize_log_file(self) -> None:
+        """Closes the JSON array in the current log file and closes the stream."""  # noqa:E501
+        if self.stream is None:
+            return
+        self.stream.close()
+        self.stream = None
+        with open(self.baseFilename, "rb+") as f:
+            f.seek(0, 2)  # Move the cursor to the end of the file
+            size = f.tell()
+            if size >= 2:
+                f.seek(-2, 2)  # Move the cursor to final curly bracket
+                f.truncate()  # Remove the last comma and newline
+                f.write(b"]")  # Write the closing bracket
+            else:
+                f.write(b"]")  # if file is empty, close array in-place
+
+    def rotate(self) -> None:
+        """Finalizes the current log file and starts a new one."""
+        self._finalize_log_file()
+        if self.compress:
+            self._compress_log_file(Path(self.baseFilename))
+        self.baseFilename = str(self._get_new_log_file().absolute())
+        self._open_log_file()
+
+    def _compress_log_file(self, log_file: Path) -> None:
+        """Gzips a finalized log file on a background thread."""
+        def compress():
+            compressed = log_file.with_name(log_file.name + ".gz")
+            partial = log_file.with_name(log_file.name + ".gz.part")
+            with open(log_file, "rb") as src, gzip.open(partial, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            partial.rename(compressed)
+            log_file.unlink()
+
+        self._compressors = [thread for thread in self._compressors if thread.is_alive()]  # noqa:E501
+        thread = threading.Thread(target=compress, name="log-compression")
+        thread.start()
+        self._compressors.append(thread)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Writes a record, rotating first if the size limit has been reached.
+
+        Args:
+            record: The log record to write.
+        """
+        try:
+            if self.bytes_written >= self.max_bytes:
+                self.rotate()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self.stream.flush()
+            self.bytes_written += len(msg.encode(errors="replace"))
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Finalizes the log file, waits for pending compression and closes the handler."""  # noqa:E501
+        self.acquire()
+        try:
+            self._finalize_log_file()
+            for thread in self._compressors:
+                thread.join()
+            self._compressors = []
+            logging.Handler.close(self)
+        finally:
+            self.release()
+
+
+class JsonLinesFileHandler(JsonFileHandler):
+    """
+    Writes one JSON object per line to a JSON Lines log file, rotating by size.
+
+    Every line is complete once written, so the file stays valid after a
+    crash and can be streamed by log ingestion without loading it whole.
+    """
+
+    suffix = ".jsonl"
+
+    def _open_log_file(self) -> None:
+        """Opens the current log file."""
+        self.stream = self._open()
+        self.bytes_written = 0
+
+    def _finalize_log_file(self) -> None:
+        """Closes the stream of the current log file."""
+        if self.stream is None:
+            return
+        self.stream.close()
+        self.stream = None
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queues records for a background writer without formatting them first.
+
+    The stock QueueHandler formats every record on the calling thread; this
+    handler only merges the message arguments so formatting and writing both
+    happen on the writer thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 class StructuredLogger(logging.Logger):
@@ -41,7 +254,8 @@ class StructuredLogger(logging.Logger):
     A logger that uses structured logging with JSON format.
 
     This logger outputs log records in a structured JSON format, which is
-    useful for processing and analyzing log data.
+    useful for processing and analyzing log data. In async mode records are
+    queued and serialised compactly by a background writer thread.
     """
 
     def __init__(self, target_type: str, cfg: LoggingConfig):
@@ -54,20 +268,19 @@ class StructuredLogger(logging.Logger):
         """  # noqa:E501
         super().__init__(name=f"Scraper Log: {target_type}", level=cfg.log_level)
         self.log_directory = cfg.log_directory
-        self.log_file = self._get_new_log_file()
         self.log_max_size = self._parse_log_max_size(cfg.log_max_size)
+        self.log_async = cfg.log_async
+        self.log_file_format = cfg.log_file_format
+        self.log_compress = cfg.log_compress
+        self.listener = None
         self.logger = logging.getLogger(target_type)
         self.logger.setLevel(cfg.log_level.upper())
         self._configure_file_handler(cfg.log_level)
 
-    def _get_new_log_file(self):
-        """
-        Generates a new log file path with a timestamp.
-
-        Returns:
-            A Path object representing the new log file path.
-        """
-        return self.log_directory / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    @property
+    def log_file(self) -> Path:
+        """The log file currently being written to."""
+        return self.file_handler.log_file
 
     def _parse_log_max_size(self, log_max_size: str) -> int:
         """
@@ -103,50 +316,48 @@ class StructuredLogger(logging.Logger):
 
     def _configure_file_handler(self, log_level: str):
         """
-        Configures a file handler for writing logs to a file.
+        Configures a file handler for writing logs to a file. In async mode the
+        file handler is driven by a queue listener on a background thread.
 
         Args:
             log_level: The log level for the file handler.
         """
-        file_handler = logging.FileHandler(self.log_file, mode="a")
-        file_handler.setLevel(log_level.upper())
-        file_handler.setFormatter(JsonFormatter())
-        self.addHandler(file_handler)
-        with open(self.log_file, "w") as f:
-            f.write("[")
+        if self.log_file_format == "jsonl":
+            self.file_handler = JsonLinesFileHandler(self.log_directory, self.log_max_size, self.log_compress)  # noqa:E501
+            self.file_handler.setFormatter(JsonLinesFormatter())
+        else:
+            self.file_handler = JsonFileHandler(self.log_directory, self.log_max_size, self.log_compress)  # noqa:E501
+            self.file_handler.setFormatter(JsonFormatter(compact=self.log_async))
+        self.file_handler.setLevel(log_level.upper())
+        if self.log_async:
+            log_queue = queue.SimpleQueue()
+            self.addHandler(DeferredQueueHandler(log_queue))
+            self.listener = logging.handlers.QueueListener(
+                log_queue, self.file_handler, respect_handler_level=True
+            )
+            self.listener.start()
+        else:
+            self.addHandler(self.file_handler)
 
     def _rotate_log_file(self):
         """
-        Rotates the log file when it reaches or exceeds the size limit.
+        Rotates the log file, finalizing the current one.
         """
-        self.close()  # Close the current log file
-        self.log_file = self._get_new_log_file()  # Get a new log file name
-        self._configure_file_handler(self.level)  # Reconfigure the file handler
-
-    def handle(self, record):
-        """
-        Handles a log record, rotating the log file if necessary.
-
-        Args:
-            record: The log record to handle.
-        """
-        if os.path.getsize(self.log_file) >= self.log_max_size:
-            self._rotate_log_file()
-        super().handle(record)
+        self.file_handler.acquire()
+        try:
+            self.file_handler.rotate()
+        finally:
+            self.file_handler.release()
 
     def close(self):
         """
         Closes the logger and its handlers, properly finalizing the log file.
+        Queued records are written out before the file is closed.
         """
-        with open(self.log_file, "rb+") as f:
-            f.seek(0, 2)  # Move the cursor to the end of the file
-            size = f.tell()
-            if size >= 2:
-                f.seek(-2, 2)  # Move the cursor to final curly bracket
-                f.truncate()  # Remove the last comma and newline
-                f.write(b"]")  # Write the closing bracket
-            else:
-                f.write(b"]")  # if file is empty, close array in-place
-        for handler in self.handlers:
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+        for handler in list(self.handlers):
             handler.close()
             self.removeHandler(handler)
+        self.file_handler.close()
@@ -0,0 +1,128 @@
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from .validator import (
+    ConfigError,
+    DockerConfig,
+    PreflightConfig,
+    check_network_connectivity,
+    check_disk_space,
+    check_cpu_usage,
+    check_memory_usage,
+)
+
+CACHE_FILE_NAME = ".preflight_cache.json"
+
+
+def build_checks(cfg: Dict) -> Dict[str, Callable[[], object]]:
+    """
+    Builds the environment checks for a loaded configuration.
+
+    Args:
+        cfg (Dict): The configuration returned by load_config.
+
+    Returns:
+        Dict[str, Callable[[], object]]: Checks keyed by name; each raises on failure.
+    """  # noqa:E501
+    preflight: PreflightConfig = cfg["preflight"]
+    return {
+        "docker": lambda: DockerConfig.validate_docker_environment(cfg["docker"].container_image),  # noqa:E501
+        "network": lambda: check_network_connectivity(preflight.network_url),
+        "disk": lambda: check_disk_space(preflight.min_disk_space),
+        "cpu": lambda: check_cpu_usage(preflight.cpu_threshold),
+        "memory": lambda: check_memory_usage(preflight.memory_threshold),
+    }
+
+
+def _cache_key(cfg: Dict) -> str:
+    """Hashes the settings the checks depend on, so a changed config is rechecked."""  # noqa:E501
+    settings = {
+        "image": cfg["docker"].container_image,
+        "preflight": cfg["preflight"].model_dump(exclude={"timeout", "cache_ttl"}),  # noqa:E501
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()  # noqa:E501
+
+
+def _read_cache(cache_file: Path, key: str, ttl: float) -> bool:
+    try:
+        cached = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return False
+    passed_at = cached.get(key)
+    return isinstance(passed_at, (int, float)) and time.time() - passed_at < ttl
+
+
+def _write_cache(cache_file: Path, key: str) -> None:
+    try:
+        cached = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        cached = {}
+    cached[key] = time.time()
+    try:
+        cache_file.write_text(json.dumps(cached))
+    except OSError:
+        pass  # caching is best effort
+
+
+def run_checks(checks: Dict[str, Callable[[], object]], timeout: float) -> Dict[str, Optional[str]]:  # noqa:E501
+    """
+    Runs checks in parallel, each bounded by the timeout.
+
+    Args:
+        checks (Dict[str, Callable[[], object]]): Checks keyed by name.
+        timeout (float): Time (in seconds) each check may take.
+
+    Returns:
+        Dict[str, Optional[str]]: None for passed checks, else the failure reason.
+    """  # noqa:E501
+    results: Dict[str, Optional[str]] = {}
+    executor = ThreadPoolExecutor(max_workers=max(len(checks), 1), thread_name_prefix="preflight")  # noqa:E501
+    try:
+        futures = {name: executor.submit(check) for name, check in checks.items()}  # noqa:E501
+        # All checks start together, so one shared deadline bounds each of them
+        wait(futures.values(), timeout=timeout)
+        for name, future in futures.items():
+            if not future.done():
+                results[name] = f"timed out after {timeout}s"
+            elif future.exception() is not None:
+                results[name] = str(future.exception())
+            else:
+                results[name] = None
+    finally:
+        # Hung checks are abandoned rather than joined
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def run_preflight(cfg: Dict, cache_file: Optional[Path] = None) -> bool:
+    """
+    Verifies the environment (Docker image, network, disk, CPU and memory)
+    before a run. A passing result is cached for the configured TTL.
+
+    Args:
+        cfg (Dict): The configuration returned by load_config.
+        cache_file (Optional[Path]): Cache location, defaults to the log directory.
+
+    Returns:
+        bool: True if the checks ran, False if a cached result was used.
+
+    Raises:
+        ConfigError: If any check fails or times out.
+    """  # noqa:E501
+    preflight: PreflightConfig = cfg["preflight"]
+    cache_file = cache_file or cfg["logging"].log_directory / CACHE_FILE_NAME
+    key = _cache_key(cfg)
+    if preflight.cache_ttl and _read_cache(cache_file, key, preflight.cache_ttl):
+        return False
+    results = run_checks(build_checks(cfg), preflight.timeout)
+    failures = {name: reason for name, reason in results.items() if reason is not None}  # noqa:E501
+    if failures:
+        details = "; ".join(f"{name}: {reason}" for name, reason in failures.items())  # noqa:E501
+        raise ConfigError(f"Preflight checks failed: {details}")
+    if preflight.cache_ttl:
+        _write_cache(cache_file, key)
+    return True
@@ -0,0 +1,183 @@
+import time
+import random
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Iterable, Optional, Tuple, Type, TypeVar
+
+from scraper.telemetry import metrics
+
+from . import deadline
+
+T = TypeVar("T")
+
+ExceptionTypes = Tuple[Type[BaseException], ...]
+
+
+class RetryBudget:
+    """
+    Caps retries at a share of recent calls, so a failing dependency gets a
+    bounded amount of extra load instead of a retry storm.
+
+    Attributes:
+        ratio (float): Retries allowed per call within the window.
+        min_retries (int): Retries always allowed within the window, so rare failures can retry.
+        window (float): Sliding window (in seconds) calls and retries are counted over.
+    """  # noqa:E501
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 60) -> None:  # noqa:E501
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._calls: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._calls, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_call(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._calls.append(now)
+
+    def try_spend(self) -> bool:
+        """Takes a retry from the budget, returning False if it is exhausted."""
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._calls):  # noqa:E501
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """
+    Retries callables with capped exponential backoff and full jitter,
+    classifying errors as retryable or not by type.
+
+    Each call site passes the exception types it considers transient; the
+    policy adds the configured names to retry on and to give up on. The
+    whole chain of causes is checked, so wrapped errors are classified by
+    what caused them.
+
+    Attributes:
+        attempts (int): Maximum attempts per call, including the first.
+        initial_delay (float): Delay (in seconds) before the first retry.
+        max_delay (float): Upper bound (in seconds) of a single delay.
+        multiplier (float): Growth factor of the delay per retry.
+        jitter (bool): If True, each delay is drawn uniformly from zero to the backoff.
+        retry_on (Tuple[str, ...]): Extra exception names to retry on.
+        give_up_on (Tuple[str, ...]): Exception names that are never retried.
+        budget (Optional[RetryBudget]): Budget shared by every call of the policy.
+    """  # noqa:E501
+
+    def __init__(self, attempts: int = 3, initial_delay: float = 0.5, max_delay: float = 10,  # noqa:E501
+                 multiplier: float = 2, jitter: bool = True, retry_on: Iterable[str] = (),  # noqa:E501
+                 give_up_on: Iterable[str] = (), budget: Optional[RetryBudget] = None) -> None:  # noqa:E501
+        self.attempts = attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_on = tuple(retry_on)
+        self.give_up_on = tuple(give_up_on)
+        self.budget = budget
+
+    @classmethod
+    def from_config(cls, cfg) -> "RetryPolicy":
+        """Builds a policy, with its own budget, from a RetryConfig."""
+        budget = RetryBudget(cfg.budget_ratio, cfg.budget_min_retries, cfg.budget_window)  # noqa:E501
+        return cls(cfg.attempts, cfg.initial_delay, cfg.max_delay, cfg.multiplier, cfg.jitter,  # noqa:E501
+                   cfg.retry_on, cfg.give_up_on, budget)
+
+    def backoff(self, retry: int) -> float:
+        """Returns the delay (in seconds) before the given retry (1 for the first)."""  # noqa:E501
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** (retry - 1))  # noqa:E501
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def is_retryable(self, error: BaseException, retry_on: ExceptionTypes = (Exception,)) -> bool:  # noqa:E501
+        chain = []
+        while error is not None and error not in chain:
+            chain.append(error)
+            error = error.__cause__
+        names = {cls.__name__ for error in chain for cls in type(error).__mro__}
+        if names.intersection(self.give_up_on):
+            return False
+        return bool(names.intersection(self.retry_on)) or any(isinstance(error, retry_on) for error in chain)  # noqa:E501
+
+    def call(self, fn: Callable[[], T], operation: str, retry_on: ExceptionTypes = (Exception,),  # noqa:E501
+             on_retry: Optional[Callable[[BaseException, int, float], None]] = None,
+             backoff: bool = True) -> T:
+        """
+        Calls fn until it succeeds, fails with a non-retryable error, runs
+        out of attempts or the budget runs out; the last error is raised.
+        Within a deadline scope, a retry that would start after the
+        deadline is not attempted.
+
+        Args:
+            fn: The callable to run.
+            operation: Name of the operation, used as the metrics label.
+            retry_on: Exception types the call site considers transient.
+            on_retry: Called with the error, the failed attempt number and the delay before retrying.
+            backoff: If False, retries immediately, e.g. after switching to another proxy.
+
+        Returns:
+            The result of fn.
+        """  # noqa:E501
+        if self.budget:
+            self.budget.record_call()
+        attempt = 1
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                if attempt >= self.attempts or not self.is_retryable(e, retry_on):  # noqa:E501
+                    if attempt > 1:
+                        metrics.record_retry(operation, "exhausted")
+                    raise
+                if self.budget and not self.budget.try_spend():
+                    metrics.record_retry(operation, "budget_exhausted")
+                    raise
+                delay = self.backoff(attempt) if backoff else 0
+                current = deadline.current()
+                if current is not None and current.remaining() <= delay:
+                    metrics.record_retry(operation, "deadline_exceeded")
+                    raise
+                metrics.record_retry(operation, "retried")
+                if on_retry:
+                    on_retry(e, attempt, delay)
+                if delay > 0:
+                    time.sleep(delay)
+                attempt += 1
+
+
+DEFAULT_POLICY = RetryPolicy(budget=RetryBudget())
+
+_policy: contextvars.ContextVar[Optional[RetryPolicy]] = contextvars.ContextVar("retry_policy", default=None)  # noqa:E501
+
+
+def current_policy() -> RetryPolicy:
+    """Returns the policy set by the enclosing scope, or the default policy."""
+    return _policy.get() or DEFAULT_POLICY
+
+
+@contextmanager
+def scope(policy: RetryPolicy):
+    """
+    Sets the retry policy used within the block, e.g. a target's policy.
+
+    Args:
+        policy (RetryPolicy): The policy.
+    """
+    token = _policy.set(policy)
+    try:
+        yield
+    finally:
+        _policy.reset(token)
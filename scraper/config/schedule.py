@@ -0,0 +1,123 @@
+import re
+from datetime import datetime, timedelta
+from typing import FrozenSet, Union
+
+INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# (minimum, maximum) of each cron field: minute, hour, day of month, month, day of week  # noqa:E501
+CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+
+class IntervalSchedule:
+    """
+    Runs at a fixed interval.
+
+    Attributes:
+        seconds (float): Time (in seconds) between runs.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        if seconds <= 0:
+            raise ValueError("Schedule interval must be positive")
+        self.seconds = seconds
+
+    def next_run(self, after: datetime) -> datetime:
+        return after + timedelta(seconds=self.seconds)
+
+    def __repr__(self) -> str:
+        return f"IntervalSchedule({self.seconds}s)"
+
+
+class CronSchedule:
+    """
+    Runs at the times matched by a five field cron expression
+    (minute hour day-of-month month day-of-week). Fields accept '*', values,
+    ranges ('1-5'), lists ('1,15') and steps ('*/15'). Day of week 0 and 7
+    are Sunday.
+
+    Attributes:
+        expression (str): The cron expression.
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression '{expression}' must have 5 fields")
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            _parse_cron_field(field, *bounds, weekday=index == 4)
+            for index, (field, bounds) in enumerate(zip(fields, CRON_FIELDS))
+        )
+        # Standard cron: if both day fields are restricted either may match
+        self.any_day = fields[2] == "*" or fields[4] == "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        return day and weekday if self.any_day else day or weekday
+
+    def next_run(self, after: datetime) -> datetime:
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 4)
+        while moment < limit:
+            if moment.month not in self.months:
+                month_start = moment.replace(day=1, hour=0, minute=0)
+                moment = (month_start + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+        raise ValueError(f"Cron expression '{self.expression}' never matches")
+
+    def __repr__(self) -> str:
+        return f"CronSchedule('{self.expression}')"
+
+
+Schedule = Union[IntervalSchedule, CronSchedule]
+
+
+def _parse_cron_field(field: str, minimum: int, maximum: int, weekday: bool = False) -> FrozenSet[int]:  # noqa:E501
+    values = set()
+    for part in field.split(","):
+        match = re.fullmatch(r"(\*|\d+(?:-\d+)?)(?:/(\d+))?", part)
+        if not match:
+            raise ValueError(f"Invalid cron field '{field}'")
+        span, step = match.group(1), int(match.group(2) or 1)
+        if span == "*":
+            start, end = minimum, maximum
+        elif "-" in span:
+            start, end = map(int, span.split("-"))
+        else:
+            start = end = int(span)
+            if match.group(2):
+                end = maximum
+        upper = 7 if weekday else maximum
+        if not (minimum <= start <= end <= upper) or step < 1:
+            raise ValueError(f"Invalid cron field '{field}'")
+        values.update(value % 7 if weekday else value for value in range(start, end + 1, step))  # noqa:E501
+    return frozenset(values)
+
+
+def parse_schedule(spec: str) -> Schedule:
+    """
+    Parses a schedule, either an interval such as '90s', '15m', '1h' or '1d'
+    (a bare number is seconds) or a five field cron expression.
+
+    Args:
+        spec (str): The schedule specification.
+
+    Returns:
+        Schedule: The parsed schedule.
+
+    Raises:
+        ValueError: If the specification is invalid.
+    """
+    spec = spec.strip()
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([smhd]?)", spec.lower())
+    if match:
+        return IntervalSchedule(float(match.group(1)) * INTERVAL_UNITS[match.group(2) or "s"])  # noqa:E501
+    return CronSchedule(spec)
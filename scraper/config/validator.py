@@ -2,19 +2,18 @@ import re
 import yaml
 import json
 import toml
-import docker
 import shutil
-import psutil
-import requests
+import ipaddress
 
 from pathlib import Path
-from typing import Dict, List, Optional
-from requests.exceptions import ConnectionError
-from docker.errors import APIError, ImageNotFound
+from typing import Annotated, Dict, List, Optional
+from selenium.webdriver.common.by import By
 from pydantic import (
-    BaseModel, ConfigDict, ValidationError, field_validator, Field,
+    BaseModel, ConfigDict, StringConstraints, ValidationError, field_validator, model_validator, Field,  # noqa:E501
 )
 
+from .schedule import parse_schedule
+
 opts = ConfigDict(
     extra="forbid",
     validate_assignment=True,
@@ -35,6 +34,10 @@ class LoggingConfig(BaseModel):
     log_level: str
     log_format: str
     log_max_size: str = Field(..., pattern=r"^\d+[KMGBkmgb][Bb]?$")
+    log_async: bool = False
+    log_file_format: str = Field(default="json", pattern=r"^(json|jsonl)$")
+    log_compress: bool = False
+    log_profile: bool = False
 
     @field_validator("log_level")
     @classmethod
@@ -71,6 +74,9 @@ class DockerConfig(BaseModel):
     environment: Optional[Dict[str, str]] = None
     network_mode: str = "bridge"
     resource_limits: Optional[Dict[str, str]] = None
+    monitor_interval: Optional[float] = Field(default=None, gt=0)
+    monitor_failures: int = Field(default=3, gt=0)
+    monitor_timeout: float = Field(default=5, gt=0)
 
     @field_validator("ports")
     @classmethod
@@ -84,6 +90,8 @@ class DockerConfig(BaseModel):
 
     @classmethod
     def validate_docker_environment(cls, container_image: str):
+        import docker
+        from docker.errors import APIError, ImageNotFound
         client = docker.from_env()
         try:
             if not client.ping():
@@ -149,6 +157,18 @@ class ProxyConfig(BaseModel):
     validation: bool = True
     proxy_type: str = Field(..., pattern=r"^(HTTP|HTTPS|SOCKS4|SOCKS5)$")
     authentication: Optional[Dict[str, str]] = None
+    validation_timeout: float = Field(default=5, gt=0)
+    validation_concurrency: int = Field(default=1000, gt=0)
+    validation_host_limit: int = Field(default=10, gt=0)
+    validation_deadline: Optional[float] = Field(default=None, gt=0)
+    min_validated: int = Field(default=1, gt=0)
+    health_db: Optional[Path] = None
+    revalidate_after: float = Field(default=3600, gt=0)
+    maintenance_interval: Optional[float] = Field(default=None, gt=0)
+    recheck_interval: float = Field(default=300, gt=0)
+    min_spares: int = Field(default=0, ge=0)
+    usage_window: Optional[float] = Field(default=None, gt=0)
+    cooldown: float = Field(default=600, gt=0)
 
     @field_validator("input_file")
     @classmethod
@@ -183,6 +203,12 @@ class DriverConfig(BaseModel):
     proxy: bool = True
     retry_attempts: int = Field(default=3, gt=0)
     retry_interval: int = Field(default=0.5, gt=0)
+    retry_max_interval: float = Field(default=10, gt=0)
+    page_load_timeout: Optional[float] = Field(default=None, gt=0)
+    recycle_pages: Optional[int] = Field(default=None, gt=0)
+    recycle_age: Optional[float] = Field(default=None, gt=0)
+    recycle_memory: Optional[str] = Field(default=None, pattern=r"^\d+[KMGBkmgb][Bb]?$")
+    recycle_memory_interval: float = Field(default=30, gt=0)
     user_agent: Optional[str] = None
 
     @field_validator("host_network")
@@ -193,12 +219,157 @@ class DriverConfig(BaseModel):
         return v
 
 
+class MetricsConfig(BaseModel):
+    """
+    Pydantic model for metrics configuration.
+    """
+
+    model_config = opts
+
+    host: str = "127.0.0.1"
+    port: Optional[int] = Field(default=None, ge=0, le=65535)
+    textfile: Optional[Path] = None
+    textfile_interval: float = Field(default=15, gt=0)
+    proxy_labels: bool = True
+
+
+class PreflightConfig(BaseModel):
+    """
+    Pydantic model for preflight check configuration.
+    """
+
+    model_config = opts
+
+    timeout: float = Field(default=10, gt=0)
+    cache_ttl: float = Field(default=300, ge=0)
+    network_url: str = "https://www.google.com"
+    min_disk_space: int = Field(default=1024**3, ge=0)
+    cpu_threshold: float = Field(default=0.9, gt=0, le=1)
+    memory_threshold: float = Field(default=0.9, gt=0, le=1)
+
+
+class DaemonConfig(BaseModel):
+    """
+    Pydantic model for daemon mode configuration.
+    """
+
+    model_config = opts
+
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = Field(default=8765, ge=0, le=65535)
+    default_schedule: Optional[str] = None
+    poll_interval: float = Field(default=1, gt=0)
+    # Kept as written, unlike other strings, as the token is compared exactly
+    token: Optional[Annotated[str, StringConstraints(to_lower=False)]] = None
+
+    @field_validator("default_schedule")
+    @classmethod
+    def check_schedule(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            parse_schedule(v)
+        return v
+
+    @model_validator(mode="after")
+    def check_control_access(self) -> "DaemonConfig":
+        # The control server can run and stop targets, only local clients may use it unauthenticated  # noqa:E501
+        if self.token is None and not is_loopback(self.host):
+            raise ValueError(f"Daemon control server on '{self.host}' requires a token, set one or bind to a loopback address")  # noqa:E501
+        return self
+
+
+class TracingConfig(BaseModel):
+    """
+    Pydantic model for tracing configuration.
+    """
+
+    model_config = opts
+
+    output_file: Optional[Path] = None
+
+
+class OCRConfig(BaseModel):
+    """
+    Pydantic model for OCR configuration.
+    """
+
+    model_config = opts
+
+    workers: Optional[int] = Field(default=None, gt=0)
+    cache: bool = True
+    cache_size: int = Field(default=1024, ge=0)
+    cache_directory: Optional[Path] = Path("files/cache/ocr")
+    cache_max_files: Optional[int] = Field(default=100000, gt=0)
+    cache_max_age: Optional[float] = Field(default=None, gt=0)
+
+
+class SessionConfig(BaseModel):
+    """
+    Pydantic model for session snapshot configuration. Snapshots hold the
+    cookies left by startup actions, including login cookies, and are only
+    written to 'directory' once enabled.
+    """
+
+    model_config = opts
+
+    enabled: bool = False
+    directory: Optional[Path] = Path("files/cache/sessions")
+    max_age: float = Field(default=3600, gt=0)
+
+
 # allow empty string for TargetConfig
 target_opts = ConfigDict(
     extra="forbid",
     validate_assignment=True,
 )
 
+# Normalised locator type names mapped to Selenium By-types
+LOCATOR_TYPES = {
+    "CLASS_NAME": By.CLASS_NAME,
+    "CSS_SELECTOR": By.CSS_SELECTOR,
+    "ID": By.ID,
+    "NAME": By.NAME,
+    "LINK_TEXT": By.LINK_TEXT,
+    "PARTIAL_LINK_TEXT": By.PARTIAL_LINK_TEXT,
+    "TAG_NAME": By.TAG_NAME,
+    "XPATH": By.XPATH,
+}
+
+
+def compile_locator_type(v: Optional[str]) -> Optional[str]:
+    """Resolves a locator type such as 'CSS_SELECTOR' to its Selenium By-type."""  # noqa:E501
+    if v is None:
+        return None
+    by_type = LOCATOR_TYPES.get(v.strip().replace(" ", "_").upper())
+    if by_type is None:
+        raise ValueError(f"Unsupported locator type: {v}. Valid types are {list(LOCATOR_TYPES)}")  # noqa:E501
+    return by_type
+
+
+def is_loopback(host: str) -> bool:
+    """Returns True if the host only accepts connections from this machine."""  # noqa:E501
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class ImagePreprocessing(BaseModel):
+    model_config = target_opts
+    scale: int = Field(default=3, ge=1)
+    median_size: int = Field(default=3, ge=1)
+    threshold: int = Field(default=230, ge=0, le=255)
+    fast: bool = False
+
+    @field_validator("median_size")
+    @classmethod
+    def check_median_size(cls, v: int) -> int:
+        if v % 2 == 0:
+            raise ValueError(f"Invalid median size: {v}. It must be odd")
+        return v
+
 
 class Extraction(BaseModel):
     model_config = target_opts
@@ -210,9 +381,16 @@ class Extraction(BaseModel):
     pagination_locator: Optional[str] = None
     pagination_locator_type: Optional[str] = None
     exclude_tags: Optional[Dict[str, List[str]]] = None
+    image_source: str = Field(default="screenshot", pattern=r"^(screenshot|src)$")  # noqa:E501
+    preprocessing: ImagePreprocessing = ImagePreprocessing()
     output_type: str
     output_file: Path
 
+    @field_validator("locator_type", "pagination_locator_type")
+    @classmethod
+    def check_locator_type(cls, v: Optional[str]) -> Optional[str]:
+        return compile_locator_type(v)
+
     @field_validator("output_type")
     @classmethod
     def check_output_type(cls, v: str) -> Optional[str]:
@@ -225,6 +403,28 @@ class Extraction(BaseModel):
         return None
 
 
+class RetryConfig(BaseModel):
+    model_config = target_opts
+    attempts: int = Field(default=3, gt=0)
+    initial_delay: float = Field(default=0.5, ge=0)
+    max_delay: float = Field(default=10, ge=0)
+    multiplier: float = Field(default=2, ge=1)
+    jitter: bool = True
+    budget_ratio: float = Field(default=0.2, ge=0)
+    budget_min_retries: int = Field(default=10, ge=0)
+    budget_window: float = Field(default=60, gt=0)
+    retry_on: List[str] = []
+    give_up_on: List[str] = []
+
+
+class LinkRetryConfig(BaseModel):
+    model_config = target_opts
+    max_attempts: int = Field(default=3, gt=0)
+    delay: float = Field(default=5, ge=0)
+    interleave: bool = False
+    dead_letter_file: Optional[Path] = None
+
+
 class Interaction(BaseModel):
     model_config = target_opts
     type: str
@@ -233,6 +433,11 @@ class Interaction(BaseModel):
     wait_interval: float = 0.5
     option_text: Optional[str] = None
 
+    @field_validator("locator_type")
+    @classmethod
+    def check_locator_type(cls, v: str) -> str:
+        return compile_locator_type(v)
+
 
 class Startup(BaseModel):
     model_config = target_opts
@@ -247,7 +452,20 @@ class TargetConfig(BaseModel):
     supplemental_input_data: Optional[bool] = None
     startup: Optional[Startup] = None
     interactions: Optional[List[Interaction]] = None
+    batch_interactions: bool = False
+    retry: RetryConfig = RetryConfig()
+    link_retry: LinkRetryConfig = LinkRetryConfig()
+    link_timeout: Optional[float] = Field(default=None, gt=0)
+    link_abort_grace: float = Field(default=10, gt=0)
     extractions: Optional[List[Extraction]] = None
+    schedule: Optional[str] = None
+
+    @field_validator("schedule")
+    @classmethod
+    def check_schedule(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            parse_schedule(v)
+        return v
 
 
 class ConfigError(Exception):
@@ -255,6 +473,8 @@ class ConfigError(Exception):
 
 
 def check_network_connectivity(test_url: str) -> bool:
+    import requests
+    from requests.exceptions import ConnectionError
     try:
         response = requests.get(test_url, timeout=5)
         if response.status_code != 200:
@@ -281,6 +501,7 @@ def check_disk_space(required_space: int | float, path: str = "/") -> bool:
 
 
 def check_cpu_usage(threshold: float = 0.9) -> bool:
+    import psutil
     current_usage = psutil.cpu_percent() / 100
     if current_usage > threshold:
         raise ValueError(
@@ -290,6 +511,7 @@ def check_cpu_usage(threshold: float = 0.9) -> bool:
 
 
 def check_memory_usage(threshold: float = 0.9) -> bool:
+    import psutil
     memory = psutil.virtual_memory()
     current_usage = 1 - (memory.available / memory.total)
     if current_usage > threshold:
@@ -302,7 +524,8 @@ def check_memory_usage(threshold: float = 0.9) -> bool:
 def load_config(filename: Path) -> Dict:
     """
     Loads and validates the configuration from a file.
-    The file can be in YAML, JSON, or TOML format.
+    The file can be in YAML, JSON, or TOML format. Environment checks
+    are run separately, see scraper.config.preflight.
     """
     try:
         with open(filename, "r") as file:
@@ -325,20 +548,17 @@ def load_config(filename: Path) -> Dict:
             "logging": LoggingConfig(**config_data.get("Logging", {})),
             "proxy": ProxyConfig(**config_data.get("Proxy", {})),
             "driver": DriverConfig(**config_data.get("Driver", {})),
+            "metrics": MetricsConfig(**config_data.get("Metrics", {})),
+            "tracing": TracingConfig(**config_data.get("Tracing", {})),
+            "preflight": PreflightConfig(**config_data.get("Preflight", {})),
+            "daemon": DaemonConfig(**config_data.get("Daemon", {})),
+            "ocr": OCRConfig(**config_data.get("OCR", {})),
+            "session": SessionConfig(**config_data.get("Session", {})),
             "target": [
                 TargetConfig(**target_config)
                 for target_config in config_data.get("Target", [])
             ],
         }
-        DockerConfig.validate_docker_environment(config["docker"].container_image)
-        if not check_network_connectivity("https://www.google.com"):
-            raise ValueError("Network connectivity issue detected")
-        if not check_disk_space(1 * 1024 * 1024 * 1024):
-            raise ValueError("Insufficient disk space")
-        if not check_cpu_usage():
-            raise ValueError("CPU usage is too high")
-        if not check_memory_usage():
-            raise ValueError("Memory usage is too high")
         return config
     except ValidationError as e:
         raise ConfigError(f"Failed to validate config: {e}")
@@ -0,0 +1,267 @@
+import hmac
+import json
+import signal
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scraper.config.logging import StructuredLogger
+from scraper.config.schedule import Schedule, parse_schedule
+from scraper.config.validator import DaemonConfig, OCRConfig, TargetConfig
+from scraper.web.controller import WebController
+
+from .target import TargetManager
+
+
+class ScheduledTarget:
+    """
+    Scheduling state of a single target.
+
+    Attributes:
+        target (TargetConfig): The target configuration.
+        schedule (Optional[Schedule]): When the target runs; None runs it on demand only.
+        next_run (Optional[datetime]): When the target is next due.
+        last_run (Optional[datetime]): When the last run started.
+        last_duration (Optional[float]): Duration (in seconds) of the last run.
+        last_error (Optional[str]): Error of the last run, if it failed.
+        runs (int): Number of completed runs.
+        running (bool): True while a run is in progress.
+    """  # noqa:E501
+
+    def __init__(self, target: TargetConfig, schedule: Optional[Schedule], now: datetime) -> None:  # noqa:E501
+        self.target = target
+        self.schedule = schedule
+        self.next_run = now if schedule else None
+        self.last_run: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.runs = 0
+        self.running = False
+
+    def status(self) -> Dict:
+        def isoformat(moment: Optional[datetime]) -> Optional[str]:
+            return moment.isoformat(timespec="seconds") if moment else None
+
+        return {
+            "schedule": repr(self.schedule) if self.schedule else None,
+            "next_run": isoformat(self.next_run),
+            "last_run": isoformat(self.last_run),
+            "last_duration": self.last_duration,
+            "last_error": self.last_error,
+            "runs": self.runs,
+            "running": self.running,
+        }
+
+
+class ScrapeDaemon:
+    """
+    Runs targets on their schedules while keeping the connections (proxies,
+    containers and drivers) of the controller open between runs. Each target
+    has its own connection, so due targets run concurrently, but a target is
+    never run twice at once.
+
+    Attributes:
+        logger (StructuredLogger): Logger for logging messages.
+        controller (WebController): Controller holding the warm connections.
+        cfg (DaemonConfig): Daemon configuration.
+        port (int): Port of the control server (0 picks a free port).
+        targets (Dict[str, ScheduledTarget]): Scheduling state by target name.
+    """
+
+    def __init__(self, logger: StructuredLogger, controller: WebController,
+                 targets: List[TargetConfig], cfg: DaemonConfig, ocr_cfg: Optional[OCRConfig] = None) -> None:  # noqa:E501
+        self.logger = logger
+        self.controller = controller
+        self.cfg = cfg
+        self.port = cfg.port
+        self.target_manager = TargetManager(logger, controller, ocr_cfg)
+        now = datetime.now()
+        self.targets: Dict[str, ScheduledTarget] = {}
+        for target in targets:
+            spec = target.schedule or cfg.default_schedule
+            schedule = parse_schedule(spec) if spec else None
+            self.targets[target.name] = ScheduledTarget(target, schedule, now)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._workers: List[threading.Thread] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def trigger(self, name: str) -> bool:
+        """
+        Runs a target now, unless it is already running.
+
+        Args:
+            name (str): The target name.
+
+        Returns:
+            bool: True if a run was started.
+
+        Raises:
+            KeyError: If the target is unknown.
+        """
+        with self._lock:
+            scheduled = self.targets[name]
+            if scheduled.running:
+                return False
+            scheduled.running = True
+        self._start_worker(scheduled)
+        return True
+
+    def status(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {name: scheduled.status() for name, scheduled in self.targets.items()}  # noqa:E501
+
+    def _start_worker(self, scheduled: ScheduledTarget) -> None:
+        worker = threading.Thread(target=self._run_target, args=(scheduled,), name=f"daemon-{scheduled.target.name}")  # noqa:E501
+        with self._lock:
+            self._workers = [thread for thread in self._workers if thread.is_alive()]  # noqa:E501
+            self._workers.append(worker)
+            worker.start()
+
+    def _run_target(self, scheduled: ScheduledTarget) -> None:
+        name = scheduled.target.name
+        started = datetime.now()
+        error = None
+        try:
+            self.controller.apply_restart(name)
+            self.controller.ensure_connected(name)
+            self.target_manager.scrape_target(scheduled.target)
+        except Exception as e:
+            error = str(e)
+            self.logger.error(f"Scheduled run of '{name}' failed: {e}", exc_info=True)  # noqa:E501
+        finished = datetime.now()
+        with self._lock:
+            scheduled.running = False
+            scheduled.runs += 1
+            scheduled.last_run = started
+            scheduled.last_duration = (finished - started).total_seconds()
+            scheduled.last_error = error
+            if scheduled.schedule:
+                next_run = scheduled.schedule.next_run(started)
+                # An overrunning target skips the runs it missed
+                scheduled.next_run = next_run if next_run > finished else scheduled.schedule.next_run(finished)  # noqa:E501
+        self.logger.info(f"Scheduled run of '{name}' finished in {scheduled.last_duration:.1f}s")  # noqa:E501
+        self._wake.set()
+
+    def _start_due(self, now: datetime) -> None:
+        due = []
+        with self._lock:
+            for scheduled in self.targets.values():
+                if scheduled.next_run and scheduled.next_run <= now and not scheduled.running:  # noqa:E501
+                    scheduled.running = True
+                    due.append(scheduled)
+        for scheduled in due:
+            self._start_worker(scheduled)
+
+    def _seconds_until_due(self, now: datetime) -> float:
+        with self._lock:
+            pending = [s.next_run for s in self.targets.values() if s.next_run and not s.running]  # noqa:E501
+        if not pending:
+            return self.cfg.poll_interval
+        return min(max((min(pending) - now).total_seconds(), 0), self.cfg.poll_interval)  # noqa:E501
+
+    def start_control_server(self) -> None:
+        """
+        Serves the control API on a background thread:
+        GET /status, POST /targets/<name>/run and POST /shutdown. With a
+        token configured, requests must send it as a bearer token.
+        """
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, code: int, body: Dict) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _authorized(self) -> bool:
+                if daemon.cfg.token is None:
+                    return True
+                supplied = self.headers.get("Authorization", "")
+                if hmac.compare_digest(supplied.encode(), f"Bearer {daemon.cfg.token}".encode()):  # noqa:E501
+                    return True
+                self._reply(401, {"error": "unauthorized"})
+                return False
+
+            def do_GET(self):
+                if not self._authorized():
+                    return
+                if self.path == "/status":
+                    self._reply(200, daemon.status())
+                else:
+                    self._reply(404, {"error": "not found"})
+
+            def do_POST(self):
+                if not self._authorized():
+                    return
+                parts = self.path.strip("/").split("/")
+                if parts == ["shutdown"]:
+                    self._reply(202, {"shutdown": True})
+                    daemon.stop()
+                elif len(parts) == 3 and parts[0] == "targets" and parts[2] == "run":  # noqa:E501
+                    try:
+                        self._reply(202, {"started": daemon.trigger(parts[1])})
+                    except KeyError:
+                        self._reply(404, {"error": f"unknown target '{parts[1]}'"})  # noqa:E501
+                else:
+                    self._reply(404, {"error": "not found"})
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.cfg.host, self.cfg.port), Handler)  # noqa:E501
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="daemon-control", daemon=True).start()  # noqa:E501
+        self.logger.info(f"Daemon control listening on http://{self.cfg.host}:{self.port}")  # noqa:E501
+
+    def run(self) -> None:
+        """
+        Runs the scheduler until stopped. Running targets are allowed to
+        finish before returning.
+        """
+        self.logger.info(f"Daemon started with {len(self.targets)} target(s)")
+        while not self._stop.is_set():
+            now = datetime.now()
+            self._start_due(now)
+            self._wake.wait(self._seconds_until_due(now))
+            self._wake.clear()
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            worker.join()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.logger.info("Daemon stopped")
+
+    def stop(self) -> None:
+        """Asks the scheduler to stop; safe to call from any thread."""
+        self._stop.set()
+        self._wake.set()
+
+
+def run_daemon(logger: StructuredLogger, controller: WebController, cfgs: List[TargetConfig], cfg: DaemonConfig,  # noqa:E501
+               ocr_cfg: Optional[OCRConfig] = None):
+    daemon = ScrapeDaemon(logger, controller, cfgs, cfg, ocr_cfg)
+    previous = {sig: signal.signal(sig, lambda *_: daemon.stop()) for sig in (signal.SIGINT, signal.SIGTERM)}  # noqa:E501
+    try:
+        controller.connect()
+        daemon.start_control_server()
+        daemon.run()
+    except Exception as e:
+        logger.critical(f"Daemon failed: {e}", exc_info=True)
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        daemon.target_manager.close()
+        try:
+            controller.disconnect()
+        except Exception as e:
+            logger.critical(f"Scraper failed to disconnect: {e}", exc_info=True)
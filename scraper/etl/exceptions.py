@@ -10,6 +10,10 @@ class ClickException(Exception):
     pass
 
 
+class BatchInteractionException(Exception):
+    pass
+
+
 class ParseElementException(Exception):
     pass
 
@@ -1,39 +1,63 @@
 import time
-from typing import List
+from typing import List, Optional, Tuple
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from scraper.config import deadline
 from scraper.config.validator import Extraction
 from scraper.config.logging import StructuredLogger
+from scraper.telemetry import metrics, tracing
 
-from .helper import get_element, get_elements, parse_element, parse_table, paginate
+from .helper import get_element, get_elements, get_element_image, parse_element, parse_table, paginate  # noqa:E501
+from . import link_queue
+from .ocr import OCREngine, recognize
+from .ocr_cache import OCRCache
+from .preprocessing import Preprocessor
 from .exceptions import (
     ElementNotFoundException,
+    OCRException,
     ParseElementException,
     ParseTableException
 )
 
 
 class ExtractionManager:
-    def __init__(self, logger: StructuredLogger, driver: WebDriver):
+    def __init__(self, logger: StructuredLogger, driver: WebDriver, ocr_engine: Optional[OCREngine] = None,  # noqa:E501
+                 ocr_cache: Optional[OCRCache] = None):
         self.logger = logger
         self.driver = driver
+        self.ocr_engine = ocr_engine
+        self.ocr_cache = ocr_cache
+        # (reason code, message) of each extraction that failed in the last execute  # noqa:E501
+        self.failures: List[Tuple[str, str]] = []
 
     def execute(self, name: str, extractions: List[Extraction]) -> dict:
         extraction_results = {}
+        self.failures = []
         for extraction in extractions:
+            deadline.check()
             try:
                 if extraction.wait_interval > 0:
                     time.sleep(extraction.wait_interval)
-                if not extraction.pagination_locator:
-                    data = self._perform_extraction(extraction)
-                else:
-                    data = self._perform_paginated_extraction(extraction)
+                with (
+                    tracing.span("extraction", type=extraction.type, locator=extraction.locator) as span,  # noqa:E501
+                    metrics.scope(source="extraction"),
+                    metrics.track("extraction"),
+                ):
+                    if not extraction.pagination_locator:
+                        data = self._perform_extraction(extraction)
+                    else:
+                        data = self._perform_paginated_extraction(extraction)
+                    if span:
+                        span.set_attribute("rows", len(data))
                 if extraction.output_file:
                     extraction_results[str(extraction.output_file)] = {
                         "data": self._clean_data(data),
                         "output_type": extraction.output_type
                     }
+            except deadline.DeadlineExceeded:
+                raise
             except Exception as e:
+                self.failures.append((link_queue.EXTRACTION, f"{extraction.type}: {e}"))  # noqa:E501
                 self.logger.error(f"Failed to extract '{extraction.type}' for '{name}': {e}", exc_info=True)  # noqa:E501
         return extraction_results
 
@@ -53,24 +77,28 @@ class ExtractionManager:
                 case "source":
                     return [str(self.driver.page_source)]
                 case "img" | "image":
-                    pass  # with_ocr == True
+                    return self._extract_images(extraction)
                 case _:
                     self.logger.error(f"Undefined extraction '{extraction.type}'")
             return []
         except ElementNotFoundException as e:
             self.logger.error(f"Element not found during extraction '{extraction.type}': {e}", exc_info=True)  # noqa:E501
+            self.failures.append((link_queue.ELEMENT_NOT_FOUND, f"{extraction.type}: {e}"))  # noqa:E501
             return []
         except ParseElementException as e:
             self.logger.error(f"Failed to parse element during extraction '{extraction.type}': {e}", exc_info=True)  # noqa:E501
+            self.failures.append((link_queue.PARSE, f"{extraction.type}: {e}"))
             return []
         except ParseTableException as e:
             self.logger.error(f"Failed to parse table during extraction '{extraction.type}': {e}", exc_info=True)  # noqa:E501
+            self.failures.append((link_queue.PARSE, f"{extraction.type}: {e}"))
             return []
 
     def _perform_paginated_extraction(self, extraction: Extraction) -> List:
         all_data = []
         page_count = 0
         while True:
+            deadline.check()
             try:
                 match extraction.type:
                     case "element":
@@ -86,7 +114,7 @@ class ExtractionManager:
                     case "source":
                         page_data = [str(self.driver.page_source)]
                     case "img" | "image":
-                        pass  # with_ocr == True
+                        page_data = self._extract_images(extraction)
                     case _:
                         self.logger.error(f"Undefined extraction '{extraction.type}'")
                         page_data = []
@@ -98,14 +126,41 @@ class ExtractionManager:
                     break
             except ElementNotFoundException as e:
                 self.logger.error(f"Element not found during extraction '{extraction.type}': {e}", exc_info=True)  # noqa:E501
+                self.failures.append((link_queue.ELEMENT_NOT_FOUND, f"{extraction.type}: {e}"))  # noqa:E501
                 break
             except ParseElementException as e:
                 self.logger.error(f"Failed to parse element during extraction '{extraction.type}': {e}", exc_info=True)  # noqa:E501
+                self.failures.append((link_queue.PARSE, f"{extraction.type}: {e}"))  # noqa:E501
                 break
             except ParseTableException as e:
                 self.logger.error(f"Failed to parse table during extraction '{extraction.type}': {e}", exc_info=True)  # noqa:E501
+                self.failures.append((link_queue.PARSE, f"{extraction.type}: {e}"))  # noqa:E501
                 break
         return self._clean_data(all_data)
 
+    def _extract_images(self, extraction: Extraction) -> List[List[str]]:
+        if extraction.unique:
+            elements = [get_element(self.driver, extraction.locator, extraction.locator_type, extraction.wait_interval)]  # noqa:E501
+        else:
+            elements = get_elements(self.driver, extraction.locator, extraction.locator_type, extraction.wait_interval)  # noqa:E501
+        # Capture every image before collecting results, so OCR overlaps capture
+        images = []
+        for element in elements:
+            try:
+                images.append(get_element_image(self.driver, element, extraction.image_source))  # noqa:E501
+            except OCRException as e:
+                self.logger.error(f"Failed to capture image '{extraction.locator}': {e}")  # noqa:E501
+        # Element images are already scoped, so they are not cropped
+        preprocessor = Preprocessor(**extraction.preprocessing.model_dump())
+        futures = self.ocr_engine.submit_batch(images, preprocessor) if self.ocr_engine else None  # noqa:E501
+        data = []
+        for index, image in enumerate(images):
+            try:
+                text = futures[index].result() if futures else recognize(image, preprocessor, self.ocr_cache)  # noqa:E501
+                data.append([text])
+            except OCRException as e:
+                self.logger.error(f"Failed to read image '{extraction.locator}': {e}")  # noqa:E501
+        return data
+
     def _clean_data(self, data: List[List[str]]) -> List[List[str]]:
         return [[value.replace(",", "").replace("\t", " ").replace("\n", " ").replace("\r", "") for value in row] for row in data]  # noqa:E501
@@ -1,6 +1,7 @@
 import time
+import base64
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 from bs4 import BeautifulSoup
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
@@ -10,9 +11,15 @@ from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
     NoSuchElementException,
-    TimeoutException
+    TimeoutException,
+    WebDriverException,
 )
 
+from scraper.config import retry
+from scraper.config.validator import LOCATOR_TYPES, Interaction
+from scraper.telemetry import metrics
+from scraper.telemetry.locators import PROFILER as LOCATOR_PROFILER
+
 from .exceptions import (
     ElementNotFoundException,
     ClickException,
@@ -20,17 +27,122 @@ from .exceptions import (
     ParseElementException,
     ParseTableException,
     LocatorTypeException,
+    OCRException,
+    BatchInteractionException,
 )
 
+BY_TYPES = frozenset(LOCATOR_TYPES.values())
+
+# Errors worth retrying a page interaction for: the page may still be loading
+# or re-rendering. Anything else, like a bad locator type, fails at once.
+TRANSIENT_ERRORS = (WebDriverException, ElementNotFoundException)
+
+# Fetches an image with the page's session and returns it base64 encoded
+FETCH_IMAGE_SCRIPT = """
+const [src, done] = arguments;
+fetch(src)
+  .then(response => response.ok ? response.blob() : Promise.reject(response.status))
+  .then(blob => {
+    const reader = new FileReader();
+    reader.onload = () => done(reader.result.split(',')[1]);
+    reader.readAsDataURL(blob);
+  })
+  .catch(() => done(null));
+"""
+
+# Time (in seconds) without DOM mutations after which a batched step is settled  # noqa:E501
+BATCH_SETTLE_QUIET = 0.1
+
+# Runs interaction steps in order in the page, waiting for each element and
+# for the DOM to settle after each step, and reports a status per step
+BATCH_INTERACTION_SCRIPT = """
+const [steps, quietMs, done] = arguments;
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+const first = nodes => nodes[0] || null;
+function find(by, value) {
+  switch (by) {
+    case "css selector": return document.querySelector(value);
+    case "xpath": return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    case "id": return document.getElementById(value);
+    case "name": return first(document.getElementsByName(value));
+    case "class name": return first(document.getElementsByClassName(value));
+    case "tag name": return first(document.getElementsByTagName(value));
+    case "link text": return [...document.links].find(a => a.textContent.trim() === value) || null;
+    case "partial link text": return [...document.links].find(a => a.textContent.includes(value)) || null;
+  }
+  throw new Error("Unsupported locator type: " + by);
+}
+async function waitFor(step) {
+  const deadline = performance.now() + step.wait;
+  for (;;) {
+    const element = find(step.by, step.locator);
+    if (element || performance.now() >= deadline) return element;
+    await sleep(50);
+  }
+}
+function settle(maxMs) {
+  return new Promise(resolve => {
+    let quiet;
+    const finish = () => { observer.disconnect(); clearTimeout(quiet); clearTimeout(limit); resolve(); };
+    const observer = new MutationObserver(() => { clearTimeout(quiet); quiet = setTimeout(finish, quietMs); });
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    quiet = setTimeout(finish, quietMs);
+    const limit = setTimeout(finish, Math.max(maxMs, quietMs));
+  });
+}
+(async () => {
+  const results = [];
+  for (const step of steps) {
+    const start = performance.now();
+    let status = "ok", message = null;
+    try {
+      const element = await waitFor(step);
+      if (!element) {
+        status = "not_found";
+      } else if (step.type === "click") {
+        element.scrollIntoView({block: "center"});
+        element.click();
+      } else {
+        const option = [...element.options].find(o => o.text.trim() === step.option_text);
+        if (!option) {
+          status = "no_option";
+        } else {
+          element.value = option.value;
+          option.selected = true;
+          element.dispatchEvent(new Event("input", {bubbles: true}));
+          element.dispatchEvent(new Event("change", {bubbles: true}));
+        }
+      }
+      if (status === "ok") await settle(step.wait);
+    } catch (e) {
+      status = "error";
+      message = String(e);
+    }
+    results.push({status: status, message: message, elapsed: (performance.now() - start) / 1000});
+  }
+  return results;
+})().then(done, e => done([{status: "error", message: String(e), elapsed: 0}]));
+"""  # noqa:E501
+
 
 def get_element(driver: WebDriver, locator: str, locator_type: str, wait_interval: float) -> WebElement:  # noqa:E501
     by_type = parse_locator(locator_type)
+    start = time.perf_counter()
     try:
-        return driver.find_element(by_type, locator)
+        element = driver.find_element(by_type, locator)
     except NoSuchElementException:
-        return retry_get_element(driver, locator, locator_type, wait_interval)
+        try:
+            element = retry_get_element(driver, locator, locator_type, wait_interval)  # noqa:E501
+        except ElementNotFoundException:
+            LOCATOR_PROFILER.record(locator, locator_type, "timeout", time.perf_counter() - start)  # noqa:E501
+            raise
+        LOCATOR_PROFILER.record(locator, locator_type, "after_wait", time.perf_counter() - start)  # noqa:E501
+        return element
+    LOCATOR_PROFILER.record(locator, locator_type, "first_try", time.perf_counter() - start)  # noqa:E501
+    return element
 
 
+@metrics.track("wait")
 def retry_get_element(driver: WebDriver, locator: str, locator_type: str, wait_interval: float) -> WebElement:  # noqa:E501
     by_type = parse_locator(locator_type)
     try:
@@ -52,14 +164,23 @@ def get_elements(driver: WebDriver, locator: str, locator_type: str, wait_interv
 
 
 def click(driver: WebDriver, locator: str, locator_type: str, wait_interval: float) -> None:  # noqa:E501
-    try:
-        element = get_element(driver, locator, locator_type, wait_interval)
-        element.click()
-    except Exception:
-        # If the initial click fails, try again with explicit waits
-        retry_click(driver, locator, locator_type, wait_interval)
+    attempts = []
 
+    def attempt() -> None:
+        attempts.append(None)
+        if len(attempts) > 1:
+            # Retries wait explicitly for the element to be clickable
+            retry_click(driver, locator, locator_type, wait_interval)
+            return
+        try:
+            get_element(driver, locator, locator_type, wait_interval).click()
+        except Exception as e:
+            raise ClickException(f"Failed to click on element: {locator}") from e  # noqa:E501
 
+    retry.current_policy().call(attempt, "click", TRANSIENT_ERRORS)
+
+
+@metrics.track("wait")
 def retry_click(driver: WebDriver, locator: str, locator_type: str, wait_interval: float) -> None:  # noqa:E501
     by_type = parse_locator(locator_type)
     try:
@@ -78,11 +199,73 @@ def dropdown(driver: WebDriver, locator: str, locator_type: str, wait_interval:
         select = Select(element)
         select.select_by_visible_text(option_text)
         if wait_interval > 0:
-            time.sleep(wait_interval)  # Wait for the specified interval
+            with metrics.track("wait"):
+                time.sleep(wait_interval)  # Wait for the specified interval
     except Exception as e:
         raise DropdownSelectionException(f"Failed to select '{option_text}' from dropdown: {locator}") from e  # noqa:E501
 
 
+def batch_interact(driver: WebDriver, interactions: Sequence[Interaction], settle_quiet: float = BATCH_SETTLE_QUIET) -> List[Dict]:  # noqa:E501
+    """
+    Performs click and dropdown interactions in a single injected script,
+    instead of a round trip (and, for dropdowns, a sleep) per step. Each
+    element is waited for up to its wait_interval, and after each step the
+    DOM is given up to wait_interval to settle (no mutations for settle_quiet).
+
+    Steps run in page context, so a click that navigates away ends the batch.
+
+    Args:
+        driver (WebDriver): The driver.
+        interactions (Sequence[Interaction]): Click or dropdown interactions, in order.
+        settle_quiet (float): Time (in seconds) without DOM mutations that counts as settled.
+
+    Returns:
+        List[Dict]: Per step, the status ('ok', 'not_found', 'no_option' or 'error'), an error message and the elapsed time.
+
+    Raises:
+        BatchInteractionException: If the script fails as a whole.
+    """  # noqa:E501
+    steps = [{
+        "type": interaction.type,
+        "by": parse_locator(interaction.locator_type),
+        "locator": interaction.locator,
+        "wait": interaction.wait_interval * 1000,
+        "option_text": interaction.option_text,
+    } for interaction in interactions]
+    # Worst case per step: the element wait, the settle limit and one quiet window  # noqa:E501
+    budget = sum(2 * interaction.wait_interval + settle_quiet for interaction in interactions) + 5  # noqa:E501
+    previous = driver.timeouts.script
+    try:
+        driver.set_script_timeout(budget)
+        results = driver.execute_async_script(BATCH_INTERACTION_SCRIPT, steps, settle_quiet * 1000)  # noqa:E501
+    except Exception as e:
+        raise BatchInteractionException(f"Batched interactions failed: {e}") from e  # noqa:E501
+    finally:
+        try:
+            driver.set_script_timeout(previous)
+        except Exception:
+            pass  # the session may be gone
+    if not isinstance(results, list) or len(results) != len(steps):
+        raise BatchInteractionException(f"Batched interactions returned an unexpected result: {results}")  # noqa:E501
+    return results
+
+
+def get_element_image(driver: WebDriver, element: WebElement, source: str = "screenshot") -> bytes:  # noqa:E501
+    try:
+        if source == "src":
+            src = element.get_attribute("src")
+            data = driver.execute_async_script(FETCH_IMAGE_SCRIPT, src) if src else None  # noqa:E501
+            if not data:
+                raise OCRException(f"Failed to fetch image source: {src}")
+            return base64.b64decode(data)
+        return element.screenshot_as_png
+    except OCRException:
+        raise
+    except Exception as e:
+        raise OCRException(f"Failed to capture image element: {e}") from e
+
+
+@metrics.track("parse")
 def parse_element(element: WebElement, exclude_tags: Optional[List[str]] = None) -> List[str]:  # noqa:E501
     try:
         html = element.get_attribute('innerHTML')
@@ -97,6 +280,7 @@ def parse_element(element: WebElement, exclude_tags: Optional[List[str]] = None)
         raise ParseElementException("Failed to parse element") from e
 
 
+@metrics.track("parse")
 def parse_table(element: WebElement, exclude_tags: Optional[Dict[str, List[str]]] = None) -> List[List[str]]:  # noqa:E501
     try:
         rows_data = []
@@ -126,28 +310,17 @@ def parse_table(element: WebElement, exclude_tags: Optional[Dict[str, List[str]]
 
 
 def parse_locator(locator_type: str) -> By:
+    # Locator types from a validated config are already By-types
+    if locator_type in BY_TYPES:
+        return locator_type
     formatted_strategy = locator_type.strip().replace(" ", "_").upper()
-    match formatted_strategy:
-        case "CLASS_NAME":
-            return By.CLASS_NAME
-        case "CSS_SELECTOR":
-            return By.CSS_SELECTOR
-        case "ID":
-            return By.ID
-        case "NAME":
-            return By.NAME
-        case "LINK_TEXT":
-            return By.LINK_TEXT
-        case "PARTIAL_LINK_TEXT":
-            return By.PARTIAL_LINK_TEXT
-        case "TAG_NAME":
-            return By.TAG_NAME
-        case "XPATH":
-            return By.XPATH
-        case _:
-            raise LocatorTypeException(f"Unsupported Selenium By-type '{formatted_strategy}'")  # noqa:E501
+    try:
+        return LOCATOR_TYPES[formatted_strategy]
+    except KeyError:
+        raise LocatorTypeException(f"Unsupported Selenium By-type '{formatted_strategy}'")  # noqa:E501
 
 
+@metrics.track("pagination")
 def paginate(driver: WebDriver, locator: str, locator_type: str, wait_interval: float) -> bool:  # noqa:E501
     by_type = parse_locator(locator_type)
     try:
@@ -1,11 +1,14 @@
 from typing import List
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from scraper.config import deadline
 from scraper.config.validator import Interaction
 from scraper.config.logging import StructuredLogger
+from scraper.telemetry import metrics, tracing
 
-from .helper import click, dropdown
+from .helper import batch_interact, click, dropdown
 from .exceptions import (
+    BatchInteractionException,
     ElementNotFoundException,
     ClickException,
     DropdownSelectionException,
@@ -17,13 +20,57 @@ class InteractionManager:
         self.logger = logger
         self.driver = driver
 
-    def execute(self, name: str, interactions: List[Interaction]):
+    def execute(self, name: str, interactions: List[Interaction], batch: bool = False):  # noqa:E501
+        if batch:
+            self._execute_batch(name, interactions)
+            return
         for interaction in interactions:
+            deadline.check()
             try:
-                self._perform_interaction(interaction)
+                with (
+                    tracing.span("interaction", type=interaction.type, locator=interaction.locator),  # noqa:E501
+                    metrics.scope(source="interaction"),
+                    metrics.track("interaction"),
+                ):
+                    self._perform_interaction(interaction)
             except Exception as e:
                 self.logger.error(f"Failed to perform interaction '{interaction.type}' for '{name}': {e}", exc_info=True)  # noqa:E501
 
+    def _execute_batch(self, name: str, interactions: List[Interaction]) -> None:  # noqa:E501
+        steps = []
+        for interaction in interactions:
+            if interaction.type not in ("click", "dropdown"):
+                self.logger.error(f"Undefined interaction '{interaction.type}'")
+            elif interaction.type == "dropdown" and interaction.option_text is None:  # noqa:E501
+                self.logger.error(f"Failed to perform interaction '{interaction.type}' for '{name}': option_text is required for dropdown interactions")  # noqa:E501
+            else:
+                steps.append(interaction)
+        if not steps:
+            return
+        try:
+            with (
+                tracing.span("interaction_batch", steps=len(steps)) as span,
+                metrics.scope(source="interaction"),
+                metrics.track("interaction"),
+            ):
+                results = batch_interact(self.driver, steps)
+                failed = [result for result in results if result["status"] != "ok"]  # noqa:E501
+                if span:
+                    span.set_attribute("failed", len(failed))
+        except BatchInteractionException as e:
+            self.logger.error(f"Failed to perform batched interactions for '{name}': {e}", exc_info=True)  # noqa:E501
+            return
+        for interaction, result in zip(steps, results):
+            match result["status"]:
+                case "ok":
+                    self.logger.info(f"Batched '{interaction.type}' on element: {interaction.locator} ({result['elapsed']:.3f}s)")  # noqa:E501
+                case "not_found":
+                    self.logger.error(f"Element not found during interaction '{interaction.type}': {interaction.locator}")  # noqa:E501
+                case "no_option":
+                    self.logger.error(f"Dropdown selection failed during interaction '{interaction.type}': option '{interaction.option_text}' not in {interaction.locator}")  # noqa:E501
+                case _:
+                    self.logger.error(f"Unexpected error during interaction '{interaction.type}': {result['message']}")  # noqa:E501
+
     def _perform_interaction(self, interaction: Interaction) -> None:
         try:
             match interaction.type:
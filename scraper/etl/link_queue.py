@@ -0,0 +1,128 @@
+import csv
+import time
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Reason codes of failed links
+NAVIGATION = "navigation"
+ELEMENT_NOT_FOUND = "element_not_found"
+PARSE = "parse"
+EXTRACTION = "extraction"
+DEADLINE = "deadline"
+EXCEPTION = "exception"
+
+
+class FailedLink:
+    """
+    A link whose scrape failed, waiting to be retried.
+
+    Attributes:
+        link_info (Dict): The link and its additional input data.
+        reason (str): Reason code of the last failure.
+        error (str): Error message of the last failure.
+        attempts (int): Number of failed attempts so far.
+        ready_at (float): Monotonic time after which the link may be retried.
+    """
+
+    def __init__(self, link_info: Dict, reason: str, error: str, attempts: int, ready_at: float) -> None:  # noqa:E501
+        self.link_info = link_info
+        self.reason = reason
+        self.error = error
+        self.attempts = attempts
+        self.ready_at = ready_at
+
+    @property
+    def link(self) -> str:
+        return self.link_info['link']
+
+
+class LinkRetryQueue:
+    """
+    Queue of failed links of a target. Each failure delays the link by an
+    exponentially growing backoff; a link that fails max_attempts times is
+    appended to the dead-letter file instead. Its lines are
+    'link,additional data...' exactly as in the input file, so the file can
+    be used as the input of a later run as it is. Why each link failed is
+    appended to the errors file next to it, as CSV rows of
+    'link,reason,attempts,timestamp,error'.
+
+    Attributes:
+        max_attempts (int): Attempts per link, including the first.
+        delay (float): Backoff (in seconds) before the first retry.
+        dead_letter_file (Optional[Path]): File links that exhaust their attempts are appended to.
+        errors_file (Optional[Path]): CSV file the failures of dead-lettered links are appended to.
+    """  # noqa:E501
+
+    def __init__(self, max_attempts: int = 3, delay: float = 0, dead_letter_file: Optional[Path] = None) -> None:  # noqa:E501
+        self.max_attempts = max_attempts
+        self.delay = delay
+        self.dead_letter_file = dead_letter_file
+        self.errors_file = dead_letter_file.with_name(f"{dead_letter_file.stem}.errors.csv") if dead_letter_file else None  # noqa:E501
+        self.dead_letters: List[FailedLink] = []
+        self._pending: List[FailedLink] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def push(self, link_info: Dict, reason: str, error: str, attempts: int = 1) -> bool:  # noqa:E501
+        """
+        Records a failed attempt of a link.
+
+        Args:
+            link_info (Dict): The link and its additional input data.
+            reason (str): Reason code of the failure.
+            error (str): Error message of the failure.
+            attempts (int): Number of failed attempts, including this one.
+
+        Returns:
+            bool: True if the link was queued for a retry, False if it was dead-lettered.
+        """  # noqa:E501
+        ready_at = time.monotonic() + self.delay * 2 ** (attempts - 1)
+        failed = FailedLink(link_info, reason, error, attempts, ready_at)
+        if attempts >= self.max_attempts:
+            self._dead_letter(failed)
+            return False
+        with self._lock:
+            self._pending.append(failed)
+        return True
+
+    def pop_ready(self) -> Optional[FailedLink]:
+        """Removes and returns the earliest queued link whose backoff has passed."""  # noqa:E501
+        now = time.monotonic()
+        with self._lock:
+            ready = [failed for failed in self._pending if failed.ready_at <= now]  # noqa:E501
+            if not ready:
+                return None
+            failed = min(ready, key=lambda failed: failed.ready_at)
+            self._pending.remove(failed)
+            return failed
+
+    def pop_next(self) -> Optional[FailedLink]:
+        """Removes and returns the earliest queued link, waiting out its backoff."""  # noqa:E501
+        with self._lock:
+            if not self._pending:
+                return None
+            failed = min(self._pending, key=lambda failed: failed.ready_at)
+            self._pending.remove(failed)
+        wait = failed.ready_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        return failed
+
+    def _dead_letter(self, failed: FailedLink) -> None:
+        self.dead_letters.append(failed)
+        if not self.dead_letter_file:
+            return
+        # The input reader splits lines on commas, so the line is joined the same way  # noqa:E501
+        line = ",".join([failed.link] + list(failed.link_info.get('additional_data', [])))  # noqa:E501
+        row = [failed.link, failed.reason, failed.attempts, datetime.now().isoformat(timespec="seconds"), failed.error]  # noqa:E501
+        self.dead_letter_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            with open(self.dead_letter_file, "a") as f:
+                f.write(line + "\n")
+            with open(self.errors_file, "a", newline="") as f:
+                csv.writer(f).writerow(row)
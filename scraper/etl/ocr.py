@@ -1,49 +1,207 @@
-import pytesseract
+import re
+import multiprocessing
 from io import BytesIO
-from PIL import Image, ImageOps, ImageFilter
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
 from scraper.web.controller import WebController
 from .exceptions import OCRException
+from .ocr_cache import OCRCache
+from .preprocessing import VIEWPORT_CROP, Preprocessor
 
+if TYPE_CHECKING:
+    from PIL import Image
 
-def img_to_txt(target_name: str, link: str, controller: WebController) -> str:  # noqa:E501
+DEFAULT_LANG = "eng"
+DEFAULT_CONFIG = "--psm 7"
+
+# Preprocessing of full viewport screenshots
+VIEWPORT = Preprocessor(crop=VIEWPORT_CROP)
+
+# Per-process OCR state, set up once by the pool initializer
+_worker = {"api": None, "lang": DEFAULT_LANG, "config": DEFAULT_CONFIG}
+
+
+def _init_worker(lang: str, config: str) -> None:
+    """
+    Initialises an OCR worker process. With tesserocr installed, a single
+    Tesseract API instance is kept for the life of the process; otherwise
+    each image falls back to a pytesseract subprocess call.
+    """
+    _worker.update(lang=lang, config=config)
+    try:
+        import tesserocr
+    except ImportError:
+        return
+    psm = re.search(r"--psm\s+(\d+)", config)
+    api = tesserocr.PyTessBaseAPI(lang=lang)
+    if psm:
+        api.SetPageSegMode(int(psm.group(1)))
+    _worker["api"] = api
+
+
+def _load_image(raw_image: bytes, preprocessor: Optional[Preprocessor]) -> "Image.Image":  # noqa:E501
+    if preprocessor is not None:
+        return preprocessor(raw_image)
+    from PIL import Image
+    try:
+        return Image.open(BytesIO(raw_image))
+    except Exception as e:
+        raise OCRException(f"Failed to load the image: {e}") from e
+
+
+def _recognize_image(image: "Image.Image") -> str:
+    api = _worker["api"]
+    try:
+        if api is not None:
+            api.SetImage(image)
+            return api.GetUTF8Text().strip()
+        import pytesseract
+        return pytesseract.image_to_string(image, lang=_worker["lang"], config=_worker["config"]).strip()  # noqa:E501
+    except Exception as e:
+        raise OCRException(f"Failed to extract string from image: {e}") from e
+
+
+def recognize(raw_image: bytes, preprocessor: Optional[Preprocessor] = VIEWPORT, cache: Optional[OCRCache] = None) -> str:  # noqa:E501
+    """
+    Extracts the text of a PNG image, using the worker's Tesseract instance
+    if one was initialised.
+
+    Args:
+        raw_image: The image bytes.
+        preprocessor: Pipeline applied first, or None to use the image as is.
+        cache: Cache consulted before running Tesseract.
+
+    Returns:
+        The stripped text.
+
+    Raises:
+        OCRException: If preprocessing or recognition fails.
+    """
+    image = _load_image(raw_image, preprocessor)
+    if cache is None:
+        return _recognize_image(image)
+    key = cache.key(image, _worker["lang"], _worker["config"])
+    text = cache.get(key)
+    if text is None:
+        text = _recognize_image(image)
+        cache.put(key, text)
+    return text
+
+
+class OCREngine:
+    """
+    Runs OCR in a pool of worker processes, each keeping an initialised
+    Tesseract instance, so images are recognised on other cores while the
+    scraping thread carries on.
+
+    With a cache, images are preprocessed and looked up on the calling
+    thread, and only cache misses are sent to the workers.
+
+    Attributes:
+        workers (Optional[int]): Number of worker processes (defaults to the CPU count).
+        lang (str): Tesseract language.
+        config (str): Tesseract configuration flags.
+        cache (Optional[OCRCache]): Cache of results by preprocessed image.
+    """  # noqa:E501
+
+    def __init__(self, workers: Optional[int] = None, lang: str = DEFAULT_LANG, config: str = DEFAULT_CONFIG,  # noqa:E501
+                 cache: Optional[OCRCache] = None) -> None:
+        self.workers = workers
+        self.lang = lang
+        self.config = config
+        self.cache = cache
+        # spawn, as forking a process with running threads is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(lang, config),
+        )
+
+    def submit(self, raw_image: bytes, preprocessor: Optional[Preprocessor] = VIEWPORT) -> "Future[str]":  # noqa:E501
+        """
+        Queues an image for OCR.
+
+        Args:
+            raw_image: The PNG image bytes.
+            preprocessor: Pipeline applied first, or None to use the image as is.
+
+        Returns:
+            A future resolving to the extracted text, or raising OCRException.
+        """  # noqa:E501
+        if self.cache is None:
+            return self._executor.submit(recognize, raw_image, preprocessor)
+        future: "Future[str]" = Future()
+        try:
+            image = _load_image(raw_image, preprocessor)
+        except OCRException as e:
+            future.set_exception(e)
+            return future
+        key = self.cache.key(image, self.lang, self.config)
+        text = self.cache.get(key)
+        if text is not None:
+            future.set_result(text)
+            return future
+        work = self._executor.submit(_recognize_image, image)
+
+        def store(done: "Future[str]") -> None:
+            if not done.cancelled() and done.exception() is None:
+                self.cache.put(key, done.result())
+
+        work.add_done_callback(store)
+        return work
+
+    def submit_batch(self, raw_images: Iterable[bytes], preprocessor: Optional[Preprocessor] = VIEWPORT) -> List["Future[str]"]:  # noqa:E501
+        """
+        Queues a batch of images for OCR.
+
+        Args:
+            raw_images: The PNG image bytes.
+            preprocessor: Pipeline applied first, or None to use the images as is.
+
+        Returns:
+            One future per image, in order.
+        """  # noqa:E501
+        return [self.submit(raw_image, preprocessor) for raw_image in raw_images]  # noqa:E501
+
+    def close(self, wait: bool = True) -> None:
+        """Shuts down the worker processes, cancelling queued images if not waiting."""  # noqa:E501
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> "OCREngine":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def _screenshot(target_name: str, link: str, controller: WebController) -> bytes:
     try:
         controller.make_request(target_name, link)
         driver = controller.get_driver(target_name)
-        raw_image = driver.get_screenshot_as_png()
-        try:
-            processed_image = preprocess(raw_image)
-            if processed_image:
-                try:
-                    text = pytesseract.image_to_string(processed_image, config="--psm 7")  # noqa:E501
-                    return text.strip()
-                except pytesseract.TesseractError as e:
-                    raise OCRException(f"Failed to extract string from image for {target_name} at {link}: {e}")  # noqa:E501
-        except Exception as e:
-            raise OCRException(f"Preprocessing failed for {target_name} at {link}: {e}")
+        return driver.get_screenshot_as_png()
     except Exception as e:
-        raise OCRException(f"Failed to retrieve image for {target_name} at {link}: {e}")
+        raise OCRException(f"Failed to retrieve image for {target_name} at {link}: {e}")  # noqa:E501
 
 
-def preprocess(raw_image: bytes) -> Image.Image:
+def img_to_txt(target_name: str, link: str, controller: WebController, cache: Optional[OCRCache] = None) -> str:  # noqa:E501
+    raw_image = _screenshot(target_name, link, controller)
     try:
-        image = Image.open(BytesIO(raw_image))
-        # Define cropping box
-        left = (1920 / 2) - 50
-        upper = (995 / 2) - 30
-        right = left + 100
-        lower = upper + 60
-        cropped_image = image.crop((int(left), int(upper), int(right), int(lower)))
-        # Resizing and filtering
-        resized_image = cropped_image.resize(
-            (cropped_image.width * 3, cropped_image.height * 3),
-            Image.Resampling.LANCZOS,
-        )
-        median_filtered_image = resized_image.filter(ImageFilter.MedianFilter(size=3))
-        grayscale_image = ImageOps.grayscale(median_filtered_image)
-        # Thresholding
-        threshold = 230
-        processed_image = grayscale_image.point(lambda p: p > threshold and 255)
-        return processed_image
+        return recognize(raw_image, cache=cache)
+    except Exception as e:
+        raise OCRException(f"OCR failed for {target_name} at {link}: {e}")
+
+
+def img_to_txt_async(target_name: str, link: str, controller: WebController, engine: OCREngine) -> "Future[str]":  # noqa:E501
+    # The screenshot needs the driver, so only recognition is handed off
+    raw_image = _screenshot(target_name, link, controller)
+    return engine.submit(raw_image)
+
+
+def preprocess(raw_image: bytes, crop: bool = True) -> "Image.Image":
+    preprocessor = VIEWPORT if crop else Preprocessor()
+    try:
+        return preprocessor(raw_image)
     except Exception as e:
         raise OCRException("Failed to preprocess the image") from e
@@ -0,0 +1,165 @@
+import os
+import time
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from scraper.telemetry import metrics
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+class OCRCache:
+    """
+    Content-addressed cache of OCR results, keyed by a hash of the
+    preprocessed image and the Tesseract settings. Recent results are held
+    in an in-memory LRU; with a directory set, every result is also stored
+    on disk, so repeated images skip Tesseract across runs.
+
+    The on-disk store is bounded: entries older than max_age are dropped, and
+    once it holds more than max_files entries the oldest are removed until a
+    tenth of the room is free again. It is pruned when the cache is created
+    and whenever a put overflows it.
+
+    Attributes:
+        max_entries (int): Size of the in-memory LRU (0 keeps nothing in memory).
+        directory (Optional[Path]): Directory of the on-disk store, or None for memory only.
+        max_files (Optional[int]): Maximum number of entries on disk, unbounded if None.
+        max_age (Optional[float]): Age (in seconds) after which an entry on disk expires, never if None.
+    """  # noqa:E501
+
+    def __init__(self, max_entries: int = 1024, directory: Optional[Path] = None,
+                 max_files: Optional[int] = None, max_age: Optional[float] = None) -> None:  # noqa:E501
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory else None
+        self.max_files = max_files
+        self.max_age = max_age
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_files = 0
+        if self.directory:
+            self.prune()
+
+    @staticmethod
+    def key(image: "Image.Image", lang: str, config: str) -> str:
+        """
+        Hashes a preprocessed image together with the Tesseract settings.
+
+        Args:
+            image: The preprocessed image.
+            lang: Tesseract language.
+            config: Tesseract configuration flags.
+
+        Returns:
+            The hex digest identifying the OCR result.
+        """
+        digest = hashlib.sha256(f"{lang}\0{config}\0{image.mode}\0{image.width}x{image.height}\0".encode())  # noqa:E501
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached text for a key, or None, counting the lookup in the run metrics."""  # noqa:E501
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+        if text is not None:
+            metrics.record_ocr_cache("memory_hit")
+            return text
+        if self.directory:
+            path = self._path(key)
+            try:
+                if self._expired(path.stat().st_mtime, time.time()):
+                    self._unlink(path)
+                    text = None
+                else:
+                    text = path.read_text(encoding="utf-8")
+            except OSError:
+                text = None
+            if text is not None:
+                self._remember(key, text)
+                metrics.record_ocr_cache("disk_hit")
+                return text
+        metrics.record_ocr_cache("miss")
+        return None
+
+    def put(self, key: str, text: str) -> None:
+        """Stores the text for a key in memory and, if enabled, on disk."""
+        self._remember(key, text)
+        if not self.directory:
+            return
+        path = self._path(key)
+        temp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            added = not path.exists()
+            # Written aside and renamed, so readers never see a partial entry
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, delete=False) as f:  # noqa:E501
+                temp_name = f.name
+                f.write(text)
+            os.replace(temp_name, path)
+        except OSError:
+            if temp_name:
+                self._unlink(Path(temp_name))
+            return  # caching is best effort
+        if added:
+            with self._lock:
+                self._disk_files += 1
+                overflow = self.max_files is not None and self._disk_files > self.max_files  # noqa:E501
+            if overflow:
+                self.prune()
+
+    def prune(self) -> None:
+        """Removes expired entries from disk, then the oldest ones if it holds more than max_files."""  # noqa:E501
+        if not self.directory or not self.directory.is_dir():
+            return
+        now = time.time()
+        entries = []
+        for path in self.directory.glob("*/*"):
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue  # removed meanwhile
+            if self._expired(mtime, now):
+                self._unlink(path)
+            else:
+                entries.append((mtime, path))
+        if self.max_files is not None and len(entries) > self.max_files:
+            entries.sort()
+            # Frees a tenth of the room, so a full store is not rescanned on every put  # noqa:E501
+            excess = len(entries) - self.max_files + self.max_files // 10
+            for _, path in entries[:excess]:
+                self._unlink(path)
+            entries = entries[excess:]
+        with self._lock:
+            self._disk_files = len(entries)
+
+    def _expired(self, mtime: float, now: float) -> bool:
+        return self.max_age is not None and now - mtime > self.max_age
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def _remember(self, key: str, text: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,165 @@
+import math
+from io import BytesIO
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import OCRException
+
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
+Box = Tuple[int, int, int, int]
+
+# Values per stacked array in Preprocessor.batch
+_STACK_VALUES = 1 << 18
+
+# Centre box of a full 1920x995 viewport screenshot
+VIEWPORT_CROP: Box = (910, 467, 1010, 527)
+
+# Compare-exchange network selecting the median of 9 values (Devillard, opt_med9)  # noqa:E501
+_MEDIAN9_NETWORK = (
+    (1, 2), (4, 5), (7, 8), (0, 1), (3, 4), (6, 7), (1, 2), (4, 5), (7, 8),
+    (0, 3), (5, 8), (4, 7), (3, 6), (1, 4), (2, 5), (4, 7), (4, 2), (6, 4),
+    (4, 2),
+)
+
+
+class Preprocessor:
+    """
+    Prepares images for OCR with NumPy array stages: crop, LANCZOS upscale,
+    median filter, grayscale and threshold. The stages run in the order of
+    the original Pillow pipeline and produce the same pixels, so Tesseract
+    sees the same input; images of the same size are processed as stacked
+    arrays.
+
+    With fast set, the image is grayscaled on load and filtered and
+    thresholded before a nearest-neighbour upscale, on scale**2 fewer
+    pixels. It is several times faster again, but only about 80% of the
+    pixels match the default order, so OCR results may differ.
+
+    Attributes:
+        crop (Optional[Box]): (left, upper, right, lower) box, or None to keep the whole image.
+        scale (int): Integer upscale factor.
+        median_size (int): Median filter window (1 disables the filter).
+        threshold (int): Gray level above which pixels become white.
+        fast (bool): Filters and thresholds before upscaling.
+    """  # noqa:E501
+
+    def __init__(self, crop: Optional[Box] = None, scale: int = 3, median_size: int = 3, threshold: int = 230,  # noqa:E501
+                 fast: bool = False) -> None:
+        if scale < 1:
+            raise ValueError("scale must be at least 1")
+        if median_size < 1 or median_size % 2 == 0:
+            raise ValueError("median_size must be a positive odd number")
+        self.crop = tuple(crop) if crop else None
+        self.scale = scale
+        self.median_size = median_size
+        self.threshold = threshold
+        self.fast = fast
+
+    def __repr__(self) -> str:
+        return f"Preprocessor(crop={self.crop}, scale={self.scale}, median_size={self.median_size}, threshold={self.threshold}, fast={self.fast})"  # noqa:E501
+
+    def load(self, raw_image: bytes) -> "np.ndarray":
+        """
+        Decodes an image, crops it and, in the default order, upscales it.
+
+        Returns:
+            A (height, width, 3) uint8 RGB array, or a (height, width) gray array if fast.
+        """  # noqa:E501
+        import numpy as np
+        from PIL import Image
+        try:
+            image = Image.open(BytesIO(raw_image))
+            if self.crop:
+                image = image.crop(self.crop)
+            if self.fast:
+                return np.asarray(image.convert("L"), dtype=np.uint8)
+            image = image.convert("RGB")
+            if self.scale > 1:
+                # Pillow's resampling already runs in C over the whole image
+                image = image.resize((image.width * self.scale, image.height * self.scale), Image.Resampling.LANCZOS)  # noqa:E501
+            return np.asarray(image, dtype=np.uint8)
+        except Exception as e:
+            raise OCRException(f"Failed to load the image: {e}") from e
+
+    def process_array(self, pixels: "np.ndarray") -> "np.ndarray":
+        """
+        Runs the stages after load: median filter, grayscale and threshold,
+        or filter, threshold and upscale if fast.
+
+        Args:
+            pixels: A loaded (batch, height, width, 3) RGB array, or (batch, height, width) gray array if fast.
+
+        Returns:
+            The processed (batch, height, width) uint8 array.
+        """  # noqa:E501
+        import numpy as np
+        if self.fast:
+            if self.median_size > 1:
+                pixels = _median_filter(pixels, self.median_size)
+            pixels = np.where(pixels > self.threshold, np.uint8(255), np.uint8(0))  # noqa:E501
+            if self.scale > 1:
+                pixels = pixels.repeat(self.scale, axis=-2).repeat(self.scale, axis=-1)  # noqa:E501
+            return pixels
+        # Channels first, so each is filtered as a plane, like Pillow's MedianFilter on RGB  # noqa:E501
+        channels = np.ascontiguousarray(np.moveaxis(pixels, -1, -3))
+        if self.median_size > 1:
+            channels = _median_filter(channels, self.median_size)
+        return np.where(_grayscale(channels) > self.threshold, np.uint8(255), np.uint8(0))  # noqa:E501
+
+    def __call__(self, raw_image: bytes) -> "Image.Image":
+        """Preprocesses a single image."""
+        return self.batch([raw_image])[0]
+
+    def batch(self, raw_images: Iterable[bytes]) -> List["Image.Image"]:
+        """
+        Preprocesses a batch of images, stacking same-sized images so each
+        stage runs once per size rather than once per image.
+
+        Args:
+            raw_images: The image bytes.
+
+        Returns:
+            The preprocessed images, in order.
+        """
+        import numpy as np
+        from PIL import Image
+        arrays = [self.load(raw_image) for raw_image in raw_images]
+        by_shape: Dict[Tuple[int, ...], List[int]] = {}
+        for index, pixels in enumerate(arrays):
+            by_shape.setdefault(pixels.shape, []).append(index)
+        results: List[Optional[Image.Image]] = [None] * len(arrays)
+        for shape, indices in by_shape.items():
+            # Stacks are kept cache sized; larger ones are bound by memory bandwidth  # noqa:E501
+            step = max(1, _STACK_VALUES // math.prod(shape))
+            for start in range(0, len(indices), step):
+                chunk = indices[start:start + step]
+                processed = self.process_array(np.stack([arrays[index] for index in chunk]))  # noqa:E501
+                for index, pixels in zip(chunk, processed):
+                    # A 2D uint8 array is read as an 'L' image
+                    results[index] = Image.fromarray(np.ascontiguousarray(pixels))  # noqa:E501
+        return results
+
+
+def _grayscale(channels: "np.ndarray") -> "np.ndarray":
+    """Converts (..., 3, height, width) RGB planes to gray with Pillow's fixed-point ITU-R 601-2 luma."""  # noqa:E501
+    import numpy as np
+    red, green, blue = (channels[..., index, :, :].astype(np.uint32) for index in range(3))  # noqa:E501
+    return ((red * 19595 + green * 38470 + blue * 7471 + 0x8000) >> 16).astype(np.uint8)  # noqa:E501
+
+
+def _median_filter(pixels: "np.ndarray", size: int) -> "np.ndarray":
+    """Applies a size x size median filter over the last two axes, replicating edges."""  # noqa:E501
+    import numpy as np
+    pad = size // 2
+    padding = [(0, 0)] * (pixels.ndim - 2) + [(pad, pad), (pad, pad)]
+    padded = np.pad(pixels, padding, mode="edge")
+    height, width = pixels.shape[-2:]
+    window = [padded[..., dy:dy + height, dx:dx + width] for dy in range(size) for dx in range(size)]  # noqa:E501
+    if size == 3:
+        # Elementwise min/max over whole arrays beats sorting per pixel
+        for a, b in _MEDIAN9_NETWORK:
+            window[a], window[b] = np.minimum(window[a], window[b]), np.maximum(window[a], window[b])  # noqa:E501
+        return window[4]
+    return np.median(np.stack(window), axis=0).astype(np.uint8)
@@ -1,25 +1,37 @@
-from typing import List
+from typing import List, Optional
+from contextlib import nullcontext
 
-from scraper.config.validator import TargetConfig
+from scraper.config.validator import OCRConfig, TargetConfig
 from scraper.config.logging import StructuredLogger
 from scraper.web.controller import WebController
+from scraper.telemetry.profiling import Profiler
 
 from .target import TargetManager
 
 
-def run_scraper(logger: StructuredLogger, controller: WebController, cfgs: List[TargetConfig]):  # noqa:E501
+def run_scraper(logger: StructuredLogger, controller: WebController, cfgs: List[TargetConfig], profiler: Optional[Profiler] = None,  # noqa:E501
+                ocr_cfg: Optional[OCRConfig] = None):
+    def profile(section: str):
+        return profiler.profile(section) if profiler else nullcontext()
+
+    target_manager = None
     try:
-        controller.connect()
-        target_manager = TargetManager(logger, controller)
+        with profile("connect"):
+            controller.connect()
+        target_manager = TargetManager(logger, controller, ocr_cfg)
         for target in cfgs:
             try:
-                target_manager.scrape_target(target)
+                with profile(target.name):
+                    target_manager.scrape_target(target)
             except Exception as e:
                 logger.error(f"Failed to scrape '{target.name}': {e}", exc_info=True)
     except Exception as e:
         logger.critical(f"Scraper failed to connect: {e}", exc_info=True)
     finally:
+        if target_manager:
+            target_manager.close()
         try:
-            controller.disconnect()
+            with profile("disconnect"):
+                controller.disconnect()
         except Exception as e:
             logger.critical(f"Scraper failed to disconnect: {e}", exc_info=True)
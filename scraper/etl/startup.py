@@ -3,8 +3,10 @@ from selenium.webdriver.remote.webdriver import WebDriver
 
 from scraper.config.validator import Startup, Interaction
 from scraper.config.logging import StructuredLogger
+from scraper.config import retry
+from scraper.telemetry import metrics, tracing
 
-from .helper import click, dropdown
+from .helper import TRANSIENT_ERRORS, click, dropdown
 
 
 class StartupManager:
@@ -15,30 +17,38 @@ class StartupManager:
     def execute(self, name: str, startup: Startup):
         for action_type, interaction in startup.actions.items():
             try:
-                self._perform_startup_action(action_type, interaction)
+                with (
+                    tracing.span("startup_action", action=action_type, type=interaction.type, locator=interaction.locator),  # noqa:E501
+                    metrics.scope(source="startup"),
+                    metrics.track("startup"),
+                ):
+                    self._perform_startup_action(action_type, interaction)
             except Exception as e:
                 self.logger.error(f"Failed to perform startup action '{action_type}' for '{name}': {e}", exc_info=True)  # noqa:E501
 
     def _perform_startup_action(self, action_type: str, interaction: Interaction) -> None:  # noqa:E501
-        max_retries = 2
-        for attempt in range(max_retries):
-            try:
-                match interaction.type:
-                    case "click":
-                        self._startup_click(action_type, interaction)
-                    case "dropdown":
-                        self._startup_dropdown(action_type, interaction)
-                    case _:
-                        self.logger.error(f"Startup action invoked unknown interaction: '{interaction.type}'")  # noqa:E501
-                # If action succeeds, break out of the loop
-                break
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    self.logger.warning(f"Retrying startup action '{action_type}' (attempt {attempt + 2})")  # noqa:E501
-                else:
-                    self.logger.error(f"Startup action '{action_type}' failed after {max_retries} attempts")  # noqa:E501
-                    raise e
-            time.sleep(interaction.wait_interval)
+        def on_retry(error: BaseException, attempt: int, delay: float) -> None:
+            self.logger.warning(f"Retrying startup action '{action_type}' (attempt {attempt + 1}) in {delay:.2f}s: {error}")  # noqa:E501
+
+        def perform() -> None:
+            match interaction.type:
+                case "click":
+                    self._startup_click(action_type, interaction)
+                case "dropdown":
+                    self._startup_dropdown(action_type, interaction)
+                case _:
+                    self.logger.error(f"Startup action invoked unknown interaction: '{interaction.type}'")  # noqa:E501
+
+        try:
+            if interaction.type == "click":
+                # click retries on its own, so retrying it here too would multiply the attempts  # noqa:E501
+                perform()
+            else:
+                retry.current_policy().call(perform, "startup", TRANSIENT_ERRORS, on_retry)  # noqa:E501
+        except Exception:
+            self.logger.error(f"Startup action '{action_type}' failed")
+            raise
+        time.sleep(interaction.wait_interval)
 
     def _startup_click(self, action_type, interaction: Interaction) -> None:
         click(self.driver, interaction.locator, interaction.locator_type, interaction.wait_interval)  # noqa:E501
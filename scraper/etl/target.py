@@ -1,50 +1,191 @@
-import pandas as pd
-from typing import List, Dict
+import threading
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
+from urllib.parse import urlsplit
 
+from scraper.config import deadline, retry
 from scraper.config.logging import StructuredLogger
-from scraper.config.validator import TargetConfig
+from scraper.config.validator import OCRConfig, TargetConfig
 from scraper.web.controller import WebController
+from scraper.web.proxy import proxy_address
+from scraper.telemetry import metrics, tracing
 
+from . import link_queue
 from .extraction import ExtractionManager
+from .link_queue import FailedLink, LinkRetryQueue
+from .ocr import OCREngine
+from .ocr_cache import OCRCache
 from .interaction import InteractionManager
 from .startup import StartupManager
+from .watchdog import LinkWatchdog
 
 
 class TargetManager:
-    def __init__(self, logger: StructuredLogger, controller: WebController):
+    def __init__(self, logger: StructuredLogger, controller: WebController, ocr_cfg: Optional[OCRConfig] = None):  # noqa:E501
         self.logger = logger
         self.controller = controller
+        self.ocr_cfg = ocr_cfg or OCRConfig()
+        self.ocr_engine: Optional[OCREngine] = None
+        # The daemon scrapes due targets concurrently on one manager
+        self._ocr_lock = threading.Lock()
+        self.retry_policies: Dict[str, retry.RetryPolicy] = {}
+        self.watchdog = LinkWatchdog(logger, controller)
 
     def scrape_target(self, target: TargetConfig):
+        # Kept per target, so its retry budget spans links and runs
+        policy = self.retry_policies.get(target.name)
+        if policy is None:
+            policy = self.retry_policies[target.name] = retry.RetryPolicy.from_config(target.retry)  # noqa:E501
+        with retry.scope(policy):
+            self._scrape_target(target)
+
+    def _scrape_target(self, target: TargetConfig):
         try:
             # Perform startup actions with target domain
-            if target.startup:
-                connection = self.controller.get_connection(target.name)
-                self.controller.make_request(target.name, target.domain)
-                driver = connection.driver
-                startup = StartupManager(self.logger, driver)
-                startup.execute(target.name, target.startup)
+            if target.startup and self.controller.has_session(target.name):
+                # The snapshot taken after an earlier startup is restored into every new driver  # noqa:E501
+                self.logger.info(f"Reusing session for '{target.name}', skipping startup actions")  # noqa:E501
+            elif target.startup:
+                with tracing.span("startup", target=target.name, link=target.domain):  # noqa:E501
+                    connection = self.controller.get_connection(target.name)
+                    self.controller.make_request(target.name, target.domain)
+                    driver = connection.driver
+                    startup = StartupManager(self.logger, driver)
+                    with metrics.scope(target=target.name, proxy=proxy_address(connection.proxy)):  # noqa:E501
+                        startup.execute(target.name, target.startup)
+                    self.controller.save_session(target.name)
             # Retrieve links, perform interactions
+            queue = self._get_link_queue(target)
             for link_info in self._get_target_links(target):
-                connection = self.controller.get_connection(target.name)
-                self.controller.make_request(target.name, link_info['link'])
-                driver = connection.driver
-                if target.interactions:
-                    interact = InteractionManager(self.logger, driver)
-                    interact.execute(target.name, target.interactions)
-                extract = ExtractionManager(self.logger, driver)
-                extraction_results = extract.execute(target.name, target.extractions)
-                for output_file, result in extraction_results.items():
-                    if target.supplemental_input_data:
-                        # Prepend the input link to the additional_data list
-                        supplemented_data = [row + [link_info['link']] + link_info['additional_data'] for row in result["data"]]  # noqa:E501
-                    else:
-                        supplemented_data = [row for row in result["data"]]
-                    self.write_output(link_info['link'], supplemented_data, result["output_type"], Path(output_file))  # noqa:E501
+                self._process_link(target, link_info, queue)
+                if target.link_retry.interleave:
+                    while (failed := queue.pop_ready()):
+                        self._process_link(target, failed.link_info, queue, failed)  # noqa:E501
+            # Failed links get their remaining attempts once the input is done
+            while (failed := queue.pop_next()):
+                self._process_link(target, failed.link_info, queue, failed)
+            if queue.dead_letters:
+                self.logger.error(f"{len(queue.dead_letters)} link(s) of '{target.name}' failed after {queue.max_attempts} attempts, see: {queue.dead_letter_file}")  # noqa:E501
         except Exception as e:
             self.logger.error(f"Failed to scrape '{target.name}': {e}", exc_info=True)
 
+    def _get_link_queue(self, target: TargetConfig) -> LinkRetryQueue:
+        cfg = target.link_retry
+        dead_letter_file = cfg.dead_letter_file
+        if dead_letter_file is None and target.input_file:
+            # Next to the input, in a format that can be fed back as input
+            input_file = target.input_file
+            dead_letter_file = input_file.with_name(f"{input_file.stem}.failed{input_file.suffix}")  # noqa:E501
+        return LinkRetryQueue(cfg.max_attempts, cfg.delay, dead_letter_file)
+
+    def _process_link(self, target: TargetConfig, link_info: Dict[str, List[str]], queue: LinkRetryQueue,  # noqa:E501
+                      previous: Optional[FailedLink] = None) -> None:
+        attempts = previous.attempts if previous else 0
+        connection = self.controller.get_connection(target.name)
+        if previous:
+            self.logger.info(f"Retrying '{previous.link}' for '{target.name}' (attempt {attempts + 1}) after {previous.reason}")  # noqa:E501
+        if self.controller.apply_restart(target.name):
+            # The monitor found the container dead, restarting it also picks a new proxy  # noqa:E501
+            pass
+        elif not connection.container:
+            # The watchdog recycled a hung container, reconnecting also picks a new proxy  # noqa:E501
+            self.controller.ensure_connected(target.name)
+        elif previous:
+            # Retry on a different proxy and a fresh driver
+            self.controller.rotate_proxy(connection, urlsplit(previous.link).hostname)  # noqa:E501
+        elif not connection.driver:
+            # The watchdog quit the driver of the previous link
+            self.controller.ensure_connected(target.name)
+        else:
+            with metrics.scope(target=target.name):
+                self.controller.recycle_driver(target.name)
+        # Partial results are only written once no attempts are left
+        final = attempts + 1 >= queue.max_attempts
+        with metrics.scope(target=target.name):
+            failure = self._scrape_link_attempt(target, link_info, final, attempts + 1)  # noqa:E501
+            if failure is None:
+                if previous:
+                    metrics.record_failed_link(previous.reason, "recovered")
+                return
+            reason, error = failure
+            if queue.push(link_info, reason, error, attempts + 1):
+                metrics.record_failed_link(reason, "queued")
+                self.logger.warning(f"Queued '{link_info['link']}' of '{target.name}' for a retry ({reason}): {error}")  # noqa:E501
+            else:
+                metrics.record_failed_link(reason, "dead_lettered")
+                self.logger.error(f"Giving up on '{link_info['link']}' of '{target.name}' after {attempts + 1} attempts ({reason}): {error}")  # noqa:E501
+
+    def _scrape_link_attempt(self, target: TargetConfig, link_info: Dict[str, List[str]], write_partial: bool,  # noqa:E501
+                             attempt: int) -> Optional[Tuple[str, str]]:
+        with (
+            tracing.span("scrape_link", target=target.name, link=link_info['link'], attempt=attempt) as span,  # noqa:E501
+            self.watchdog.watch(target.name, target.link_timeout, target.link_abort_grace) as link_deadline,  # noqa:E501
+        ):
+            connection = self.controller.get_connection(target.name)
+            if not self.controller.make_request(target.name, link_info['link']):
+                if link_deadline and link_deadline.expired:
+                    return link_queue.DEADLINE, f"navigation exceeded the {link_deadline.timeout:g}s link budget"  # noqa:E501
+                return link_queue.NAVIGATION, "request failed"
+            if span:
+                span.set_attribute("proxy", proxy_address(connection.proxy))
+            with metrics.scope(target=target.name, proxy=proxy_address(connection.proxy)):  # noqa:E501
+                try:
+                    failures = self._scrape_link(target, link_info, connection.driver, write_partial)  # noqa:E501
+                except Exception as e:
+                    if link_deadline and link_deadline.expired:
+                        # Raised by a checkpoint, or by a call the watchdog aborted  # noqa:E501
+                        self.logger.error(f"Scraping '{link_info['link']}' for '{target.name}' exceeded the {link_deadline.timeout:g}s link budget: {e}")  # noqa:E501
+                        if span:
+                            span.set_attribute("failed", link_queue.DEADLINE)
+                        return link_queue.DEADLINE, str(e)
+                    self.logger.error(f"Failed to scrape '{link_info['link']}' for '{target.name}': {e}", exc_info=True)  # noqa:E501
+                    return link_queue.EXCEPTION, str(e)
+            if failures:
+                if span:
+                    span.set_attribute("failed", failures[0][0])
+                return failures[0][0], "; ".join(message for _, message in failures)  # noqa:E501
+        return None
+
+    def _scrape_link(self, target: TargetConfig, link_info: Dict[str, List[str]], driver,  # noqa:E501
+                     write_partial: bool = True) -> List[Tuple[str, str]]:
+        if target.interactions:
+            interact = InteractionManager(self.logger, driver)
+            interact.execute(target.name, target.interactions, target.batch_interactions)  # noqa:E501
+        deadline.check()
+        extract = ExtractionManager(self.logger, driver, self._get_ocr_engine(target))  # noqa:E501
+        extraction_results = extract.execute(target.name, target.extractions)
+        if extract.failures and not write_partial:
+            # The retry extracts the link again, writing now would duplicate rows  # noqa:E501
+            return extract.failures
+        for output_file, result in extraction_results.items():
+            if target.supplemental_input_data:
+                # Prepend the input link to the additional_data list
+                supplemented_data = [row + [link_info['link']] + link_info['additional_data'] for row in result["data"]]  # noqa:E501
+            else:
+                supplemented_data = [row for row in result["data"]]
+            self.write_output(link_info['link'], supplemented_data, result["output_type"], Path(output_file))  # noqa:E501
+        return extract.failures
+
+    def _get_ocr_engine(self, target: TargetConfig) -> Optional[OCREngine]:
+        # Worker processes are only started once a target extracts images
+        if not any(extraction.type in ("img", "image") for extraction in target.extractions or []):  # noqa:E501
+            return self.ocr_engine
+        with self._ocr_lock:
+            if self.ocr_engine is None:
+                cache = None
+                if self.ocr_cfg.cache:
+                    cache = OCRCache(self.ocr_cfg.cache_size, self.ocr_cfg.cache_directory,  # noqa:E501
+                                     self.ocr_cfg.cache_max_files, self.ocr_cfg.cache_max_age)  # noqa:E501
+                self.ocr_engine = OCREngine(workers=self.ocr_cfg.workers, cache=cache)  # noqa:E501
+            return self.ocr_engine
+
+    def close(self):
+        self.watchdog.close()
+        with self._ocr_lock:
+            if self.ocr_engine:
+                self.ocr_engine.close()
+                self.ocr_engine = None
+
     def _get_target_links(self, target: TargetConfig) -> List[Dict[str, List[str]]]:
         input_file = target.input_file
         if input_file.exists() and input_file.suffix == '.txt':
@@ -64,10 +205,16 @@ class TargetManager:
             self.logger.error(f"Unsupported input file extension for '{target.name}': '{input_file.suffix}'")  # noqa:E501
         return []
 
+    @metrics.track("write")
     def write_output(self, name: str, data: List[List[str]], output_type: str, output_file: Path):  # noqa:E501
+        with tracing.span("write", output_type=output_type, output_file=str(output_file), rows=len(data)):  # noqa:E501
+            self._write_output(name, data, output_type, output_file)
+
+    def _write_output(self, name: str, data: List[List[str]], output_type: str, output_file: Path):  # noqa:E501
         if not data:
             self.logger.error(f"No data to write for output file: {output_file}")
             return
+        import pandas as pd  # deferred, pandas is slow to import
         df = pd.DataFrame(data)
         # Create the directory if it doesn't exist
         output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,114 @@
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from scraper.config import deadline
+from scraper.config.deadline import Deadline
+from scraper.config.logging import StructuredLogger
+from scraper.telemetry import metrics
+from scraper.web.controller import WebController
+
+
+class LinkWatchdog:
+    """
+    Enforces the time budget of each link. Checkpoints between the stages of
+    a link raise once its deadline expires; a link stuck inside a single
+    WebDriver call never reaches one, so a monitor thread aborts the
+    target's driver when the deadline passes, recycling its container if
+    the driver is hung too.
+
+    Attributes:
+        logger (StructuredLogger): Logger for logging messages.
+        controller (WebController): Controller owning the connections to abort.
+    """  # noqa:E501
+
+    def __init__(self, logger: StructuredLogger, controller: WebController) -> None:  # noqa:E501
+        self.logger = logger
+        self.controller = controller
+        # target name -> (deadline, abort grace) of the link being scraped
+        self._watched: Dict[str, Tuple[Deadline, float]] = {}
+        self._aborting = set()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def watch(self, target_name: str, timeout: Optional[float], grace: float = 10):  # noqa:E501
+        """
+        Scopes the deadline of a link of a target, for checkpoints within the
+        block and for the monitor thread.
+
+        Args:
+            target_name (str): The name of the target.
+            timeout (Optional[float]): Budget (in seconds) of the link, None for no budget.
+            grace (float): Time (in seconds) the driver gets to quit when aborted.
+
+        Yields:
+            Optional[Deadline]: The deadline of the link.
+        """  # noqa:E501
+        if timeout is None:
+            with deadline.scope(None):
+                yield None
+            return
+        link_deadline = Deadline(target_name, timeout)
+        with self._condition:
+            self._start()
+            self._watched[target_name] = (link_deadline, grace)
+            self._condition.notify_all()
+        try:
+            with deadline.scope(link_deadline):
+                yield link_deadline
+        finally:
+            with self._condition:
+                self._watched.pop(target_name, None)
+                # An abort in flight must not hit the driver of the next link
+                while target_name in self._aborting:
+                    self._condition.wait()
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._closed = False
+            self._thread = threading.Thread(target=self._run, name="link-watchdog", daemon=True)  # noqa:E501
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                expired = self._expired()
+                while not expired and not self._closed:
+                    expiries = [watched.expires_at for watched, _ in self._watched.values() if not watched.aborted]  # noqa:E501
+                    timeout = max(0, min(expiries) - time.monotonic()) if expiries else None  # noqa:E501
+                    self._condition.wait(timeout)
+                    expired = self._expired()
+                if self._closed:
+                    return
+                for name, (watched, _) in expired:
+                    watched.aborted = True
+                    self._aborting.add(name)
+            for name, (watched, grace) in expired:
+                self._abort(name, watched, grace)
+
+    def _expired(self) -> List[Tuple[str, Tuple[Deadline, float]]]:
+        return [(name, watched) for name, watched in self._watched.items()
+                if watched[0].expired and not watched[0].aborted and name not in self._aborting]  # noqa:E501
+
+    def _abort(self, name: str, watched: Deadline, grace: float) -> None:
+        self.logger.error(f"Link of '{name}' exceeded its {watched.timeout:g}s budget, aborting")  # noqa:E501
+        try:
+            with metrics.scope(target=name):
+                self.controller.abort(name, grace)
+        except Exception as e:
+            self.logger.error(f"Failed to abort '{name}': {e}", exc_info=True)
+        finally:
+            with self._condition:
+                self._aborting.discard(name)
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,146 @@
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional, Union
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scraper.config.logging import StructuredLogger
+from scraper.config.validator import MetricsConfig
+
+from .metrics import MetricsRegistry, REGISTRY, configure
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """
+    Serves the metrics registry over HTTP in the Prometheus text format.
+
+    Attributes:
+        logger (StructuredLogger): Logger for logging messages.
+        host (str): Address the server binds to.
+        port (int): Port the server listens on (0 picks a free port).
+        registry (MetricsRegistry): Registry rendered on each scrape.
+    """
+
+    def __init__(self, logger: StructuredLogger, host: str = "127.0.0.1", port: int = 9464,  # noqa:E501
+                 registry: MetricsRegistry = REGISTRY) -> None:
+        self.logger = logger
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts serving '/metrics' on a background thread."""
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)  # noqa:E501
+        self._thread.start()
+        self.logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")  # noqa:E501
+
+    def stop(self) -> None:
+        """Stops the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class TextfileExporter:
+    """
+    Periodically writes the metrics registry to a file for the node_exporter
+    textfile collector. Files are replaced atomically.
+
+    Attributes:
+        logger (StructuredLogger): Logger for logging messages.
+        path (Path): File the metrics are written to.
+        interval (float): Time (in seconds) between writes.
+        registry (MetricsRegistry): Registry rendered on each write.
+    """
+
+    def __init__(self, logger: StructuredLogger, path: Path, interval: float = 15,
+                 registry: MetricsRegistry = REGISTRY) -> None:
+        self.logger = logger
+        self.path = path
+        self.interval = interval
+        self.registry = registry
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self) -> None:
+        """Writes the current metrics to the file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(self.path.name + ".part")
+        with open(partial, "w") as f:
+            f.write(self.registry.render())
+        os.replace(partial, self.path)
+
+    def start(self) -> None:
+        """Starts writing the metrics file on a background thread."""
+        def loop():
+            while not self._stop.wait(self.interval):
+                try:
+                    self.write()
+                except OSError as e:
+                    self.logger.error(f"Failed to write metrics file '{self.path}': {e}")  # noqa:E501
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=loop, name="metrics-textfile", daemon=True)  # noqa:E501
+        self._thread.start()
+        self.logger.info(f"Writing metrics to '{self.path}' every {self.interval}s")  # noqa:E501
+
+    def stop(self) -> None:
+        """Stops the background thread and writes the final metrics."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.write()
+
+
+def start_exporters(logger: StructuredLogger, cfg: MetricsConfig) -> List[Union[MetricsServer, TextfileExporter]]:  # noqa:E501
+    """
+    Starts the exporters enabled in the metrics configuration.
+
+    Args:
+        logger (StructuredLogger): Logger for logging messages.
+        cfg (MetricsConfig): Metrics configuration.
+
+    Returns:
+        List[Union[MetricsServer, TextfileExporter]]: The started exporters.
+    """
+    configure(proxy_labels=cfg.proxy_labels)
+    exporters = []
+    if cfg.port is not None:
+        exporters.append(MetricsServer(logger, cfg.host, cfg.port))
+    if cfg.textfile:
+        exporters.append(TextfileExporter(logger, cfg.textfile, cfg.textfile_interval))  # noqa:E501
+    for exporter in exporters:
+        exporter.start()
+    return exporters
+
+
+def stop_exporters(exporters: List[Union[MetricsServer, TextfileExporter]]) -> None:  # noqa:E501
+    """Stops the given exporters, writing out final metrics files."""
+    for exporter in exporters:
+        exporter.stop()
@@ -0,0 +1,125 @@
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from . import metrics
+
+OUTCOMES = ("first_try", "after_wait", "timeout")
+
+LocatorKey = Tuple[str, str, str, str]
+
+
+class LocatorStats:
+    """
+    Lookup statistics for a single locator.
+
+    Attributes:
+        target (str): The target the locator was used for.
+        source (str): Where the locator is configured, e.g. 'extraction'.
+        locator_type (str): The Selenium By-type of the locator.
+        locator (str): The locator string.
+        counts (Dict[str, int]): Lookups per outcome.
+        total_time (float): Time (in seconds) spent on all lookups.
+        wasted_time (float): Time (in seconds) spent on lookups that missed
+            the first find_element and waited or timed out.
+    """
+
+    __slots__ = ("target", "source", "locator_type", "locator", "counts",
+                 "total_time", "wasted_time")
+
+    def __init__(self, target: str, source: str, locator_type: str, locator: str) -> None:  # noqa:E501
+        self.target = target
+        self.source = source
+        self.locator_type = locator_type
+        self.locator = locator
+        self.counts = {outcome: 0 for outcome in OUTCOMES}
+        self.total_time = 0.0
+        self.wasted_time = 0.0
+
+    @property
+    def lookups(self) -> int:
+        return sum(self.counts.values())
+
+
+class LocatorProfiler:
+    """
+    Collects per-locator lookup statistics and ranks locators by the time
+    wasted waiting for elements that were not immediately present.
+    """
+
+    def __init__(self) -> None:
+        self._stats: Dict[LocatorKey, LocatorStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, locator: str, locator_type: str, outcome: str, elapsed: float) -> None:  # noqa:E501
+        """
+        Records a locator lookup. Target and source are taken from the
+        enclosing metrics scope.
+
+        Args:
+            locator (str): The locator string.
+            locator_type (str): The Selenium By-type of the locator.
+            outcome (str): One of 'first_try', 'after_wait' or 'timeout'.
+            elapsed (float): Time (in seconds) the lookup took.
+        """
+        labels = metrics.current_labels()
+        key = (labels.get("target", ""), labels.get("source", ""), locator_type, locator)  # noqa:E501
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = LocatorStats(*key)
+            stats.counts[outcome] += 1
+            stats.total_time += elapsed
+            if outcome != "first_try":
+                stats.wasted_time += elapsed
+
+    def ranked(self) -> List[LocatorStats]:
+        """Returns the locator statistics, most wasted time first."""
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=lambda s: (s.wasted_time, s.total_time), reverse=True)  # noqa:E501
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """
+        Renders a plain text table of locators ranked by wasted time.
+
+        Args:
+            limit (Optional[int]): Maximum number of locators to include.
+
+        Returns:
+            str: The report.
+        """
+        header = f"{'wasted_s':>10} {'total_s':>10} {'lookups':>8} {'first':>6} {'waited':>6} {'timeout':>7}  {'target':<16} {'source':<12} locator"  # noqa:E501
+        lines = [header]
+        for stats in self.ranked()[:limit]:
+            lines.append(
+                f"{stats.wasted_time:>10.3f} {stats.total_time:>10.3f} {stats.lookups:>8} "  # noqa:E501
+                f"{stats.counts['first_try']:>6} {stats.counts['after_wait']:>6} {stats.counts['timeout']:>7}  "  # noqa:E501
+                f"{stats.target:<16} {stats.source:<12} {stats.locator_type}={stats.locator}"  # noqa:E501
+            )
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path: Path, limit: Optional[int] = None) -> bool:
+        """
+        Writes the report to a file if any lookups were recorded.
+
+        Args:
+            path (Path): The report file.
+            limit (Optional[int]): Maximum number of locators to include.
+
+        Returns:
+            bool: True if a report was written.
+        """
+        with self._lock:
+            if not self._stats:
+                return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.report(limit))
+        return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+PROFILER = LocatorProfiler()
@@ -0,0 +1,466 @@
+import time
+import bisect
+import threading
+import contextvars
+from collections import deque
+from contextlib import ContextDecorator, contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple  # noqa:E501
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)  # noqa:E501
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: Sequence[str], values: Sequence[str]) -> str:
+    if not labelnames:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(labelnames, values))  # noqa:E501
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))  # noqa:E501
+
+
+class Metric:
+    """
+    Base class for labelled metrics rendered in the Prometheus text format.
+
+    Attributes:
+        name (str): The metric name.
+        documentation (str): Help text for the metric.
+        labelnames (Tuple[str, ...]): Names of the metric labels.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:  # noqa:E501
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:  # noqa:E501
+        """Yields (name, labelnames, labelvalues, value) for every sample."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for name, labelnames, values, value in self.samples():
+            lines.append(f"{name}{_format_labels(labelnames, values)} {_format_value(value)}")  # noqa:E501
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """A monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:  # noqa:E501
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def values(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def samples(self):
+        for key, value in sorted(self.values().items()):
+            yield self.name, self.labelnames, key, value
+
+
+class Gauge(Metric):
+    """A value that is set, e.g. a sampled resource usage."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:  # noqa:E501
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> Optional[float]:
+        with self._lock:
+            return self._values.get(self._key(labels))
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield self.name, self.labelnames, key, value
+
+
+class Histogram(Metric):
+    """A histogram of observed values with cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),  # noqa:E501
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._values: Dict[LabelValues, Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * len(self.buckets), 0.0)  # noqa:E501
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            counts, _ = self._values.get(self._key(labels), ([0], 0.0))
+            return sum(counts)
+
+    def counts(self) -> Dict[LabelValues, int]:
+        with self._lock:
+            return {key: sum(counts) for key, (counts, _) in self._values.items()}  # noqa:E501
+
+    def samples(self):
+        with self._lock:
+            values = {key: (list(counts), total) for key, (counts, total) in self._values.items()}  # noqa:E501
+        bucket_labels = self.labelnames + ("le",)
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f"{self.name}_bucket", bucket_labels, key + (_format_value(bound),), cumulative  # noqa:E501
+            yield f"{self.name}_sum", self.labelnames, key, total
+            yield f"{self.name}_count", self.labelnames, key, cumulative
+
+
+class WindowedRate(Metric):
+    """A gauge reporting events per second over a sliding window."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),  # noqa:E501
+                 window: float = 60) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.window = window
+        self._events: Dict[LabelValues, Deque[float]] = {}
+
+    def mark(self, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._events.setdefault(key, deque()).append(time.monotonic())
+
+    def rate(self, **labels: str) -> float:
+        return self._rates().get(self._key(labels), 0.0)
+
+    def _rates(self) -> Dict[LabelValues, float]:
+        cutoff = time.monotonic() - self.window
+        with self._lock:
+            for events in self._events.values():
+                while events and events[0] < cutoff:
+                    events.popleft()
+            return {key: len(events) / self.window for key, events in self._events.items()}  # noqa:E501
+
+    def samples(self):
+        for key, value in sorted(self._rates().items()):
+            yield self.name, self.labelnames, key, value
+
+
+class DerivedGauge(Metric):
+    """A gauge whose values are computed from other metrics at render time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 compute: Callable[[], Dict[LabelValues, float]]) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.compute = compute
+
+    def samples(self):
+        for key, value in sorted(self.compute().items()):
+            yield self.name, self.labelnames, key, value
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics of a run and renders them in the Prometheus text format.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric '{metric.name}' is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:  # noqa:E501
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:  # noqa:E501
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),  # noqa:E501
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def rate(self, name: str, documentation: str, labelnames: Sequence[str] = (),  # noqa:E501
+             window: float = 60) -> WindowedRate:
+        return self.register(WindowedRate(name, documentation, labelnames, window))  # noqa:E501
+
+    def derived(self, name: str, documentation: str, labelnames: Sequence[str],
+                compute: Callable[[], Dict[LabelValues, float]]) -> DerivedGauge:
+        return self.register(DerivedGauge(name, documentation, labelnames, compute))  # noqa:E501
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() for metric in metrics)
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "scraper_stage_duration_seconds",
+    "Time spent per scrape pipeline stage.",
+    ("stage", "target", "proxy"),
+)
+STAGE_ERRORS = REGISTRY.counter(
+    "scraper_stage_errors_total",
+    "Scrape pipeline stage executions that raised an error.",
+    ("stage", "target", "proxy"),
+)
+PAGES = REGISTRY.counter(
+    "scraper_pages_total",
+    "Pages loaded successfully.",
+    ("target", "proxy"),
+)
+PAGE_RATE = REGISTRY.rate(
+    "scraper_pages_per_second",
+    "Pages loaded per second over the last minute.",
+    ("target", "proxy"),
+)
+RETRIES = REGISTRY.counter(
+    "scraper_retries_total",
+    "Retry decisions by operation and outcome (retried, exhausted, budget_exhausted or deadline_exceeded).",  # noqa:E501
+    ("operation", "target", "outcome"),
+)
+FAILED_LINKS = REGISTRY.counter(
+    "scraper_failed_links_total",
+    "Failed link attempts by reason and outcome (queued, dead_lettered or recovered).",  # noqa:E501
+    ("target", "reason", "outcome"),
+)
+LINK_ABORTS = REGISTRY.counter(
+    "scraper_link_aborts_total",
+    "Links aborted by the watchdog by action (driver_quit or container_recycled).",  # noqa:E501
+    ("target", "action"),
+)
+DRIVER_RECYCLES = REGISTRY.counter(
+    "scraper_driver_recycles_total",
+    "Drivers replaced by the recycling policy by reason (pages, age or memory).",  # noqa:E501
+    ("target", "reason"),
+)
+CONTAINER_UP = REGISTRY.gauge(
+    "scraper_container_up",
+    "1 if the browser container of the target is running and responsive, else 0.",  # noqa:E501
+    ("target",),
+)
+CONTAINER_MEMORY = REGISTRY.gauge(
+    "scraper_container_memory_bytes",
+    "Memory used by the browser container, without the page cache.",
+    ("target",),
+)
+CONTAINER_MEMORY_LIMIT = REGISTRY.gauge(
+    "scraper_container_memory_limit_bytes",
+    "Memory limit of the browser container.",
+    ("target",),
+)
+CONTAINER_CPU = REGISTRY.gauge(
+    "scraper_container_cpu_cores",
+    "CPU used by the browser container, in cores.",
+    ("target",),
+)
+CONTAINER_RESTARTS = REGISTRY.counter(
+    "scraper_container_restarts_total",
+    "Browser containers restarted by the monitor by reason (oom, crashed, missing or unresponsive).",  # noqa:E501
+    ("target", "reason"),
+)
+OCR_CACHE = REGISTRY.counter(
+    "scraper_ocr_cache_lookups_total",
+    "OCR result cache lookups by result (memory_hit, disk_hit or miss).",
+    ("target", "result"),
+)
+
+
+def _error_ratios() -> Dict[LabelValues, float]:
+    executions: Dict[LabelValues, int] = {}
+    errors: Dict[LabelValues, float] = {}
+    for (stage, target, _), count in STAGE_SECONDS.counts().items():
+        executions[(stage, target)] = executions.get((stage, target), 0) + count
+    for (stage, target, _), count in STAGE_ERRORS.values().items():
+        errors[(stage, target)] = errors.get((stage, target), 0) + count
+    return {key: errors.get(key, 0) / count for key, count in executions.items() if count}  # noqa:E501
+
+
+REGISTRY.derived(
+    "scraper_stage_error_ratio",
+    "Share of stage executions that raised an error.",
+    ("stage", "target"),
+    _error_ratios,
+)
+
+
+def _ocr_cache_hit_ratios() -> Dict[LabelValues, float]:
+    lookups: Dict[LabelValues, float] = {}
+    hits: Dict[LabelValues, float] = {}
+    for (target, result), count in OCR_CACHE.values().items():
+        lookups[(target,)] = lookups.get((target,), 0) + count
+        if result != "miss":
+            hits[(target,)] = hits.get((target,), 0) + count
+    return {key: hits.get(key, 0) / count for key, count in lookups.items() if count}  # noqa:E501
+
+
+REGISTRY.derived(
+    "scraper_ocr_cache_hit_ratio",
+    "Share of OCR cache lookups answered without running Tesseract.",
+    ("target",),
+    _ocr_cache_hit_ratios,
+)
+
+_labels: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar("metric_labels", default={})  # noqa:E501
+_settings = {"proxy_labels": True}
+
+
+def configure(proxy_labels: bool = True) -> None:
+    """
+    Sets global metric options.
+
+    Args:
+        proxy_labels (bool): If False, the proxy label is left empty to bound label cardinality.
+    """  # noqa:E501
+    _settings["proxy_labels"] = proxy_labels
+
+
+def current_labels() -> Dict[str, str]:
+    """Returns the labels set by the enclosing scopes."""
+    return _labels.get()
+
+
+@contextmanager
+def scope(**labels: Optional[str]):
+    """
+    Sets target/proxy labels for metrics recorded within the block.
+
+    Args:
+        **labels: Label values, e.g. target='books', proxy='1.2.3.4:80'.
+    """
+    if not _settings["proxy_labels"]:
+        labels.pop("proxy", None)
+    merged = {**_labels.get(), **{key: value for key, value in labels.items() if value is not None}}  # noqa:E501
+    token = _labels.set(merged)
+    try:
+        yield
+    finally:
+        _labels.reset(token)
+
+
+class track(ContextDecorator):
+    """
+    Times a pipeline stage and counts it as an error if it raises.
+    Usable as a context manager or a decorator.
+
+    Args:
+        stage (str): The pipeline stage name, e.g. 'navigation' or 'parse'.
+    """
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+        self._start = 0.0
+
+    def _recreate_cm(self):
+        # A fresh instance per decorated call keeps concurrent calls apart
+        return type(self)(self.stage)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._start
+        labels = {**_labels.get(), "stage": self.stage}
+        STAGE_SECONDS.observe(elapsed, **labels)
+        if exc_type is not None:
+            STAGE_ERRORS.inc(**labels)
+        return False
+
+
+def record_page() -> None:
+    """Counts a successfully loaded page for the current target and proxy."""
+    labels = _labels.get()
+    PAGES.inc(**labels)
+    PAGE_RATE.mark(**labels)
+
+
+def record_ocr_cache(result: str) -> None:
+    """Counts an OCR cache lookup for the current target."""
+    OCR_CACHE.inc(**_labels.get(), result=result)
+
+
+def record_retry(operation: str, outcome: str) -> None:
+    """Counts a retry decision for the current target."""
+    RETRIES.inc(**_labels.get(), operation=operation, outcome=outcome)
+
+
+def record_failed_link(reason: str, outcome: str) -> None:
+    """Counts a failed link attempt, or a recovered link, for the current target."""  # noqa:E501
+    FAILED_LINKS.inc(**_labels.get(), reason=reason, outcome=outcome)
+
+
+def record_link_abort(action: str) -> None:
+    """Counts a link the watchdog aborted, for the current target."""
+    LINK_ABORTS.inc(**_labels.get(), action=action)
+
+
+def record_driver_recycle(reason: str) -> None:
+    """Counts a driver replaced by the recycling policy, for the current target."""  # noqa:E501
+    DRIVER_RECYCLES.inc(**_labels.get(), reason=reason)
+
+
+def record_container(up: bool, memory: Optional[int] = None, memory_limit: Optional[int] = None,  # noqa:E501
+                     cpu: Optional[float] = None) -> None:
+    """Sets the state and the sampled resource usage of the current target's container."""  # noqa:E501
+    labels = _labels.get()
+    CONTAINER_UP.set(1 if up else 0, **labels)
+    for gauge, value in ((CONTAINER_MEMORY, memory), (CONTAINER_MEMORY_LIMIT, memory_limit), (CONTAINER_CPU, cpu)):  # noqa:E501
+        if value is not None:
+            gauge.set(value, **labels)
+
+
+def record_container_restart(reason: str) -> None:
+    """Counts a container restart of the current target."""
+    CONTAINER_RESTARTS.inc(**_labels.get(), reason=reason)
@@ -0,0 +1,119 @@
+import re
+import sys
+import pstats
+import cProfile
+import threading
+from pathlib import Path
+from datetime import datetime
+from collections import Counter
+from contextlib import contextmanager
+from types import FrameType
+from typing import Dict, Iterator, Optional
+
+from scraper.config.logging import StructuredLogger
+
+
+class StackSampler:
+    """
+    Samples the call stacks of all running threads at a fixed interval and
+    aggregates them in the collapsed stack format used by flamegraph tools.
+
+    Attributes:
+        interval (float): Time (in seconds) between samples.
+        stacks (Counter): Sample counts keyed by collapsed stack.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)  # noqa:E501
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self.stacks[self._collapse(names.get(thread_id, str(thread_id)), frame)] += 1  # noqa:E501
+
+    @staticmethod
+    def _collapse(thread_name: str, frame: Optional[FrameType]) -> str:
+        frames = []
+        while frame is not None:
+            # Without line numbers, so samples of a function merge into one frame  # noqa:E501
+            module = frame.f_globals.get("__name__") or Path(frame.f_code.co_filename).stem  # noqa:E501
+            frames.append(f"{module}:{frame.f_code.co_name}")
+            frame = frame.f_back
+        frames.append(thread_name)
+        return ";".join(reversed(frames))
+
+    def write(self, path: Path) -> None:
+        with open(path, "w") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    """
+    Profiles sections of a run, writing a pstats file (deterministic, from
+    cProfile) and a collapsed stack file (sampled) for each section.
+
+    Attributes:
+        logger (StructuredLogger): Logger for logging messages.
+        output_directory (Path): Directory the profile files are written to.
+        interval (float): Time (in seconds) between stack samples.
+        outputs (Dict[str, Dict[str, Path]]): Files written, keyed by section.
+    """
+
+    def __init__(self, logger: StructuredLogger, output_directory: Path, interval: float = 0.005) -> None:  # noqa:E501
+        self.logger = logger
+        self.output_directory = output_directory
+        self.interval = interval
+        self.outputs: Dict[str, Dict[str, Path]] = {}
+        self._stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    @contextmanager
+    def profile(self, section: str) -> Iterator[None]:
+        """
+        Profiles the enclosed block as the given section.
+
+        Args:
+            section (str): Section name, e.g. a target name.
+        """
+        profiler = cProfile.Profile()
+        sampler = StackSampler(self.interval)
+        sampler.start()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            sampler.stop()
+            self._write(section, profiler, sampler)
+
+    def _write(self, section: str, profiler: cProfile.Profile, sampler: StackSampler) -> None:  # noqa:E501
+        try:
+            self.output_directory.mkdir(parents=True, exist_ok=True)
+            stem = f"{self._stamp}_{re.sub(r'[^A-Za-z0-9_.-]', '_', section)}"
+            outputs = {
+                "pstats": self.output_directory / f"{stem}.pstats",
+                "collapsed": self.output_directory / f"{stem}.collapsed",
+            }
+            pstats.Stats(profiler).dump_stats(outputs["pstats"])
+            sampler.write(outputs["collapsed"])
+            self.outputs[section] = outputs
+            self.logger.info(f"Profile for '{section}' written to: {outputs['pstats']}, {outputs['collapsed']}")  # noqa:E501
+        except Exception as e:
+            self.logger.error(f"Failed to write profile for '{section}': {e}", exc_info=True)  # noqa:E501
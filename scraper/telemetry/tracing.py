@@ -0,0 +1,186 @@
+import os
+import json
+import time
+import threading
+import contextvars
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+SERVICE_NAME = "scraper"
+SCOPE_NAME = "scraper.telemetry.tracing"
+
+# OTLP enum values, which the JSON encoding writes as integers
+SPAN_KIND_INTERNAL = 1
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+
+class Span:
+    """
+    A timed operation within a trace, serialised as an OpenTelemetry
+    (OTLP/JSON) span.
+
+    Attributes:
+        name (str): The operation name.
+        trace_id (str): 32 hex character id shared by all spans of a trace.
+        span_id (str): 16 hex character id of this span.
+        parent_span_id (str): Id of the parent span, empty for a root span.
+        attributes (Dict[str, Any]): Key/value details of the operation.
+    """
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_span_id", "attributes",
+                 "start_time", "end_time", "error")
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: str = "",
+                 attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.attributes = {key: value for key, value in (attributes or {}).items() if value is not None}  # noqa:E501
+        self.start_time = time.time_ns()
+        self.end_time = 0
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        self.end_time = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        status = {"code": STATUS_CODE_ERROR, "message": self.error} if self.error else {"code": STATUS_CODE_OK}  # noqa:E501
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": [_attribute(key, value) for key, value in self.attributes.items()],  # noqa:E501
+            "status": status,
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+def export_request(spans: List[Span]) -> Dict[str, Any]:
+    """
+    Wraps spans in an OTLP/JSON ExportTraceServiceRequest, the payload an
+    OTLP/HTTP collector accepts and its file exporter writes per line.
+
+    Args:
+        spans (List[Span]): The finished spans.
+    """
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},  # noqa:E501
+            "scopeSpans": [{
+                "scope": {"name": SCOPE_NAME},
+                "spans": [span.to_dict() for span in spans],
+            }],
+        }],
+    }
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class JsonlSpanExporter:
+    """
+    Appends finished spans to a JSON Lines file, one OTLP/JSON export
+    request holding a single span per line.
+
+    Attributes:
+        path (Path): File the spans are written to.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "a")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(export_request([span]), separators=(",", ":")) + "\n"  # noqa:E501
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)  # noqa:E501
+_exporter: Optional[JsonlSpanExporter] = None
+
+
+def configure(path: Optional[Path]) -> None:
+    """
+    Enables span export to the given JSONL file, or disables tracing if None.
+
+    Args:
+        path (Optional[Path]): The span output file.
+    """
+    global _exporter
+    shutdown()
+    _exporter = JsonlSpanExporter(path) if path else None
+
+
+def shutdown() -> None:
+    """Closes the span exporter, disabling tracing."""
+    global _exporter
+    if _exporter:
+        _exporter.close()
+        _exporter = None
+
+
+def current_span() -> Optional[Span]:
+    """Returns the innermost active span, if any."""
+    return _current.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Records a span for the enclosed block as a child of the current span, or
+    as the root of a new trace. Yields None when tracing is disabled.
+
+    Args:
+        name (str): The operation name, e.g. 'scrape_link' or 'extraction'.
+        **attributes: Span attributes; None values are dropped.
+    """
+    exporter = _exporter
+    if exporter is None:
+        yield None
+        return
+    parent = _current.get()
+    if parent is None:
+        current = Span(name, os.urandom(16).hex(), attributes=attributes)
+    else:
+        current = Span(name, parent.trace_id, parent.span_id, attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.end(e)
+        raise
+    else:
+        current.end()
+    finally:
+        _current.reset(token)
+        exporter.export(current)
@@ -1,7 +1,10 @@
-from typing import Optional
-from docker.models.containers import Container
+import time
+from typing import TYPE_CHECKING, Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 
+if TYPE_CHECKING:
+    from docker.models.containers import Container
+
 
 class ConnectionData:
     """
@@ -16,29 +19,34 @@ class ConnectionData:
         proxy (Optional[str]): The proxy used by the connection.
         container (Optional[Container]): The Docker container associated with the connection.
         driver (Optional[WebDriver]): The WebDriver instance used by the connection.
+        pages (int): Pages loaded by the current driver.
+        driver_created_at (float): Monotonic time the current driver was set.
     """  # noqa:E501
 
     def __init__(self, name: str, port: str, proxy: Optional[str] = None,
-                 container: Optional[Container] = None, driver: Optional[WebDriver] = None):  # noqa:E501
+                 container: Optional["Container"] = None, driver: Optional[WebDriver] = None):  # noqa:E501
         self.name = name
         self.port = port
         self.proxy = proxy
         self.container = container
         self.driver = driver
+        self.pages = 0
+        self.driver_created_at = time.monotonic()
 
-    def set_container(self, container: Container):
+    def set_container(self, container: "Container"):
         """
         Sets the Docker container for the connection.
 
         Args:
             container (Container): The Docker container to associate with the connection.
         """  # noqa:E501
+        from docker.models.containers import Container
         if isinstance(container, Container):
             self.container = container
         else:
             raise TypeError(f"Expected 'Container', got '{type(container).__name__}'")
 
-    def get_container(self) -> Container:
+    def get_container(self) -> "Container":
         """
         Retrieves the Docker container associated with the connection.
 
@@ -48,6 +56,9 @@ class ConnectionData:
         Raises:
             ValueError: If the container has not been set.
         """
+        if self.container is None:
+            raise ValueError(f"Container not set for connection '{self.name}'")
+        from docker.models.containers import Container
         if isinstance(self.container, Container):
             return self.container
         else:
@@ -62,6 +73,8 @@ class ConnectionData:
         """
         if isinstance(driver, WebDriver):
             self.driver = driver
+            self.pages = 0
+            self.driver_created_at = time.monotonic()
         else:
             raise TypeError(f"Expected 'WebDriver', got '{type(driver).__name__}'")
 
@@ -105,3 +118,7 @@ class ConnectionData:
             return self.proxy
         else:
             raise ValueError(f"Proxy not set for connection '{self.name}'")
+
+    def driver_age(self) -> float:
+        """Returns the time (in seconds) since the current driver was set."""
+        return time.monotonic() - self.driver_created_at
@@ -1,14 +1,24 @@
-from typing import Dict
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+from urllib.parse import urlsplit
 from selenium.webdriver.remote.webdriver import WebDriver
-from docker.models.containers import Container
+from selenium.common.exceptions import TimeoutException
 
+from scraper.config import retry
 from scraper.config.logging import StructuredLogger
 from scraper.config.validator import ProxyConfig, DockerConfig, DriverConfig
+from scraper.telemetry import metrics, tracing
 
 from .docker import DockerManager
 from .driver import DriverManager
 from .connection import ConnectionData
-from .proxy import ProxyManager, UsageError
+from .monitor import ContainerMonitor
+from .proxy import ProxyManager, UsageError, proxy_address
+from .recycle import RECYCLE_ENVIRONMENT, DriverRecycler
+from .session import SessionState, SessionStore
+
+if TYPE_CHECKING:
+    from docker.models.containers import Container
 
 
 class WebController:
@@ -22,14 +32,24 @@ class WebController:
         driver_manager (DriverManager): Manager for handling WebDriver instances.
         proxy_manager (ProxyManager): Manager for handling proxy servers.
         connections (Dict[str, ConnectionData]): Dictionary mapping target names to their ConnectionData.
+        sessions (Optional[SessionStore]): Session snapshots restored into every new driver of a target.
+        recycler (Optional[DriverRecycler]): Replaces drivers that loaded too many pages, got too old or whose container uses too much memory.
+        monitor (Optional[ContainerMonitor]): Restarts containers that died or stopped responding.
     """  # noqa:E501
 
-    def __init__(self, logger: StructuredLogger, connections: Dict[str, ConnectionData]) -> None:  # noqa:E501
+    def __init__(self, logger: StructuredLogger, connections: Dict[str, ConnectionData],  # noqa:E501
+                 sessions: Optional[SessionStore] = None) -> None:
         self.logger = logger
         self.docker_manager = None
         self.driver_manager = None
         self.proxy_manager = None
         self.connections = connections
+        self.sessions = sessions
+        self.recycler = None
+        self.monitor = None
+        self._pending_restarts: Dict[str, str] = {}
+        # Serializes reconnects of a connection, e.g. by the monitor and its scraping thread  # noqa:E501
+        self._locks = {name: threading.RLock() for name in connections}
 
     def _connect_container(self, connection: ConnectionData) -> None:
         """
@@ -62,11 +82,54 @@ class WebController:
             driver = self.driver_manager.create_driver(connection)
             if driver:
                 connection.set_driver(driver)
+                self._restore_session(connection)
             else:
                 raise RuntimeError(f"Failed to set driver for '{connection.name}'")
         except Exception as e:
             self.logger.error(f"Failed to connect driver for '{connection.name}': {e}", exc_info=True)  # noqa:E501
 
+    def _restore_session(self, connection: ConnectionData, driver: Optional[WebDriver] = None) -> None:  # noqa:E501
+        """
+        Injects the session snapshot of the connection's target, if any, into
+        its new driver. A snapshot that fails to apply is discarded, so the
+        startup actions run again.
+
+        Args:
+            connection (ConnectionData): The connection with the new driver.
+            driver (Optional[WebDriver]): The new driver, if it is not yet set on the connection.
+        """  # noqa:E501
+        state = self.sessions.get(connection.name) if self.sessions else None
+        if state is None:
+            return
+        with tracing.span("restore_session", target=connection.name, origin=state.origin):  # noqa:E501
+            try:
+                skipped = state.apply(driver or connection.driver)
+                self.logger.info(f"Restored session for '{connection.name}' ({len(state.cookies) - skipped} cookies)")  # noqa:E501
+            except Exception as e:
+                self.logger.warning(f"Failed to restore session for '{connection.name}': {e}", exc_info=True)  # noqa:E501
+                self.sessions.discard(connection.name)
+
+    def save_session(self, target_name: str) -> None:
+        """
+        Snapshots the cookies and storage of a target's driver, e.g. after
+        its startup actions, to restore into drivers created later.
+
+        Args:
+            target_name (str): The name of the target.
+        """
+        if not self.sessions:
+            return
+        try:
+            state = SessionState.capture(self.get_driver(target_name))
+            self.sessions.save(target_name, state)
+            self.logger.info(f"Saved session for '{target_name}' ({len(state.cookies)} cookies)")  # noqa:E501
+        except Exception as e:
+            self.logger.warning(f"Failed to save session for '{target_name}': {e}", exc_info=True)  # noqa:E501
+
+    def has_session(self, target_name: str) -> bool:
+        """Returns True if a fresh session snapshot exists for the target."""
+        return bool(self.sessions and self.sessions.get(target_name))
+
     def init_docker_manager(self, cfg: DockerConfig) -> None:
         """
         Initializes the DockerManager with the given configuration.
@@ -75,6 +138,8 @@ class WebController:
             cfg (DockerConfig): The Docker configuration.
         """
         self.docker_manager = DockerManager(self.logger, cfg)
+        if cfg.monitor_interval:
+            self.monitor = ContainerMonitor(self.logger, self, cfg.monitor_interval, cfg.monitor_failures, cfg.monitor_timeout)  # noqa:E501
 
     def init_driver_manager(self, cfg: DriverConfig) -> None:
         """
@@ -83,7 +148,11 @@ class WebController:
         Args:
             cfg (DriverConfig): The WebDriver configuration.
         """
-        self.driver_manager = DriverManager(self.logger, cfg)
+        # The pool holds bare addresses, the driver adds the proxy credentials
+        authentication = self.proxy_manager.authentication if self.proxy_manager else None  # noqa:E501
+        self.driver_manager = DriverManager(self.logger, cfg, authentication)
+        if DriverRecycler.enabled(cfg):
+            self.recycler = DriverRecycler(self.logger, self.driver_manager, self.docker_manager, cfg)  # noqa:E501
 
     def init_proxy_manager(self, cfg: ProxyConfig) -> None:
         """
@@ -121,7 +190,7 @@ class WebController:
         except Exception as e:
             raise ValueError(f"No driver found for target {target_name}") from e
 
-    def get_container(self, target_name: str) -> Container:
+    def get_container(self, target_name: str) -> "Container":
         connection = self.connections.get(target_name)
         try:
             container = connection.get_container()
@@ -145,13 +214,184 @@ class WebController:
             raise RuntimeError("Connection managers not initialized properly.")
         for target, connection in self.connections.items():
             try:
-                proxy = self.proxy_manager.get_proxy()
-                connection.set_proxy(proxy)
-                self._connect_container(connection)
-                self._connect_driver(connection)
+                self._connect(connection)
             except Exception as e:
                 self.logger.critical(f"Failed to connect for target '{target}': {e}", exc_info=True)  # noqa:E501
                 return
+        if self.monitor:
+            self.monitor.start()
+
+    def _connect(self, connection: ConnectionData) -> None:
+        """Sets up the proxy, container and driver of a single connection."""
+        proxy = self.proxy_manager.get_proxy()
+        connection.set_proxy(proxy)
+        self._connect_container(connection)
+        self._connect_driver(connection)
+
+    def ensure_connected(self, target_name: str) -> None:
+        """
+        Reconnects the connection of a target if its container or driver is
+        missing, e.g. after a failed start. Used to keep long-running
+        connections usable between runs. A driver missing from a running
+        container, e.g. after an abort, is replaced on the same proxy.
+
+        Args:
+            target_name (str): The name of the target.
+
+        Raises:
+            ValueError: If no connection is found for the target name.
+        """
+        connection = self.get_connection(target_name)
+        with self._lock(target_name):
+            if connection.container and connection.driver:
+                return
+            if connection.container and connection.proxy:
+                self.logger.warning(f"Reconnecting driver of '{target_name}'")
+                self._connect_driver(connection)
+                return
+            self.logger.warning(f"Reconnecting '{target_name}'")
+            if connection.driver:
+                self.driver_manager.quit_driver(connection.driver)
+                connection.driver = None
+            if connection.container:
+                self.docker_manager.cleanup(connection.container)
+                connection.container = None
+            if connection.proxy and connection.proxy in self.proxy_manager.proxy_pool:  # noqa:E501
+                self.proxy_manager.release_proxy(connection.proxy)
+            connection.proxy = None
+            self._connect(connection)
+
+    def _lock(self, target_name: str) -> threading.RLock:
+        return self._locks.setdefault(target_name, threading.RLock())
+
+    def restart(self, target_name: str, reason: str) -> None:
+        """
+        Replaces the container and driver of a target, e.g. after the
+        container was OOM killed or stopped responding. The old driver is
+        dropped without quitting it, as its server is gone or hung; a link
+        being scraped on it fails and is requeued.
+
+        Args:
+            target_name (str): The name of the target.
+            reason (str): Why the container is restarted, for the log.
+        """
+        connection = self.get_connection(target_name)
+        with self._lock(target_name):
+            self.logger.warning(f"Restarting container of '{target_name}' ({reason})")  # noqa:E501
+            container, connection.container = connection.container, None
+            connection.driver = None
+            if container is not None:
+                try:
+                    self.docker_manager.cleanup(container)
+                except Exception as e:
+                    self.logger.warning(f"Failed to clean up container of '{target_name}': {e}", exc_info=True)  # noqa:E501
+            self.ensure_connected(target_name)
+
+    def request_restart(self, target_name: str, reason: str) -> bool:
+        """
+        Marks the container of a target for a restart, which its link loop
+        applies between links through apply_restart, so the monitor never
+        swaps the driver out from under a page being scraped. A link stuck on
+        a hung container is left to the link watchdog.
+
+        Args:
+            target_name (str): The name of the target.
+            reason (str): Why the container is restarted, for the log.
+
+        Returns:
+            bool: True if no restart was pending yet.
+        """
+        with self._lock(target_name):
+            if target_name in self._pending_restarts:
+                return False
+            self._pending_restarts[target_name] = reason
+            return True
+
+    def restart_pending(self, target_name: str) -> bool:
+        """Returns True if a restart of the container of a target was requested."""  # noqa:E501
+        return target_name in self._pending_restarts
+
+    def apply_restart(self, target_name: str) -> bool:
+        """
+        Restarts the container of a target if the monitor requested it.
+
+        Args:
+            target_name (str): The name of the target.
+
+        Returns:
+            bool: True if the container was restarted.
+        """
+        with self._lock(target_name):
+            reason = self._pending_restarts.pop(target_name, None)
+            if reason is None:
+                return False
+            self.restart(target_name, reason)
+            return True
+
+    def abort(self, target_name: str, grace: float = 10) -> bool:
+        """
+        Aborts whatever the driver of a target is doing, e.g. a page that
+        stopped responding, by quitting the driver from the calling thread;
+        a call blocked on it then fails. A driver that does not quit within
+        the grace period is considered hung, and its container is recycled
+        instead, which closes the connection the blocked call waits on. The
+        connection is left without a driver (and container), for
+        ensure_connected to replace.
+
+        Args:
+            target_name (str): The name of the target.
+            grace (float): Time (in seconds) the driver gets to quit.
+
+        Returns:
+            bool: True if the driver quit, False if its container was recycled.
+        """  # noqa:E501
+        connection = self.get_connection(target_name)
+        driver, connection.driver = connection.driver, None
+        if driver is None:
+            return True
+        quitter = threading.Thread(target=self.driver_manager.quit_driver, args=(driver,),  # noqa:E501
+                                   name=f"abort-{target_name}", daemon=True)
+        quitter.start()
+        quitter.join(grace)
+        if not quitter.is_alive():
+            self.logger.warning(f"Aborted driver of '{target_name}'")
+            metrics.record_link_abort("driver_quit")
+            return True
+        self.logger.error(f"Driver of '{target_name}' is unresponsive, recycling its container")  # noqa:E501
+        container, connection.container = connection.container, None
+        if container is not None:
+            try:
+                self.docker_manager.cleanup(container)
+            except Exception as e:
+                self.logger.warning(f"Failed to clean up container of '{target_name}': {e}", exc_info=True)  # noqa:E501
+        metrics.record_link_abort("container_recycled")
+        return False
+
+    def recycle_driver(self, target_name: str) -> bool:
+        """
+        Swaps in a fresh driver for a target once the recycling policy
+        prepared one, and starts preparing one when the driver is due. Called
+        between links, so no page is lost; the old driver is quit in the
+        background.
+
+        Args:
+            target_name (str): The name of the target.
+
+        Returns:
+            bool: True if the driver was replaced.
+        """
+        connection = self.get_connection(target_name)
+        with self._lock(target_name):
+            if not (self.recycler and connection.driver and connection.container):  # noqa:E501
+                return False
+            new_driver = self.recycler.poll(connection, lambda driver: self._restore_session(connection, driver))  # noqa:E501
+            if new_driver is None:
+                return False
+            old_driver = connection.driver
+            connection.set_driver(new_driver)
+        self.recycler.retire(old_driver)
+        self.logger.info(f"'{target_name}' swapped in a recycled driver")
+        return True
 
     def disconnect(self) -> None:
         """
@@ -160,6 +400,8 @@ class WebController:
         """  # noqa:E501
         if not (self.proxy_manager and self.docker_manager and self.driver_manager):
             raise RuntimeError("Managers not found")
+        if self.monitor:
+            self.monitor.stop()
         for _, connection in self.connections.items():
             try:
                 if connection.driver:
@@ -170,8 +412,11 @@ class WebController:
                     self.proxy_manager.release_proxy(connection.proxy)
             except Exception as e:
                 self.logger.warning(f"Failed to disconnect: {e}", exc_info=True)
+        if self.recycler:
+            self.recycler.close()
+        self.proxy_manager.close()
 
-    def make_request(self, target_name: str, url: str) -> None:
+    def make_request(self, target_name: str, url: str) -> bool:
         """
         Makes a web request to the given URL using the WebDriver of the specified target.
 
@@ -179,51 +424,82 @@ class WebController:
             target_name (str): The name of the target connection to use.
             url (str): The URL to request.
 
+        Returns:
+            bool: True if the page loaded, False if the request failed and was logged.
+
         Raises:
             RuntimeError: If no connection is found for the target name.
         """  # noqa:E501
         if not self.proxy_manager:
             raise RuntimeError("Unable to access ProxyManager")
         connection = self.get_connection(target_name)
-        driver = connection.driver
-        if driver:
-            try:
-                driver.get(url)
+        if not connection.driver:
+            raise RuntimeError(f"No WebDriver found for connection '{target_name}'")
+        domain = urlsplit(url).hostname
+        policy = retry.current_policy()
+        with tracing.span("make_request", url=url, proxy=proxy_address(connection.proxy)) as span:  # noqa:E501
+
+            def navigate() -> None:
+                with metrics.scope(target=target_name, proxy=proxy_address(connection.proxy)):  # noqa:E501
+                    with metrics.track("navigation"):
+                        connection.driver.get(url)
+                    connection.pages += 1
+                    metrics.record_page()
+
+            def request() -> None:
+                # Page load timeouts are retried with backoff on the same proxy
+                policy.call(navigate, "navigation", (TimeoutException,))
                 if connection.proxy:
-                    self.proxy_manager.increment_usage(connection.proxy)
-            except UsageError:
-                self.rotate_proxy(connection)
-                self.make_request(target_name, url)
+                    self.proxy_manager.increment_usage(connection.proxy, domain)  # noqa:E501
+
+            def rotate(error: BaseException, attempt: int, delay: float) -> None:  # noqa:E501
+                if span:
+                    span.set_attribute("proxy_rotated", True)
+                self.rotate_proxy(connection, domain)
+
+            try:
+                # A used-up proxy is replaced and the request repeated at once
+                policy.call(request, "proxy_rotation", (UsageError,), rotate, backoff=False)  # noqa:E501
+                return True
             except Exception as e:
+                if span:
+                    span.set_attribute("error", str(e))
                 self.logger.error(f"Request to '{url}' for '{target_name}' failed: {e}", exc_info=True)  # noqa:E501
-        else:
-            raise RuntimeError(f"No WebDriver found for connection '{target_name}'")
+                return False
 
-    def rotate_proxy(self, connection: ConnectionData) -> None:
+    def rotate_proxy(self, connection: ConnectionData, domain: Optional[str] = None) -> None:  # noqa:E501
         """
         Rotates the proxy for the given connection and updates the WebDriver.
+        The previous proxy is released back to the pool if it is still there.
 
         Args:
             connection (ConnectionData): The connection for which to rotate the proxy.
+            domain (Optional[str]): The domain the new proxy will be used for.
 
         Raises:
             RuntimeError: If the new proxy or driver cannot be set.
         """
         if not (self.proxy_manager and self.driver_manager):
             raise RuntimeError("ProxyManager or DriverManager not found.")
-        try:
-            new_proxy = self.proxy_manager.get_proxy()
-            connection.set_proxy(new_proxy)
-            if connection.driver:
-                self.driver_manager.quit_driver(connection.driver)
-            new_driver = self.driver_manager.create_driver(connection)
-            if new_driver:
-                connection.set_driver(new_driver)
-                self.logger.info(f"'{connection.name}' rotated proxy")
-            else:
-                raise RuntimeError(f"Failed to reload driver for '{connection.name}'")
-        except Exception as e:
-            self.logger.critical(f"Failed to rotate proxy for connection '{connection.name}': {e}", exc_info=True)  # noqa:E501
+        # A restart by the monitor must not interleave with the rotation
+        with self._lock(connection.name):
+            try:
+                old_proxy = connection.proxy
+                new_proxy = self.proxy_manager.get_proxy(domain)
+                connection.set_proxy(new_proxy)
+                if old_proxy and old_proxy in self.proxy_manager.proxy_pool:
+                    self.proxy_manager.release_proxy(old_proxy)
+                if connection.driver:
+                    self.driver_manager.quit_driver(connection.driver)
+                new_driver = self.driver_manager.create_driver(connection)
+                if new_driver:
+                    connection.set_driver(new_driver)
+                    self._restore_session(connection)
+                    self.logger.info(f"'{connection.name}' rotated proxy")
+                else:
+                    raise RuntimeError(f"Failed to reload driver for '{connection.name}'")
+            except Exception as e:
+                self.logger.critical(f"Failed to rotate proxy for connection '{connection.name}': {e}", exc_info=True)  # noqa:E501
 
 
 def setup_controller(logger: StructuredLogger, cfg) -> WebController:
@@ -244,8 +520,14 @@ def setup_controller(logger: StructuredLogger, cfg) -> WebController:
     for target in cfg["target"]:
         port = cfg["docker"].ports.pop(0)  # Assume ports are assigned in order
         connections[target.name] = ConnectionData(target.name, port)
-    controller = WebController(logger, connections)
+    sessions = None
+    if cfg["session"].enabled:
+        sessions = SessionStore(cfg["session"].directory, cfg["session"].max_age)
+    controller = WebController(logger, connections, sessions)
     controller.init_proxy_manager(cfg["proxy"])
     controller.init_docker_manager(cfg["docker"])
     controller.init_driver_manager(cfg["driver"])
+    if controller.recycler:
+        # Settings given in the config take precedence
+        controller.docker_manager.environment = {**RECYCLE_ENVIRONMENT, **(controller.docker_manager.environment or {})}  # noqa:E501
     return controller
@@ -1,14 +1,44 @@
-import docker
-
-from typing import Optional
-from docker.models.containers import Container
-from docker.errors import ContainerError, APIError, NotFound
+from typing import TYPE_CHECKING, Dict, Optional
 
 from scraper.config.logging import StructuredLogger
 from scraper.config.validator import DockerConfig
 
 from .connection import ConnectionData
 
+if TYPE_CHECKING:
+    from docker.models.containers import Container
+
+# CFS scheduler period (in microseconds) the CPU quota is a share of
+CPU_PERIOD = 100_000
+
+
+class ContainerStats:
+    """
+    State and resource usage of a container at one point in time.
+
+    Attributes:
+        status (str): Docker status, e.g. 'running', 'exited' or 'missing' once removed.
+        oom_killed (bool): True if the kernel killed the container for exceeding its memory limit.
+        exit_code (Optional[int]): Exit code of a stopped container.
+        memory_usage (Optional[int]): Memory used (in bytes), without the page cache.
+        memory_limit (Optional[int]): Memory limit (in bytes) of the container.
+        cpu (Optional[float]): CPU used since the previous sample, in cores.
+    """  # noqa:E501
+
+    def __init__(self, status: str, oom_killed: bool = False, exit_code: Optional[int] = None,  # noqa:E501
+                 memory_usage: Optional[int] = None, memory_limit: Optional[int] = None,  # noqa:E501
+                 cpu: Optional[float] = None) -> None:
+        self.status = status
+        self.oom_killed = oom_killed
+        self.exit_code = exit_code
+        self.memory_usage = memory_usage
+        self.memory_limit = memory_limit
+        self.cpu = cpu
+
+    @property
+    def running(self) -> bool:
+        return self.status == "running"
+
 
 class DockerManager:
     """
@@ -26,6 +56,7 @@ class DockerManager:
         network_mode (str): Network mode to use with Docker
         environment (Dict[str, str]): Docker environment kwargs
         remove_on_cleanup (bool): If true containers are stopped and removed, otherwise stopped.
+        resource_limits (Dict[str, str]): CPU quota (share of one CPU) and memory limit of each container.
         client (docker.DockerClient): Docker client for interacting with the Docker daemon.
     """  # noqa:E501
 
@@ -43,9 +74,11 @@ class DockerManager:
         self.network_mode = cfg.network_mode
         self.environment = cfg.environment  # todo
         self.remove_on_cleanup = cfg.remove_on_cleanup
+        self.resource_limits = cfg.resource_limits or {}
+        import docker  # deferred, the docker SDK is slow to import
         self.client = docker.from_env()
 
-    def create_container(self, connection: ConnectionData) -> Optional[Container]:
+    def create_container(self, connection: ConnectionData) -> Optional["Container"]:
         """
         Creates and starts a Docker container.
 
@@ -58,6 +91,8 @@ class DockerManager:
         Raises:
             RuntimeError: If the Docker daemon is not running or the container fails to start.
         """  # noqa:E501
+        from docker.models.containers import Container
+        from docker.errors import ContainerError, APIError
         name = connection.name
         port = connection.port
         try:
@@ -69,6 +104,7 @@ class DockerManager:
                 network_mode=self.network_mode,
                 shm_size=self.shm,
                 environment=self.environment,
+                **self._resource_kwargs(),
             )
             assert isinstance(container, Container)
             self.logger.info(f"'{name}' browser started on port '{port}'")
@@ -77,14 +113,78 @@ class DockerManager:
             self.logger.error(f"'{name}' browser failed to start: {e}")
             raise
 
-    def cleanup(self, container: Container) -> None:
+    def _resource_kwargs(self) -> Dict:
+        """Translates the configured resource limits to containers.run arguments."""  # noqa:E501
+        kwargs = {}
+        cpu_quota = float(self.resource_limits.get("cpu_quota") or 0)
+        if cpu_quota > 0:
+            kwargs["cpu_period"] = CPU_PERIOD
+            kwargs["cpu_quota"] = int(cpu_quota * CPU_PERIOD)
+        memory_limit = self.resource_limits.get("memory_limit")
+        if memory_limit:
+            kwargs["mem_limit"] = memory_limit.lower()
+            # Without a swap allowance the limit is hard, so leaks end in an OOM kill  # noqa:E501
+            kwargs["memswap_limit"] = memory_limit.lower()
+        return kwargs
+
+    def memory_usage(self, container: "Container") -> Optional[int]:
+        """
+        Samples the memory a container uses, without the page cache.
+
+        Args:
+            container (Container): The container to sample.
+
+        Returns:
+            Optional[int]: Memory usage in bytes, or None if it is not reported.
+        """
+        from docker.errors import APIError
+        try:
+            stats = container.stats(stream=False)
+        except APIError as e:
+            self.logger.warning(f"Failed to sample memory of container '{container.name}': {e}")  # noqa:E501
+            return None
+        return _memory_usage(stats)
+
+    def stats(self, container: "Container") -> ContainerStats:
+        """
+        Inspects a container and, while it runs, samples its resource usage.
+        A stats call takes about a second, as Docker waits for a second CPU
+        sample.
+
+        Args:
+            container (Container): The container to inspect.
+
+        Returns:
+            ContainerStats: State and resource usage of the container.
+        """
+        from docker.errors import APIError, NotFound
+        try:
+            container.reload()
+        except NotFound:
+            return ContainerStats("missing")
+        state = container.attrs.get("State", {})
+        stats = ContainerStats(container.status, bool(state.get("OOMKilled")), state.get("ExitCode"))  # noqa:E501
+        if not stats.running:
+            return stats
+        try:
+            sample = container.stats(stream=False)
+        except APIError as e:
+            self.logger.warning(f"Failed to sample container '{container.name}': {e}")  # noqa:E501
+            return stats
+        stats.memory_usage = _memory_usage(sample)
+        stats.memory_limit = sample.get("memory_stats", {}).get("limit")
+        stats.cpu = _cpu_usage(sample)
+        return stats
+
+    def cleanup(self, container: "Container") -> None:
         """Stops and optionally removes a Docker container."""
         self._stop_container(container)
         if self.remove_on_cleanup:
             self._remove_container(container)
 
-    def _stop_container(self, container: Container) -> None:
+    def _stop_container(self, container: "Container") -> None:
         """Stops a Docker container."""
+        from docker.errors import ContainerError, APIError
         try:
             container.stop(timeout=10)
             self.logger.info(
@@ -94,8 +194,9 @@ class DockerManager:
             self.logger.error(f"Failed to stop container '{container.name}': {e}")
             raise e
 
-    def _remove_container(self, container: Container) -> None:
+    def _remove_container(self, container: "Container") -> None:
         """Removes a Docker container."""
+        from docker.errors import ContainerError, APIError, NotFound
         try:
             container.remove()
             self.logger.info(f"Removed container '{container.name}' (ID: {container.id}).")  # noqa:E501
@@ -104,3 +205,24 @@ class DockerManager:
         except (ContainerError, APIError) as e:
             self.logger.error(f"Failed to remove container '{container.name}': {e}")
             raise e
+
+
+def _memory_usage(stats: Dict) -> Optional[int]:
+    memory = stats.get("memory_stats", {})
+    if "usage" not in memory:
+        return None
+    # cgroup v2 reports the page cache as inactive_file, v1 as total_inactive_file  # noqa:E501
+    details = memory.get("stats", {})
+    return memory["usage"] - details.get("inactive_file", details.get("total_inactive_file", 0))  # noqa:E501
+
+
+def _cpu_usage(stats: Dict) -> Optional[float]:
+    cpu, previous = stats.get("cpu_stats", {}), stats.get("precpu_stats", {})
+    try:
+        cpu_delta = cpu["cpu_usage"]["total_usage"] - previous["cpu_usage"]["total_usage"]  # noqa:E501
+        system_delta = cpu["system_cpu_usage"] - previous["system_cpu_usage"]
+    except KeyError:
+        return None
+    if system_delta <= 0:
+        return None
+    return cpu_delta / system_delta * cpu.get("online_cpus", 1)
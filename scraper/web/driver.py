@@ -1,6 +1,6 @@
 import time
 
-from typing import Optional
+from typing import Dict, Optional
 from selenium import webdriver
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -8,6 +8,9 @@ from selenium.common.exceptions import WebDriverException
 
 from scraper.config.validator import DriverConfig
 from scraper.config.logging import StructuredLogger
+from scraper.config.retry import RetryBudget, RetryPolicy
+
+from .proxy import with_credentials
 
 
 class DriverManager:
@@ -24,11 +27,15 @@ class DriverManager:
         driver_options (List[str]): List of options to configure the WebDriver.
         proxy_server (bool): Flag indicating whether to use a proxy server.
         max_attempts (int): Maximum number of attempts to create a WebDriver.
-        retry_interval (int): Time interval (in seconds) between retry attempts.
+        retry_interval (int): Base delay (in seconds) of the exponential backoff between attempts.
         user_agent (str): Value for user agent configuration.
-    """
+        page_load_timeout (Optional[float]): Time (in seconds) a page may take to load before navigation fails.
+        retry_policy (RetryPolicy): Backoff policy for driver creation.
+        proxy_authentication (Optional[Dict[str, str]]): Credentials added to the proxy of each driver.
+    """  # noqa:E501
 
-    def __init__(self, logger: StructuredLogger, cfg: DriverConfig) -> None:
+    def __init__(self, logger: StructuredLogger, cfg: DriverConfig,
+                 proxy_authentication: Optional[Dict[str, str]] = None) -> None:
         self.logger = logger
         self.host_network = cfg.host_network
         self.driver_options = cfg.option_args
@@ -36,6 +43,14 @@ class DriverManager:
         self.max_attempts = cfg.retry_attempts
         self.retry_interval = cfg.retry_interval
         self.user_agent = cfg.user_agent
+        self.page_load_timeout = cfg.page_load_timeout
+        self.retry_policy = RetryPolicy(
+            attempts=cfg.retry_attempts,
+            initial_delay=cfg.retry_interval,
+            max_delay=cfg.retry_max_interval,
+            budget=RetryBudget(),
+        )
+        self.proxy_authentication = proxy_authentication
 
     def create_driver(self, connection) -> Optional[WebDriver]:
         """
@@ -57,33 +72,60 @@ class DriverManager:
         for option in self.driver_options:
             opts.add_argument(option)
         if self.proxy_server:
-            opts.add_argument(f"--proxy-server={proxy}")
+            opts.add_argument(f"--proxy-server={with_credentials(proxy, self.proxy_authentication)}")  # noqa:E501
         if self.user_agent:
             opts.add_argument(f"--user-agent={self.user_agent}")
-        for attempt in range(self.max_attempts):
+        attempts = []
+
+        def attempt() -> WebDriver:
+            attempts.append(None)
             try:
                 driver = webdriver.Remote(
                     command_executor=f"{self.host_network}:{connection_port}/wd/hub",
                     options=opts,
                 )
-                self.logger.info(
-                    f"WebDriver session created with session ID: {driver.session_id}"
-                )  # noqa:E501
-                self.logger.info(
-                    f"WebDriver session created with capabilities: {driver.capabilities}"  # noqa:E501
-                )  # noqa:E501
-                return driver
             except Exception as e:
                 self.logger.warning(
-                    f"Attempt {attempt + 1} - Failed to create driver with proxy '{proxy}': {e}",  # noqa:E501
+                    f"Attempt {len(attempts)} - Failed to create driver with proxy '{proxy}': {e}",  # noqa:E501
                     exc_info=True,
                 )  # noqa:E501
-                if attempt < self.max_attempts - 1:
-                    time.sleep(self.retry_interval)
-                else:
-                    error_msg = f"Failed to create driver for target '{connection_name}' on port '{connection_port}' after {self.max_attempts} attempts"  # noqa:E501
-                    self.logger.error(error_msg)  # noqa:E501
-                    raise WebDriverException(error_msg)
+                raise
+            if self.page_load_timeout:
+                # Without it a page that never finishes loading blocks get() indefinitely  # noqa:E501
+                driver.set_page_load_timeout(self.page_load_timeout)
+            self.logger.info(
+                f"WebDriver session created with session ID: {driver.session_id}"
+            )  # noqa:E501
+            self.logger.info(
+                f"WebDriver session created with capabilities: {driver.capabilities}"  # noqa:E501
+            )  # noqa:E501
+            return driver
+
+        try:
+            return self.retry_policy.call(attempt, "driver")
+        except Exception:
+            error_msg = f"Failed to create driver for target '{connection_name}' on port '{connection_port}' after {len(attempts)} attempts"  # noqa:E501
+            self.logger.error(error_msg)  # noqa:E501
+            raise WebDriverException(error_msg)
+
+    def is_responsive(self, connection, timeout: float = 5) -> bool:
+        """
+        Checks that the Selenium server of a connection answers its status
+        endpoint. A busy server is still responsive, so readiness is ignored.
+
+        Args:
+            connection (ConnectionData): Connection data containing the port of the server.
+            timeout (float): Time (in seconds) to wait for the answer.
+
+        Returns:
+            bool: True if the server answered.
+        """  # noqa:E501
+        import requests  # deferred, requests is slow to import
+        try:
+            response = requests.get(f"{self.host_network}:{connection.port}/wd/hub/status", timeout=timeout)  # noqa:E501
+            return response.status_code == 200
+        except requests.RequestException:
+            return False
 
     def quit_driver(self, driver: WebDriver) -> None:
         """
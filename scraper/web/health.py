@@ -0,0 +1,160 @@
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+
+class ProxyHealth(NamedTuple):
+    """
+    Persisted health record for a single proxy.
+
+    Attributes:
+        healthy (bool): Whether the proxy passed its last validation.
+        last_validated (Optional[float]): Unix timestamp of the last validation.
+        latency (Optional[float]): Duration (in seconds) of the last validation probe.
+        usage (int): Cumulative number of requests made through the proxy.
+    """  # noqa:E501
+
+    healthy: bool
+    last_validated: Optional[float]
+    latency: Optional[float]
+    usage: int
+
+
+class ProxyHealthStore:
+    """
+    Persists proxy health and usage across runs in a local SQLite database.
+
+    Validation results and usage counts are persisted as they change, so a
+    restarted run can skip proxies validated recently and keep enforcing
+    usage limits where the previous run left off. Recording only queues the
+    change: a writer thread stores queued changes in batches, one commit per
+    batch, so neither the validation event loop nor scraping threads wait on
+    disk I/O. Loading and closing flush the queue first.
+
+    Attributes:
+        db_file (Path): Path to the SQLite database file.
+    """
+
+    def __init__(self, db_file: Path) -> None:
+        self.db_file = db_file
+        # Latest queued change per proxy, replaced wholesale by each flush
+        self._validations: Dict[str, Tuple[int, float, Optional[float]]] = {}
+        self._usage: Dict[str, int] = {}
+        self._queue_lock = threading.Lock()
+        self._queued = threading.Event()
+        self._closed = False
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        # Shared between scraping and validation threads, serialised by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS proxy_health (
+                proxy TEXT PRIMARY KEY,
+                healthy INTEGER NOT NULL DEFAULT 0,
+                last_validated REAL,
+                latency REAL,
+                usage INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.commit()
+        self._writer = threading.Thread(target=self._write_loop, name="proxy-health-writer", daemon=True)  # noqa:E501
+        self._writer.start()
+
+    def load(self, proxies: Optional[Iterable[str]] = None) -> Dict[str, ProxyHealth]:  # noqa:E501
+        """
+        Loads the stored health records.
+
+        Args:
+            proxies (Optional[Iterable[str]]): Restricts the result to these proxies if given.
+
+        Returns:
+            Dict[str, ProxyHealth]: Mapping of proxies to their stored health records.
+        """  # noqa:E501
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT proxy, healthy, last_validated, latency, usage FROM proxy_health"  # noqa:E501
+            ).fetchall()
+        records = {
+            proxy: ProxyHealth(bool(healthy), last_validated, latency, usage)
+            for proxy, healthy, last_validated, latency, usage in rows
+        }
+        if proxies is None:
+            return records
+        return {proxy: records[proxy] for proxy in proxies if proxy in records}
+
+    def record_validation(self, proxy: str, healthy: bool, latency: Optional[float] = None) -> None:  # noqa:E501
+        """
+        Records the outcome of validating a proxy.
+
+        Args:
+            proxy (str): The validated proxy.
+            healthy (bool): Whether the proxy passed validation.
+            latency (Optional[float]): Duration (in seconds) of the validation probe.
+        """  # noqa:E501
+        with self._queue_lock:
+            self._validations[proxy] = (int(healthy), time.time(), latency)
+        self._queued.set()
+
+    def record_usage(self, proxy: str, usage: int) -> None:
+        """
+        Records the cumulative usage count of a proxy.
+
+        Args:
+            proxy (str): The proxy that was used.
+            usage (int): The cumulative usage count.
+        """
+        with self._queue_lock:
+            self._usage[proxy] = usage
+        self._queued.set()
+
+    def flush(self) -> None:
+        """Writes the queued changes in a single transaction."""
+        # Taken first, so a flush returns only once earlier batches are stored too  # noqa:E501
+        with self._lock:
+            with self._queue_lock:
+                validations, self._validations = self._validations, {}
+                usage, self._usage = self._usage, {}
+            if self._closed or not (validations or usage):
+                return
+            self._conn.executemany(
+                """
+                INSERT INTO proxy_health (proxy, healthy, last_validated, latency)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(proxy) DO UPDATE SET
+                    healthy = excluded.healthy,
+                    last_validated = excluded.last_validated,
+                    latency = excluded.latency
+                """,
+                [(proxy, *validation) for proxy, validation in validations.items()],  # noqa:E501
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO proxy_health (proxy, usage) VALUES (?, ?)
+                ON CONFLICT(proxy) DO UPDATE SET usage = excluded.usage
+                """,
+                list(usage.items()),
+            )
+            self._conn.commit()
+
+    def _write_loop(self) -> None:
+        # Changes queued while a batch is written are stored with the next one
+        while not self._closed:
+            self._queued.wait()
+            self._queued.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """Writes the queued changes and closes the database connection."""
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._conn.close()
+        self._queued.set()
+        self._writer.join()
@@ -0,0 +1,108 @@
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+from scraper.config.logging import StructuredLogger
+from scraper.telemetry import metrics
+
+from .connection import ConnectionData
+
+if TYPE_CHECKING:
+    from .controller import WebController
+
+
+class ContainerMonitor:
+    """
+    Watches the browser container of every connection from a background
+    thread. Each check inspects the container, exports its resource usage
+    as metrics and pings its Selenium server. A container that was OOM
+    killed, exited, disappeared, or whose server failed `failures`
+    consecutive pings is marked for a restart, which the controller applies
+    between links, so one dead container does not take its target down for
+    the rest of the run.
+
+    Attributes:
+        logger (StructuredLogger): Logger for logging messages.
+        controller (WebController): Controller owning the connections.
+        interval (float): Time (in seconds) between checks.
+        failures (int): Consecutive failed pings after which a container is unresponsive.
+        timeout (float): Time (in seconds) a ping may take.
+    """  # noqa:E501
+
+    def __init__(self, logger: StructuredLogger, controller: "WebController", interval: float = 30,  # noqa:E501
+                 failures: int = 3, timeout: float = 5) -> None:
+        self.logger = logger
+        self.controller = controller
+        self.interval = interval
+        self.failures = failures
+        self.timeout = timeout
+        self._failed_pings: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="container-monitor", daemon=True)  # noqa:E501
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self) -> None:
+        """Checks every connection once, requesting restarts of unhealthy containers."""  # noqa:E501
+        for name, connection in list(self.controller.connections.items()):
+            if self._stop.is_set():
+                return
+            if self.controller.restart_pending(name):
+                continue
+            with metrics.scope(target=name):
+                try:
+                    reason = self.check_connection(connection)
+                    if reason and self.controller.request_restart(name, reason):  # noqa:E501
+                        metrics.record_container_restart(reason)
+                        self._failed_pings.pop(name, None)
+                except Exception as e:
+                    self.logger.error(f"Failed to check container of '{name}': {e}", exc_info=True)  # noqa:E501
+
+    def check_connection(self, connection: ConnectionData) -> Optional[str]:
+        """
+        Inspects the container of a connection and records its metrics.
+
+        Args:
+            connection (ConnectionData): The connection to check.
+
+        Returns:
+            Optional[str]: Why the container needs a restart, or None if it is healthy.
+        """  # noqa:E501
+        container = connection.container
+        if container is None:
+            # Being replaced, e.g. after an abort, or it failed to start
+            return None
+        stats = self.controller.docker_manager.stats(container)
+        if not stats.running:
+            metrics.record_container(False)
+            if stats.oom_killed:
+                self.logger.error(f"Container of '{connection.name}' was killed for exceeding its memory limit")  # noqa:E501
+                return "oom"
+            if stats.status == "missing":
+                self.logger.error(f"Container of '{connection.name}' disappeared")  # noqa:E501
+                return "missing"
+            self.logger.error(f"Container of '{connection.name}' is {stats.status} (exit code {stats.exit_code})")  # noqa:E501
+            return "crashed"
+        responsive = self.controller.driver_manager.is_responsive(connection, self.timeout)  # noqa:E501
+        metrics.record_container(responsive, stats.memory_usage, stats.memory_limit, stats.cpu)  # noqa:E501
+        if responsive:
+            self._failed_pings.pop(connection.name, None)
+            return None
+        failed = self._failed_pings[connection.name] = self._failed_pings.get(connection.name, 0) + 1  # noqa:E501
+        self.logger.warning(f"Selenium server of '{connection.name}' did not answer ({failed}/{self.failures})")  # noqa:E501
+        if failed >= self.failures:
+            return "unresponsive"
+        return None
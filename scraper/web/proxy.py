@@ -1,11 +1,15 @@
 import re
-import requests
-import concurrent.futures
-from typing import List, Dict, Tuple, Optional
+import time
+import threading
+from collections import deque
+from typing import Deque, List, Dict, Set, Tuple, Optional
 
 from scraper.config.logging import StructuredLogger
 from scraper.config.validator import ProxyConfig
 
+from .health import ProxyHealthStore
+from .validation import AsyncProxyValidator, ResultCallback
+
 
 class UsageError(Exception):
     """
@@ -19,6 +23,27 @@ class ProxyReloadError(Exception):
     """
 
 
+def proxy_address(proxy: Optional[str]) -> Optional[str]:
+    """
+    Strips the credentials from a 'user:pass@host:port' proxy, so it can be
+    exported, e.g. as a metric label, without leaking the password.
+    """
+    if not proxy:
+        return proxy
+    return proxy.rpartition("@")[2]
+
+
+def with_credentials(proxy: Optional[str], authentication: Optional[Dict[str, str]]) -> Optional[str]:  # noqa:E501
+    """
+    Prefixes a 'host:port' proxy with the configured credentials. The pool and
+    its health records only hold the bare address; the credentials are added
+    when the driver or request proxy URL is built.
+    """
+    if not proxy or not authentication:
+        return proxy
+    return f"{authentication['username']}:{authentication['password']}@{proxy}"
+
+
 class ProxyManager:
     """
     Manages a pool of proxies for web scraping.
@@ -30,11 +55,20 @@ class ProxyManager:
         logger (StructuredLogger): Logger for logging messages.
         input_file (Path): Path to the file containing the list of proxies.
         test_url (str): URL used to test the proxies.
-        usage_limit (int): Maximum number of uses for each proxy.
+        usage_limit (int): Maximum number of uses for each proxy, or per proxy and domain within 'usage_window'.
         validation (bool): Flag indicating whether to validate proxies.
         proxy_type (str): Connection protocol to use with proxy
         authentication (Dict[str, str]): authentication details passed to proxies if provided
         proxy_pool (Dict[str, Tuple[int, bool]]): Dictionary mapping proxies to their usage count and availability.
+        min_validated (int): Number of validated proxies required before the pool is usable.
+        validator (AsyncProxyValidator): Concurrent validator used to build, reload and maintain the pool.
+        health_store (Optional[ProxyHealthStore]): Persistent health and usage records, if configured.
+        revalidate_after (float): Age (in seconds) after which a stored validation result is stale.
+        maintenance_interval (Optional[float]): Interval (in seconds) between background maintenance passes, disabled if None.
+        recheck_interval (float): Interval (in seconds) between re-validations of pooled proxies.
+        min_spares (int): Number of idle validated proxies the maintainer keeps ready (at least one).
+        usage_window (Optional[float]): Sliding window (in seconds) for per-domain usage limits, global limits if None.
+        cooldown (float): Time (in seconds) a proxy rests for a domain after reaching its windowed limit.
     """  # noqa:E501
 
     def __init__(self, logger: StructuredLogger, cfg: ProxyConfig) -> None:
@@ -45,15 +79,124 @@ class ProxyManager:
         self.validation = cfg.validation
         self.proxy_type = cfg.proxy_type.lower()  # new field
         self.authentication = cfg.authentication  # new field
+        self.min_validated = cfg.min_validated
+        self.validator = AsyncProxyValidator(
+            logger,
+            cfg.test_url,
+            self.proxy_type,
+            timeout=cfg.validation_timeout,
+            max_concurrency=cfg.validation_concurrency,
+            per_host_limit=cfg.validation_host_limit,
+            deadline=cfg.validation_deadline,
+            authentication=cfg.authentication,
+        )
+        self.health_store = ProxyHealthStore(cfg.health_db) if cfg.health_db else None  # noqa:E501
+        self.revalidate_after = cfg.revalidate_after
         self.proxy_pool: Dict[str, Tuple[int, bool]] = {}
+        # Guards the pool, which is filled from the validation thread
+        self._lock = threading.RLock()
+        self._pool_updated = threading.Condition(self._lock)
+        self._validating = False
+        self.maintenance_interval = cfg.maintenance_interval
+        self.recheck_interval = cfg.recheck_interval
+        self.min_spares = cfg.min_spares
+        self._listed: List[str] = []
+        self._input_mtime: Optional[float] = None
+        self._failed: Dict[str, float] = {}
+        self._retired: Set[str] = set()
+        self._unhealthy: Set[str] = set()
+        self._maintainer: Optional[threading.Thread] = None
+        self._maintainer_stop = threading.Event()
+        self._maintainer_wake = threading.Event()
+        self._replenish_requested = False
+        self.usage_window = cfg.usage_window
+        self.cooldown = cfg.cooldown
+        self._domain_usage: Dict[Tuple[str, str], Deque[float]] = {}
+        self._cooldowns: Dict[Tuple[str, str], float] = {}
         self._create_pool()
+        if self.maintenance_interval:
+            self.start_maintainer()
 
     def _create_pool(self) -> None:
         """Creates the proxy pool from the input file."""
-        proxy_list = (
-            self._validate_proxies() if self.validation else self._format_pool()
-        )  # noqa:E501
-        self.proxy_pool = {proxy: (0, False) for proxy in proxy_list}
+        self._input_mtime = self.input_file.stat().st_mtime
+        proxy_list = self._listed = self._format_pool()
+        if self.health_store:
+            proxy_list = self._restore_pool(proxy_list)
+        if self.validation and proxy_list:
+            self._stream_validated_pool(proxy_list)
+        else:
+            self.proxy_pool.update({proxy: (0, False) for proxy in proxy_list})
+            if not self.proxy_pool:
+                # Every listed proxy failed recently or is exhausted per the health store  # noqa:E501
+                error_message = "Validation Failed, No Viable Proxies"
+                self.logger.error(error_message)
+                raise ValueError(error_message)
+
+    def _restore_pool(self, proxy_list: List[str]) -> List[str]:
+        """
+        Seeds the pool with proxies whose stored validation is still fresh,
+        carrying over their usage counts. Returns the proxies that still need
+        validating, or, with validation disabled, every proxy not restored.
+        """
+        records = self.health_store.load(proxy_list)
+        cutoff = time.time() - self.revalidate_after
+        pending = []
+        restored = skipped = 0
+        for proxy in proxy_list:
+            record = records.get(proxy)
+            if record and self._is_exhausted(record.usage):
+                skipped += 1
+            elif record and self.validation and (record.last_validated or 0) >= cutoff:  # noqa:E501
+                if record.healthy:
+                    self.proxy_pool[proxy] = (record.usage, False)
+                    restored += 1
+                else:
+                    skipped += 1
+            elif record and not self.validation:
+                self.proxy_pool[proxy] = (record.usage, False)
+                restored += 1
+            else:
+                pending.append(proxy)
+        self.logger.info(f"Restored {restored} proxies from health store, skipped {skipped}, {len(pending)} pending")  # noqa:E501
+        return pending
+
+    def _stream_validated_pool(self, proxy_list: List[str]) -> None:
+        """
+        Validates proxies in the background, adding each one to the pool as it
+        passes. Returns once 'min_validated' proxies are ready or validation ends.
+        """
+        ready = threading.Event()
+        if len(self.proxy_pool) >= self.min_validated:
+            ready.set()
+        stored_usage = self._stored_usage(proxy_list)
+
+        def on_result(proxy: str, healthy: bool, latency: float) -> None:
+            self._record_validation(proxy, healthy, latency)
+            if not healthy:
+                return
+            with self._pool_updated:
+                self.proxy_pool.setdefault(proxy, (stored_usage.get(proxy, 0), False))  # noqa:E501
+                self._pool_updated.notify_all()
+                if len(self.proxy_pool) >= self.min_validated:
+                    ready.set()
+
+        def on_complete(functional_proxies: List[str]) -> None:
+            with self._pool_updated:
+                self._validating = False
+                self._pool_updated.notify_all()
+            ready.set()
+
+        with self._lock:
+            self._validating = True
+        self.validator.start(proxy_list, on_result, on_complete)
+        ready.wait()
+        with self._lock:
+            if not self.proxy_pool:
+                error_message = "Validation Failed, No Viable Proxies"
+                self.logger.error(error_message)
+                raise ValueError(error_message)
+            self.logger.info(f"Proxy pool ready with {len(self.proxy_pool)} validated proxies")  # noqa:E501
 
     def _load_proxies(self) -> List[str]:
         """Loads the list of proxies from the input file."""
@@ -72,16 +215,8 @@ class ProxyManager:
             flags=re.ASCII,
         )
 
-        formatted_proxies = []
-        for proxy in raw_proxies:
-            if proxy_pattern.match(proxy):
-                if self.authentication:
-                    username = self.authentication.get("username")
-                    password = self.authentication.get("password")
-                    formatted_proxy = f"{username}:{password}@{proxy}"
-                else:
-                    formatted_proxy = proxy
-                formatted_proxies.append(formatted_proxy)
+        # Credentials are added by with_credentials, so they are never stored
+        formatted_proxies = [proxy for proxy in raw_proxies if proxy_pattern.match(proxy)]  # noqa:E501
 
         if formatted_proxies:
             self.logger.info(f"Extracted {len(formatted_proxies)} formatted proxies")
@@ -91,145 +226,354 @@ class ProxyManager:
             self.logger.error(error_message)
             raise ValueError(error_message)
 
-    def _test_proxy(self, proxy: str) -> bool:
-        """Tests a proxy by attempting to access a test URL."""
-        if self.proxy_type == "http":
-            proxy_url = f"http://{proxy}"
-        elif self.proxy_type == "https":
-            proxy_url = f"https://{proxy}"
-        else:  # SOCKS4/SOCKS5
-            proxy_url = f"socks5://{proxy}"
-
-        # Add authentication to the proxy URL if provided
-        if self.authentication:
-            username = self.authentication.get("username")
-            password = self.authentication.get("password")
-            proxy_url = f"{username}:{password}@{proxy_url}"
-
-        proxies = {"http": proxy_url, "https": proxy_url}
-        try:
-            response = requests.get(self.test_url, proxies=proxies, timeout=5)
-            return response.status_code == 200
-        except Exception as e:
-            raise e
-
-    def _validate_proxies(self, new_proxies: Optional[List[str]] = None) -> List[str]:
-        """Validates the proxies by testing their ability to access a test URL."""
-        proxy_pool = new_proxies if new_proxies is not None else self._format_pool()
-        functional_proxies = []
-        validation_errors = []  # List to collect validation errors
-        num_workers = min(10, len(proxy_pool))
-        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
-            futures = {
-                executor.submit(self._test_proxy, proxy): proxy for proxy in proxy_pool
-            }  # noqa:E501
-            try:
-                timeout = len(futures) * 10
-                for future in concurrent.futures.as_completed(futures, timeout=timeout):
-                    proxy = futures[future]
-                    try:
-                        if future.result():
-                            functional_proxies.append(proxy)
-                    except Exception as e:
-                        validation_errors.append(str(e))
-            except TimeoutError:
-                self.logger.error(
-                    "Proxy validation timed out before all proxies could be tested"
-                )  # noqa:E501
-                unfinished_proxies = [
-                    proxy for future, proxy in futures.items() if not future.done()
-                ]  # noqa:E501
-                validation_errors.append(
-                    f"Unfinished proxy validations: {unfinished_proxies}"
-                )  # noqa:E501
-
-        if validation_errors:
-            self.logger.warning(
-                "Proxy validation errors:\n" + "\n".join(validation_errors)
-            )  # noqa:E501
-
-        if functional_proxies:
-            self.logger.info(
-                f"Validated {len(functional_proxies)} out of {len(proxy_pool)} proxies"
-            )  # noqa:E501
-            return functional_proxies
-        else:
-            error_message = "Validation Failed, No Viable Proxies"
-            self.logger.error(error_message)
-            raise ValueError(error_message)
-
-    def _reload_and_get_proxy(self) -> str:
+    def _reload_and_get_proxy(self, domain: Optional[str] = None) -> str:
         """
-        Reloads the proxy pool with fresh proxies and attempts
-        to retrieve an available proxy.
+        Reloads the proxy pool with fresh proxies and attempts to retrieve an
+        available proxy. Must be called with the pool lock held: new proxies
+        are validated in the background and the lock is released while
+        waiting, so other threads can keep releasing and using proxies.
         """
-        exhausted_proxies = set(self.proxy_pool.keys())
-        fresh_proxies = set(self._load_proxies())
-        new_proxies = fresh_proxies - exhausted_proxies
+        exhausted_proxies = set(self.proxy_pool.keys()) | self._retired
+        try:
+            listed = self._format_pool()
+        except ValueError:
+            listed = []
+        new_proxies = [proxy for proxy in dict.fromkeys(listed) if proxy not in exhausted_proxies]  # noqa:E501
 
         if not new_proxies:
             error_message = "No new proxies available for reloading the pool"
             self.logger.error(error_message)
             raise ProxyReloadError(error_message)
 
-        validated_proxies = self._validate_proxies(list(new_proxies))
         old_count = len(self.proxy_pool)
-        self.proxy_pool.update({proxy: (0, False) for proxy in validated_proxies})
-        new_count = len(self.proxy_pool)
-        self.logger.info(f"Reloaded proxy pool: {old_count} -> {new_count} proxies")
+        on_result = self._pool_result_callback(new_proxies)
 
-        for proxy, (usage, in_use) in self.proxy_pool.items():
-            if usage < self.usage_limit and not in_use:
-                self.proxy_pool[proxy] = (usage + 1, True)
-                return proxy
+        def on_complete(functional_proxies: List[str]) -> None:
+            with self._pool_updated:
+                self._validating = False
+                self._pool_updated.notify_all()
+                self.logger.info(f"Reloaded proxy pool: {old_count} -> {len(self.proxy_pool)} proxies")  # noqa:E501
+
+        self._validating = True
+        self.validator.start(new_proxies, on_result, on_complete)
+        proxy = self._acquire_available(domain)
+        while proxy is None and self._validating:
+            self._pool_updated.wait()
+            proxy = self._acquire_available(domain)
+        if proxy:
+            return proxy
 
         error_message = "No available proxies found after reloading"
         self.logger.error(error_message)
         raise ProxyReloadError(error_message)
 
-    def get_proxy(self) -> str:
+    def _acquire_available(self, domain: Optional[str] = None) -> Optional[str]:
         """
-        Retrieves an available proxy from the pool.
-        If no available proxies are found, attempts to
-        reload the pool with fresh proxies.
+        Marks the first available proxy as in use and returns it, removing
+        exhausted proxies along the way. Returns None if none are available.
+        The caller persists the new usage count once it released the pool.
+        With windowed limits, proxies cooling down for the domain are skipped.
         """
-        for proxy, (usage, in_use) in self.proxy_pool.items():
-            if usage < self.usage_limit and not in_use:
+        now = time.monotonic()
+        for proxy, (usage, in_use) in list(self.proxy_pool.items()):
+            if self.usage_window:
+                if not in_use and self._domain_available(proxy, domain, now):
+                    self.proxy_pool[proxy] = (usage, True)
+                    return proxy
+            elif usage < self.usage_limit and not in_use:
                 self.proxy_pool[proxy] = (usage + 1, True)
                 return proxy
             elif usage >= self.usage_limit:
                 self.delete_proxy(proxy)
+        return None
+
+    def _is_exhausted(self, usage: int) -> bool:
+        """Returns True if a cumulative usage count retires a proxy for good."""
+        return not self.usage_window and usage >= self.usage_limit
+
+    def _domain_available(self, proxy: str, domain: Optional[str], now: float) -> bool:  # noqa:E501
+        """
+        Returns True if the proxy is neither cooling down nor at its windowed
+        limit for the domain. Expired cooldowns are cleared.
+        """
+        key = (proxy, domain or "")
+        until = self._cooldowns.get(key)
+        if until is not None:
+            if now < until:
+                return False
+            del self._cooldowns[key]
+            self._domain_usage.pop(key, None)
+        return self._window_count(key, now) < self.usage_limit
+
+    def _window_count(self, key: Tuple[str, str], now: float) -> int:
+        """Returns the number of uses of a (proxy, domain) pair within the usage window."""  # noqa:E501
+        uses = self._domain_usage.get(key)
+        if not uses:
+            return 0
+        while uses and uses[0] <= now - self.usage_window:
+            uses.popleft()
+        return len(uses)
+
+    def _increment_domain_usage(self, proxy: str, domain: Optional[str]) -> None:  # noqa:E501
+        """
+        Records a use of the proxy for the domain, putting the pair on cooldown
+        and raising UsageError once the windowed limit is reached.
+        """
+        key = (proxy, domain or "")
+        now = time.monotonic()
+        if self._window_count(key, now) >= self.usage_limit:
+            self._cooldowns[key] = now + self.cooldown
+            self.logger.info(f"Proxy '{proxy}' cooling down for '{domain}' for {self.cooldown}s")  # noqa:E501
+            raise UsageError(f"Proxy '{proxy}' has reached its usage limit for '{domain}'")  # noqa:E501
+        self._domain_usage.setdefault(key, deque()).append(now)
+
+    def _stored_usage(self, proxies: List[str]) -> Dict[str, int]:
+        """Returns the persisted usage counts for the given proxies."""
+        if not self.health_store:
+            return {}
+        return {proxy: record.usage for proxy, record in self.health_store.load(proxies).items()}  # noqa:E501
+
+    def _record_usage(self, proxy: str, usage: int) -> None:
+        """Persists the usage count of a proxy if a health store is configured."""
+        if self.health_store:
+            self.health_store.record_usage(proxy, usage)
 
-        self.logger.debug("No available proxies found, reloading pool")
-        return self._reload_and_get_proxy()
+    def get_proxy(self, domain: Optional[str] = None) -> str:
+        """
+        Retrieves an available proxy from the pool, for the given domain if
+        usage is tracked per domain.
+        With the background maintainer running, it never waits on validation:
+        the maintainer is woken to top up the spares as soon as they run low,
+        and ProxyReloadError is raised at once if no proxy is available.
+        Otherwise it waits for proxies still being validated and then reloads
+        the pool with fresh proxies.
+        """
+        proxy = self._acquire(domain)
+        if not self.usage_window:
+            # Taking a proxy counts as a use; persisted after releasing the pool
+            with self._lock:
+                usage = self.proxy_pool.get(proxy, (0, True))[0]
+            self._record_usage(proxy, usage)
+        return proxy
+
+    def _acquire(self, domain: Optional[str] = None) -> str:
+        """Takes a proxy for get_proxy, waiting or reloading the pool as described there."""  # noqa:E501
+        with self._pool_updated:
+            proxy = self._acquire_available(domain)
+            if self._maintainer_running():
+                self._request_spares()
+                if proxy:
+                    return proxy
+                error_message = "No available proxies, replenishment requested"
+                self.logger.error(error_message)
+                raise ProxyReloadError(error_message)
+
+            while proxy is None and self._validating:
+                self._pool_updated.wait()
+                proxy = self._acquire_available(domain)
+            if proxy:
+                return proxy
+
+            self.logger.debug("No available proxies found, reloading pool")
+            return self._reload_and_get_proxy(domain)
+
+    def _idle_count(self) -> int:
+        """Returns the number of pooled proxies that are neither in use nor exhausted."""  # noqa:E501
+        return sum(1 for usage, in_use in self.proxy_pool.values() if not self._is_exhausted(usage) and not in_use)  # noqa:E501
+
+    def _spares_target(self) -> int:
+        """Returns the number of idle proxies the maintainer keeps ready, at least one."""  # noqa:E501
+        return max(self.min_spares, 1)
+
+    def _request_spares(self) -> None:
+        """
+        Wakes the maintainer once the idle proxies drop below the spares
+        target, so they are replaced before a scraping thread runs out.
+        Must be called with the pool lock held.
+        """
+        if self._idle_count() < self._spares_target():
+            self._replenish_requested = True
+            self._maintainer_wake.set()
 
-    def increment_usage(self, proxy: str) -> None:
-        """Increments the usage count of a proxy."""
-        if proxy in self.proxy_pool:
+    def increment_usage(self, proxy: str, domain: Optional[str] = None) -> None:
+        """
+        Increments the usage count of a proxy. With windowed limits, usage is
+        also counted against the domain and exhausting it starts a cooldown
+        for that domain only, instead of removing the proxy.
+        """
+        with self._lock:
+            if proxy not in self.proxy_pool:
+                self.logger.warning(f"Proxy '{proxy}' not found in pool")
+                return
             usage, _ = self.proxy_pool[proxy]
-            if usage < self.usage_limit:
-                self.proxy_pool[proxy] = (usage + 1, True)
-            else:
+            if self.usage_window:
+                self._increment_domain_usage(proxy, domain)
+            elif usage >= self.usage_limit:
                 self.delete_proxy(proxy)
                 raise UsageError(f"Proxy '{proxy}' has reached its usage limit")
-        else:
-            self.logger.warning(f"Proxy '{proxy}' not found in pool")
+            self.proxy_pool[proxy] = (usage + 1, True)
+        # Persisted after releasing the pool, so other threads never wait on it
+        self._record_usage(proxy, usage + 1)
 
     def release_proxy(self, proxy: str) -> None:
         """Releases a proxy back to the pool, making it available for use again."""
-        if proxy in self.proxy_pool:
-            usage, _ = self.proxy_pool[proxy]
-            if usage < self.usage_limit:
-                self.proxy_pool[proxy] = (usage, False)
-                self.logger.info(f"Proxy '{proxy}' released back to pool")
+        with self._lock:
+            if proxy in self.proxy_pool:
+                usage, _ = self.proxy_pool[proxy]
+                if proxy in self._unhealthy:
+                    self.logger.info(f"Proxy '{proxy}' failed its last health check")  # noqa:E501
+                    self._unhealthy.discard(proxy)
+                    del self.proxy_pool[proxy]
+                elif not self._is_exhausted(usage):
+                    self.proxy_pool[proxy] = (usage, False)
+                    self._pool_updated.notify_all()
+                    self.logger.info(f"Proxy '{proxy}' released back to pool")
+                else:
+                    self.logger.info(f"Proxy '{proxy}' exceeded usage limit")
+                    self.delete_proxy(proxy)
             else:
-                self.logger.info(f"Proxy '{proxy}' exceeded usage limit")
-                self.delete_proxy(proxy)
-        else:
-            self.logger.warning(f"Proxy '{proxy}' not found in pool")
+                self.logger.warning(f"Proxy '{proxy}' not found in pool")
 
     def delete_proxy(self, proxy: str) -> None:
         """Removes a proxy from the pool."""
-        if proxy in self.proxy_pool:
-            del self.proxy_pool[proxy]
-            self.logger.info(f"Proxy '{proxy}' removed from the pool")
+        with self._lock:
+            if proxy in self.proxy_pool:
+                del self.proxy_pool[proxy]
+                self._retired.add(proxy)
+                self.logger.info(f"Proxy '{proxy}' removed from the pool")
+
+    def start_maintainer(self) -> None:
+        """
+        Starts the background maintainer, which hot-reloads the input file,
+        re-checks pooled proxies and keeps 'min_spares' idle proxies validated.
+        """
+        if self._maintainer_running():
+            return
+        if not self.maintenance_interval:
+            raise ValueError("maintenance_interval must be set to run the proxy maintainer")  # noqa:E501
+        self._maintainer_stop.clear()
+        self._maintainer = threading.Thread(target=self._maintenance_loop, name="proxy-maintainer", daemon=True)  # noqa:E501
+        self._maintainer.start()
+        self.logger.info("Proxy maintainer started")
+
+    def stop_maintainer(self) -> None:
+        """Stops the background maintainer and waits for it to exit."""
+        if not self._maintainer_running():
+            return
+        self._maintainer_stop.set()
+        self._maintainer_wake.set()
+        self._maintainer.join()
+        self.logger.info("Proxy maintainer stopped")
+
+    def _maintainer_running(self) -> bool:
+        return self._maintainer is not None and self._maintainer.is_alive()
+
+    def _maintenance_loop(self) -> None:
+        """Runs maintenance passes until stopped, sleeping between passes."""
+        last_recheck = time.monotonic()
+        while not self._maintainer_stop.is_set():
+            try:
+                self._sync_input_file()
+                if time.monotonic() - last_recheck >= self.recheck_interval:
+                    self._recheck_pool()
+                    last_recheck = time.monotonic()
+                self._replenish_spares()
+            except Exception as e:
+                self.logger.error(f"Proxy maintenance pass failed: {e}", exc_info=True)  # noqa:E501
+            self._maintainer_wake.wait(self.maintenance_interval)
+            self._maintainer_wake.clear()
+
+    def _sync_input_file(self) -> None:
+        """
+        Reloads the input file if it changed, validating newly listed proxies
+        and dropping idle proxies that are no longer listed.
+        """
+        try:
+            mtime = self.input_file.stat().st_mtime
+        except FileNotFoundError:
+            self.logger.warning(f"Input file '{self.input_file}' not found, keeping current pool")  # noqa:E501
+            return
+        if mtime == self._input_mtime:
+            return
+        self._input_mtime = mtime
+        self._listed = self._format_pool()
+        listed = set(self._listed)
+        with self._lock:
+            unlisted = [proxy for proxy, (_, in_use) in self.proxy_pool.items() if proxy not in listed and not in_use]  # noqa:E501
+            for proxy in unlisted:
+                del self.proxy_pool[proxy]
+            new_proxies = [proxy for proxy in self._listed if proxy not in self.proxy_pool and proxy not in self._retired]  # noqa:E501
+        self.logger.info(f"Input file changed: {len(new_proxies)} new proxies, {len(unlisted)} unlisted proxies dropped")  # noqa:E501
+        if new_proxies:
+            self._validate_into_pool(new_proxies)
+
+    def _recheck_pool(self) -> None:
+        """
+        Re-validates every pooled proxy. Failing idle proxies are removed at
+        once; failing proxies in use are removed when they are released.
+        """
+        with self._lock:
+            pooled = list(self.proxy_pool)
+        if not pooled:
+            return
+        healthy = set(self.validator.validate(pooled, self._record_validation))
+        with self._lock:
+            for proxy in pooled:
+                if proxy in healthy:
+                    self._unhealthy.discard(proxy)
+                elif proxy in self.proxy_pool:
+                    self._failed[proxy] = time.monotonic()
+                    if self.proxy_pool[proxy][1]:
+                        self._unhealthy.add(proxy)
+                    else:
+                        del self.proxy_pool[proxy]
+        self.logger.info(f"Re-checked {len(pooled)} pooled proxies, {len(pooled) - len(healthy)} failed")  # noqa:E501
+
+    def _replenish_spares(self) -> None:
+        """Validates listed proxies until the spares target of idle proxies is available."""  # noqa:E501
+        with self._lock:
+            needed = self._spares_target() - self._idle_count()
+            if needed <= 0 and not self._replenish_requested:
+                return
+            self._replenish_requested = False
+            now = time.monotonic()
+            candidates = [
+                proxy for proxy in self._listed
+                if proxy not in self.proxy_pool
+                and proxy not in self._retired
+                and now - self._failed.get(proxy, -self.recheck_interval) >= self.recheck_interval  # noqa:E501
+            ]
+        batch = candidates[:max(needed, 1) * 2]
+        if batch:
+            self._validate_into_pool(batch)
+
+    def _validate_into_pool(self, proxies: List[str]) -> None:
+        """Validates proxies on the maintainer thread, adding passing ones to the pool."""  # noqa:E501
+        self.validator.validate(proxies, self._pool_result_callback(proxies))
+
+    def _pool_result_callback(self, proxies: List[str]) -> ResultCallback:
+        """Returns a validation callback adding each passing proxy to the pool as it is validated."""  # noqa:E501
+        stored_usage = self._stored_usage(proxies)
+
+        def on_result(proxy: str, healthy: bool, latency: float) -> None:
+            self._record_validation(proxy, healthy, latency)
+            with self._pool_updated:
+                if healthy:
+                    self._failed.pop(proxy, None)
+                    self.proxy_pool.setdefault(proxy, (stored_usage.get(proxy, 0), False))  # noqa:E501
+                    self._pool_updated.notify_all()
+                else:
+                    self._failed[proxy] = time.monotonic()
+
+        return on_result
+
+    def _record_validation(self, proxy: str, healthy: bool, latency: float) -> None:  # noqa:E501
+        """Persists a validation result if a health store is configured."""
+        if self.health_store:
+            self.health_store.record_validation(proxy, healthy, latency)
+
+    def close(self) -> None:
+        """Stops the maintainer and closes the persistent health store, if configured."""  # noqa:E501
+        self.stop_maintainer()
+        if self.health_store:
+            self.health_store.close()
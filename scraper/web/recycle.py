@@ -0,0 +1,189 @@
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from scraper.config.logging import StructuredLogger
+from scraper.config.validator import DriverConfig
+from scraper.telemetry import metrics
+
+from .connection import ConnectionData
+from .docker import DockerManager
+from .driver import DriverManager
+
+# Lets the Selenium node hold the replacement session next to the current one
+RECYCLE_ENVIRONMENT = {
+    "SE_NODE_MAX_SESSIONS": "2",
+    "SE_NODE_OVERRIDE_MAX_SESSIONS": "true",
+}
+
+SIZE_UNITS = {"b": 1, "k": 1024, "kb": 1024, "m": 1024**2, "mb": 1024**2, "g": 1024**3, "gb": 1024**3}  # noqa:E501
+
+
+def parse_size(size: str) -> int:
+    """Parses a size with a unit, e.g. '1500MB', to bytes."""
+    value = size.lower()
+    number = int("".join(filter(str.isdigit, value)))
+    unit = "".join(filter(str.isalpha, value))
+    if unit not in SIZE_UNITS:
+        raise ValueError(f"Invalid size unit '{unit}' in '{size}'")
+    return number * SIZE_UNITS[unit]
+
+
+class _Replacement:
+    """A driver being created for a connection, and the proxy it was created with."""  # noqa:E501
+
+    def __init__(self, future: "Future[WebDriver]", proxy: Optional[str], reason: str) -> None:  # noqa:E501
+        self.future = future
+        self.proxy = proxy
+        self.reason = reason
+
+
+class DriverRecycler:
+    """
+    Replaces long-lived drivers before browser memory growth slows them
+    down. A driver is due once it loaded recycle_pages pages, is older than
+    recycle_age, or its container uses more than recycle_memory. The
+    replacement is created and has the session restored in the background
+    while the current driver keeps scraping, and is swapped in by poll
+    between links; the old driver is quit in the background.
+
+    Container memory is sampled in the background at most every
+    recycle_memory_interval seconds, as a Docker stats call takes about a
+    second.
+
+    Attributes:
+        logger (StructuredLogger): Logger for logging messages.
+        driver_manager (DriverManager): Creates and quits the drivers.
+        docker_manager (Optional[DockerManager]): Samples container memory.
+        max_pages (Optional[int]): Pages after which a driver is recycled.
+        max_age (Optional[float]): Age (in seconds) after which a driver is recycled.
+        max_memory (Optional[int]): Container memory (in bytes) above which the driver is recycled.
+        memory_interval (float): Minimum time (in seconds) between memory samples of a container.
+    """  # noqa:E501
+
+    def __init__(self, logger: StructuredLogger, driver_manager: DriverManager,
+                 docker_manager: Optional[DockerManager], cfg: DriverConfig) -> None:  # noqa:E501
+        self.logger = logger
+        self.driver_manager = driver_manager
+        self.docker_manager = docker_manager
+        self.max_pages = cfg.recycle_pages
+        self.max_age = cfg.recycle_age
+        self.max_memory = parse_size(cfg.recycle_memory) if cfg.recycle_memory else None  # noqa:E501
+        self.memory_interval = cfg.recycle_memory_interval
+        self._replacements: Dict[str, _Replacement] = {}
+        self._memory: Dict[str, int] = {}
+        self._sampled_at: Dict[str, float] = {}
+        self._sampling = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(thread_name_prefix="recycle")
+
+    @staticmethod
+    def enabled(cfg: DriverConfig) -> bool:
+        return bool(cfg.recycle_pages or cfg.recycle_age or cfg.recycle_memory)
+
+    def due(self, connection: ConnectionData) -> Optional[str]:
+        """Returns why the driver of a connection is due for recycling, or None."""  # noqa:E501
+        if self.max_pages and connection.pages >= self.max_pages:
+            return "pages"
+        if self.max_age and connection.driver_age() >= self.max_age:
+            return "age"
+        if self.max_memory:
+            self._sample_memory(connection)
+            with self._lock:
+                memory = self._memory.get(connection.name)
+            if memory is not None and memory >= self.max_memory:
+                return "memory"
+        return None
+
+    def poll(self, connection: ConnectionData, restore: Callable[[WebDriver], None]) -> Optional[WebDriver]:  # noqa:E501
+        """
+        Called between links: returns the replacement driver of a connection
+        once it is ready, and starts creating one if the driver is due.
+
+        Args:
+            connection (ConnectionData): The connection.
+            restore (Callable[[WebDriver], None]): Prepares a new driver, e.g. restores the session into it.
+
+        Returns:
+            Optional[WebDriver]: The driver to swap in, or None to keep the current one.
+        """  # noqa:E501
+        with self._lock:
+            replacement = self._replacements.get(connection.name)
+        if replacement:
+            if not replacement.future.done():
+                return None
+            with self._lock:
+                self._replacements.pop(connection.name, None)
+            return self._take(connection, replacement)
+        reason = self.due(connection)
+        if reason is None:
+            return None
+        self.logger.info(f"Recycling driver of '{connection.name}' ({reason}: {connection.pages} pages, {connection.driver_age():.0f}s old)")  # noqa:E501
+
+        def create() -> WebDriver:
+            driver = self.driver_manager.create_driver(connection)
+            restore(driver)
+            return driver
+
+        with self._lock:
+            self._replacements[connection.name] = _Replacement(self._executor.submit(create), connection.proxy, reason)  # noqa:E501
+        return None
+
+    def _take(self, connection: ConnectionData, replacement: _Replacement) -> Optional[WebDriver]:  # noqa:E501
+        try:
+            driver = replacement.future.result()
+        except Exception as e:
+            self.logger.warning(f"Failed to create replacement driver for '{connection.name}': {e}")  # noqa:E501
+            return None
+        if driver is None:
+            return None
+        if replacement.proxy != connection.proxy:
+            # The proxy rotated meanwhile, which already replaced the driver
+            self.retire(driver)
+            return None
+        metrics.record_driver_recycle(replacement.reason)
+        with self._lock:
+            self._memory.pop(connection.name, None)
+        return driver
+
+    def retire(self, driver: WebDriver) -> None:
+        """Quits a driver that was swapped out, in the background."""
+        self._executor.submit(self.driver_manager.quit_driver, driver)
+
+    def _sample_memory(self, connection: ConnectionData) -> None:
+        if not (self.docker_manager and connection.container):
+            return
+        now = time.monotonic()
+        with self._lock:
+            if connection.name in self._sampling or now - self._sampled_at.get(connection.name, -self.memory_interval) < self.memory_interval:  # noqa:E501
+                return
+            self._sampling.add(connection.name)
+            self._sampled_at[connection.name] = now
+
+        def sample() -> None:
+            try:
+                memory = self.docker_manager.memory_usage(connection.container)
+                with self._lock:
+                    if memory is not None:
+                        self._memory[connection.name] = memory
+            finally:
+                with self._lock:
+                    self._sampling.discard(connection.name)
+
+        self._executor.submit(sample)
+
+    def close(self) -> None:
+        """Quits replacement drivers that were never swapped in."""
+        with self._lock:
+            replacements = list(self._replacements.values())
+            self._replacements.clear()
+        for replacement in replacements:
+            try:
+                driver = replacement.future.result()
+            except Exception:
+                continue
+            if driver is not None:
+                self.driver_manager.quit_driver(driver)
+        self._executor.shutdown(wait=True)
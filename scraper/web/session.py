@@ -0,0 +1,160 @@
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Reads the origin and both storages of the current page
+CAPTURE_STORAGE_SCRIPT = """
+const copy = storage => Object.fromEntries(Object.entries(storage));
+return [location.origin, copy(window.localStorage), copy(window.sessionStorage)];
+"""
+
+# Writes both storages of the current page
+RESTORE_STORAGE_SCRIPT = """
+const [local, session] = arguments;
+for (const [key, value] of Object.entries(local)) window.localStorage.setItem(key, value);
+for (const [key, value] of Object.entries(session)) window.sessionStorage.setItem(key, value);
+"""  # noqa:E501
+
+
+class SessionState:
+    """
+    Snapshot of the browser state a target's startup actions leave behind:
+    cookies and the local and session storage of the target origin.
+
+    Attributes:
+        origin (str): The origin the state belongs to, e.g. 'https://example.com'.
+        cookies (List[Dict]): Cookies as returned by WebDriver.get_cookies.
+        local_storage (Dict[str, str]): Local storage entries.
+        session_storage (Dict[str, str]): Session storage entries.
+        captured_at (float): When the snapshot was taken (epoch seconds).
+    """
+
+    def __init__(self, origin: str, cookies: List[Dict], local_storage: Dict[str, str],  # noqa:E501
+                 session_storage: Dict[str, str], captured_at: Optional[float] = None) -> None:  # noqa:E501
+        self.origin = origin
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.session_storage = session_storage
+        self.captured_at = captured_at if captured_at is not None else time.time()  # noqa:E501
+
+    @classmethod
+    def capture(cls, driver: WebDriver) -> "SessionState":
+        """
+        Captures the state of the page the driver is on.
+
+        Args:
+            driver (WebDriver): The driver, on a page of the target origin.
+
+        Returns:
+            SessionState: The snapshot.
+        """
+        origin, local_storage, session_storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT)  # noqa:E501
+        return cls(origin, driver.get_cookies(), local_storage, session_storage)
+
+    def apply(self, driver: WebDriver) -> int:
+        """
+        Injects the state into a driver. WebDriver only sets cookies and
+        storage for the current page, so the driver is navigated to the origin
+        first.
+
+        Args:
+            driver (WebDriver): The driver to restore the state into.
+
+        Returns:
+            int: Number of cookies that were skipped, because they expired or were rejected.
+        """  # noqa:E501
+        driver.get(self.origin)
+        now = time.time()
+        skipped = 0
+        for cookie in self.cookies:
+            if cookie.get("expiry") is not None and cookie["expiry"] <= now:
+                skipped += 1
+                continue
+            try:
+                driver.add_cookie(cookie)
+            except Exception:
+                skipped += 1
+        driver.execute_script(RESTORE_STORAGE_SCRIPT, self.local_storage, self.session_storage)  # noqa:E501
+        return skipped
+
+    def age(self) -> float:
+        return time.time() - self.captured_at
+
+    def to_dict(self) -> Dict:
+        return {
+            "origin": self.origin,
+            "cookies": self.cookies,
+            "local_storage": self.local_storage,
+            "session_storage": self.session_storage,
+            "captured_at": self.captured_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SessionState":
+        return cls(data["origin"], data["cookies"], data["local_storage"], data["session_storage"], data["captured_at"])  # noqa:E501
+
+
+class SessionStore:
+    """
+    Holds the session snapshot of each target. With a directory set,
+    snapshots are also written to '<directory>/<target>.json', so they
+    survive a restart. The files hold session cookies and are only readable
+    by their owner.
+
+    Attributes:
+        directory (Optional[Path]): Directory snapshots are persisted to.
+        max_age (float): Time (in seconds) after which a snapshot is discarded.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_age: float = 3600) -> None:  # noqa:E501
+        self.directory = Path(directory) if directory else None
+        self.max_age = max_age
+        self._states: Dict[str, SessionState] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def get(self, name: str) -> Optional[SessionState]:
+        """Returns the snapshot of a target, or None if there is no fresh one."""  # noqa:E501
+        with self._lock:
+            state = self._states.get(name)
+        if state is None and self.directory:
+            try:
+                state = SessionState.from_dict(json.loads(self._path(name).read_text()))  # noqa:E501
+            except (OSError, ValueError, KeyError, TypeError):
+                state = None
+        if state is None or state.age() > self.max_age:
+            return None
+        with self._lock:
+            self._states[name] = state
+        return state
+
+    def save(self, name: str, state: SessionState) -> None:
+        with self._lock:
+            self._states[name] = state
+        if not self.directory:
+            return
+        path = self._path(name)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            partial = path.with_name(path.name + ".part")
+            descriptor = os.open(partial, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)  # noqa:E501
+            with os.fdopen(descriptor, "w") as f:
+                json.dump(state.to_dict(), f)
+            os.replace(partial, path)
+        except OSError:
+            pass  # persisting is best effort
+
+    def discard(self, name: str) -> None:
+        with self._lock:
+            self._states.pop(name, None)
+        if self.directory:
+            try:
+                self._path(name).unlink()
+            except OSError:
+                pass
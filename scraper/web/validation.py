@@ -0,0 +1,264 @@
+import ssl
+import time
+import base64
+import struct
+import asyncio
+import threading
+from urllib.parse import urlsplit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from scraper.config.logging import StructuredLogger
+
+ResultCallback = Callable[[str, bool, float], None]
+
+
+class ProbeError(Exception):
+    """
+    Custom exception raised when a proxy probe receives an invalid response
+    """
+
+
+class AsyncProxyValidator:
+    """
+    Validates large proxy pools concurrently using asyncio.
+
+    Each proxy is probed by tunnelling a single GET request for the test URL
+    through it. Probes run on one event loop, bounded by a global concurrency
+    limit and a per-host limit (many pools list several ports on the same IP),
+    and the whole run is cut off at an optional global deadline. Each result is
+    reported through a callback as soon as its probe finishes, so passing
+    proxies can be used before the run completes.
+
+    Attributes:
+        logger (StructuredLogger): Logger for logging messages.
+        test_url (str): URL requested through each proxy.
+        proxy_type (str): Connection protocol to use with proxy (http, https, socks4, socks5).
+        timeout (float): Time limit (in seconds) for a single probe.
+        max_concurrency (int): Maximum number of probes in flight.
+        per_host_limit (int): Maximum number of probes in flight per proxy host.
+        deadline (Optional[float]): Time limit (in seconds) for the whole validation run.
+        authentication (Optional[Dict[str, str]]): Credentials used for proxies listed without any.
+    """  # noqa:E501
+
+    def __init__(self, logger: StructuredLogger, test_url: str, proxy_type: str,
+                 timeout: float = 5, max_concurrency: int = 1000,
+                 per_host_limit: int = 10, deadline: Optional[float] = None,
+                 authentication: Optional[Dict[str, str]] = None) -> None:
+        self.logger = logger
+        self.test_url = test_url
+        self.proxy_type = proxy_type.lower()
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.deadline = deadline
+        self.authentication = authentication
+        target = urlsplit(test_url)
+        self._target_scheme = target.scheme
+        self._target_host = target.hostname or ""
+        self._target_port = target.port or (443 if target.scheme == "https" else 80)  # noqa:E501
+        self._target_path = (target.path or "/") + (f"?{target.query}" if target.query else "")  # noqa:E501
+        # A single client context is shared by every probe
+        self._ssl_context = ssl.create_default_context()
+        # Proxy endpoints rarely present certificates matching their address
+        self._proxy_ssl_context = ssl.create_default_context()
+        self._proxy_ssl_context.check_hostname = False
+        self._proxy_ssl_context.verify_mode = ssl.CERT_NONE
+
+    def validate(self, proxies: List[str],
+                 on_result: Optional[ResultCallback] = None) -> List[str]:
+        """
+        Validates the proxies, blocking until the run completes or the deadline passes.
+
+        Args:
+            proxies (List[str]): Proxies formatted as 'host:port' or 'user:pass@host:port'.
+            on_result (Optional[ResultCallback]): Called with each proxy, whether it passed and its latency (in seconds).
+
+        Returns:
+            List[str]: The proxies that passed validation, in completion order.
+        """  # noqa:E501
+        return asyncio.run(self._run(proxies, on_result))
+
+    def start(self, proxies: List[str],
+              on_result: Optional[ResultCallback] = None,
+              on_complete: Optional[Callable[[List[str]], None]] = None) -> threading.Thread:  # noqa:E501
+        """
+        Validates the proxies on a background thread.
+
+        Args:
+            proxies (List[str]): Proxies formatted as 'host:port' or 'user:pass@host:port'.
+            on_result (Optional[ResultCallback]): Called with each proxy, whether it passed and its latency (in seconds).
+            on_complete (Optional[Callable[[List[str]], None]]): Called with all passing proxies once the run ends.
+
+        Returns:
+            threading.Thread: The started validation thread.
+        """  # noqa:E501
+        def worker():
+            functional_proxies = []
+            try:
+                functional_proxies = self.validate(proxies, on_result)
+            except Exception as e:
+                self.logger.error(f"Proxy validation aborted: {e}", exc_info=True)  # noqa:E501
+            finally:
+                if on_complete:
+                    on_complete(functional_proxies)
+
+        thread = threading.Thread(target=worker, name="proxy-validation", daemon=True)  # noqa:E501
+        thread.start()
+        return thread
+
+    async def _run(self, proxies: List[str],
+                   on_result: Optional[ResultCallback]) -> List[str]:
+        """Probes all proxies and collects the functional ones."""
+        functional_proxies: List[str] = []
+        validation_errors: List[str] = []
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def probe(proxy: str) -> None:
+            host = self._split_proxy(proxy)[1]
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(self.per_host_limit))  # noqa:E501
+            async with global_limit, host_limit:
+                start = time.monotonic()
+                try:
+                    await asyncio.wait_for(self._probe(proxy), timeout=self.timeout)  # noqa:E501
+                    healthy = True
+                except Exception as e:
+                    validation_errors.append(f"{proxy}: {type(e).__name__} {e}")
+                    healthy = False
+                latency = time.monotonic() - start
+            if healthy:
+                functional_proxies.append(proxy)
+            if on_result:
+                on_result(proxy, healthy, latency)
+
+        tasks = [asyncio.create_task(probe(proxy)) for proxy in dict.fromkeys(proxies)]  # noqa:E501
+        if not tasks:
+            return functional_proxies
+        _, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        if pending:
+            self.logger.error(f"Proxy validation deadline reached with {len(pending)} probes unfinished")  # noqa:E501
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if validation_errors:
+            self.logger.debug("Proxy validation errors:\n" + "\n".join(validation_errors))  # noqa:E501
+        self.logger.info(f"Validated {len(functional_proxies)} out of {len(tasks)} proxies")  # noqa:E501
+        return functional_proxies
+
+    async def _probe(self, proxy: str) -> None:
+        """Requests the test URL through a proxy, raising if it does not answer with 200."""  # noqa:E501
+        credentials, host, port = self._split_proxy(proxy)
+        if credentials is None and self.authentication:
+            credentials = f"{self.authentication['username']}:{self.authentication['password']}"  # noqa:E501
+        if self.proxy_type.startswith("socks"):
+            reader, writer = await asyncio.open_connection(host, port)
+        elif self.proxy_type == "https":
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=self._proxy_ssl_context, server_hostname=host
+            )
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        try:
+            if self.proxy_type.startswith("socks"):
+                await self._socks5_connect(reader, writer, credentials)
+                tunnelled = True
+            elif self._target_scheme == "https":
+                await self._http_connect(reader, writer, credentials)
+                tunnelled = True
+            else:
+                tunnelled = False
+            if tunnelled and self._target_scheme == "https":
+                await writer.start_tls(self._ssl_context, server_hostname=self._target_host)  # noqa:E501
+            if tunnelled:
+                request_target = self._target_path
+                headers = ""
+            else:
+                # Plain HTTP proxies take the absolute URL as the request target
+                request_target = f"http://{self._target_host}:{self._target_port}{self._target_path}"  # noqa:E501
+                headers = self._proxy_auth_header(credentials)
+            writer.write(
+                f"GET {request_target} HTTP/1.1\r\n"
+                f"Host: {self._target_host}\r\n"
+                f"{headers}"
+                "Connection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+            status = await self._read_status(reader)
+            if status != 200:
+                raise ProbeError(f"Test URL returned status {status}")
+        finally:
+            writer.close()
+
+    async def _http_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,  # noqa:E501
+                            credentials: Optional[str]) -> None:
+        """Opens a CONNECT tunnel to the test host through an HTTP proxy."""
+        authority = f"{self._target_host}:{self._target_port}"
+        writer.write(
+            f"CONNECT {authority} HTTP/1.1\r\n"
+            f"Host: {authority}\r\n"
+            f"{self._proxy_auth_header(credentials)}\r\n".encode()
+        )
+        await writer.drain()
+        status = await self._read_status(reader)
+        # Consume the remaining response headers
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        if status != 200:
+            raise ProbeError(f"Proxy refused tunnel with status {status}")
+
+    async def _socks5_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,  # noqa:E501
+                              credentials: Optional[str]) -> None:
+        """Performs the SOCKS5 handshake and connects to the test host."""
+        writer.write(b"\x05\x02\x00\x02" if credentials else b"\x05\x01\x00")
+        await writer.drain()
+        version, method = await reader.readexactly(2)
+        if version != 5 or method == 0xFF:
+            raise ProbeError("SOCKS5 proxy rejected authentication methods")
+        if method == 2:
+            username, _, password = (credentials or ":").partition(":")
+            writer.write(
+                bytes([1, len(username)]) + username.encode()
+                + bytes([len(password)]) + password.encode()
+            )
+            await writer.drain()
+            _, auth_status = await reader.readexactly(2)
+            if auth_status != 0:
+                raise ProbeError("SOCKS5 proxy rejected credentials")
+        host = self._target_host.encode()
+        writer.write(b"\x05\x01\x00\x03" + bytes([len(host)]) + host + struct.pack("!H", self._target_port))  # noqa:E501
+        await writer.drain()
+        _, reply, _, address_type = await reader.readexactly(4)
+        if reply != 0:
+            raise ProbeError(f"SOCKS5 proxy failed to connect with code {reply}")
+        match address_type:
+            case 1:
+                await reader.readexactly(4 + 2)
+            case 4:
+                await reader.readexactly(16 + 2)
+            case _:
+                length = (await reader.readexactly(1))[0]
+                await reader.readexactly(length + 2)
+
+    async def _read_status(self, reader: asyncio.StreamReader) -> int:
+        """Reads an HTTP status line and returns the status code."""
+        status_line = await reader.readline()
+        parts = status_line.decode(errors="replace").split()
+        if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():  # noqa:E501
+            raise ProbeError(f"Malformed status line: {status_line!r}")
+        return int(parts[1])
+
+    @staticmethod
+    def _proxy_auth_header(credentials: Optional[str]) -> str:
+        """Builds the Proxy-Authorization header line for the given credentials."""
+        if not credentials:
+            return ""
+        token = base64.b64encode(credentials.encode()).decode()
+        return f"Proxy-Authorization: Basic {token}\r\n"
+
+    @staticmethod
+    def _split_proxy(proxy: str) -> Tuple[Optional[str], str, int]:
+        """Splits 'user:pass@host:port' into its credentials, host and port."""
+        credentials, _, address = proxy.rpartition("@")
+        host, _, port = address.rpartition(":")
+        return credentials or None, host, int(port)
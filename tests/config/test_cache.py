@@ -0,0 +1,69 @@
+import pytest
+import yaml
+from pathlib import Path
+from unittest.mock import patch
+
+from scraper.config import cache
+from scraper.config.cache import load_cached_config
+
+
+@pytest.fixture
+def config_file(tmp_path, test_logging_config, test_docker_config, test_proxy_config, test_driver_config):  # noqa:E501
+    links = tmp_path / "links.txt"
+    links.write_text("https://example.com\n")
+    config = {
+        "Logging": {**test_logging_config, "log_directory": str(tmp_path)},
+        "Docker": test_docker_config,
+        "Proxy": {**test_proxy_config, "input_file": str(test_proxy_config["input_file"])},  # noqa:E501
+        "Driver": test_driver_config,
+        "Target": [{"name": "books", "domain": "https://example.com", "input_file": str(links)}],  # noqa:E501
+    }
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump(config))
+    return path
+
+
+def load_counting(config_file, cache_dir):
+    with patch("scraper.config.cache.load_config", wraps=cache.load_config) as load:  # noqa:E501
+        config = load_cached_config(config_file, cache_dir)
+    return config, load.call_count
+
+
+def test_cache_hit_skips_validation(config_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    first, loads = load_counting(config_file, cache_dir)
+    assert loads == 1
+    second, loads = load_counting(config_file, cache_dir)
+    assert loads == 0
+    assert second["target"][0].name == first["target"][0].name == "books"
+
+
+def test_cache_invalidated_by_changes(config_file, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_counting(config_file, cache_dir)
+    (tmp_path / "links.txt").write_text("https://example.org\n")
+    assert load_counting(config_file, cache_dir)[1] == 1
+    config_file.write_text(config_file.read_text().replace("books", "comics"))
+    config, loads = load_counting(config_file, cache_dir)
+    assert loads == 1
+    assert config["target"][0].name == "comics"
+    assert load_counting(config_file, cache_dir)[1] == 0
+
+
+def test_schema_hash_covers_schedule_module():
+    before = cache._schema_hash()
+    read_bytes = Path.read_bytes
+
+    def edited(name):
+        def read(path):
+            data = read_bytes(path)
+            return data + b"\n# edited" if path.name == name else data
+        return read
+
+    with patch.object(Path, "read_bytes", edited("schedule.py")):
+        assert cache._schema_hash() != before
+    # Runtime modules of the package do not invalidate the cache
+    with patch.object(Path, "read_bytes", edited("retry.py")):
+        assert cache._schema_hash() == before
+    assert cache._schema_hash() == before
+    assert [module.name for module in cache._schema_modules()] == ["schedule.py", "validator.py"]  # noqa:E501
@@ -1,8 +1,10 @@
 import sys
+import gzip
 import json
 import logging
 
-from scraper.config.logging import JsonFormatter
+from scraper.config.logging import JsonFormatter, StructuredLogger
+from scraper.config.validator import LoggingConfig
 
 
 def test_json_formatter():
@@ -119,3 +121,78 @@ def test_structured_logger_exception_logging(mock_structured_logger):
         log_contents = f.read()
         assert "An error occurred" in log_contents
         assert "Test exception" in log_contents
+
+
+def test_json_formatter_compact():
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=100,
+        msg="Test %s",
+        args=("message",),
+        exc_info=None,
+    )
+    log_output = JsonFormatter(compact=True).format(record)
+    assert "\n" not in log_output
+    assert json.loads(log_output.rstrip(","))["message"] == "Test message"
+
+
+def test_structured_logger_rotation(mock_logging_config):
+    logger = StructuredLogger("test", mock_logging_config)
+    logger.file_handler.max_bytes = 200
+    first_file = logger.log_file
+    for i in range(5):
+        logger.info(f"entry {i}")
+    assert logger.log_file != first_file
+    assert logger.file_handler.bytes_written == logger.log_file.stat().st_size
+    logger.close()
+    entries = []
+    for log_file in sorted(mock_logging_config.log_directory.glob("*.json")):
+        with open(log_file, "r") as f:
+            entries.extend(json.load(f))
+    assert [entry["message"] for entry in entries] == [f"entry {i}" for i in range(5)]  # noqa:E501
+
+
+def test_structured_logger_async(test_logging_config):
+    cfg = LoggingConfig(**{**test_logging_config, "log_async": True})
+    logger = StructuredLogger("test", cfg)
+    assert logger.listener is not None
+    try:
+        raise ValueError("Test exception")
+    except ValueError:
+        logger.exception("Failed with %s", "args")
+    logger.info("Second entry")
+    log_file = logger.log_file
+    logger.close()
+    with open(log_file, "r") as f:
+        log_contents = f.read()
+    log_data = json.loads(log_contents)
+    assert [entry["message"] for entry in log_data] == ["Failed with args", "Second entry"]  # noqa:E501
+    assert "Test exception" in log_data[0]["exception"]
+    assert log_data[0]["origin"].startswith("test_logging.test_structured_logger_async")  # noqa:E501
+    assert len(logger.handlers) == 0
+
+
+def test_structured_logger_jsonl_rotation_and_compression(test_logging_config):
+    cfg = LoggingConfig(**{**test_logging_config, "log_file_format": "jsonl", "log_compress": True})  # noqa:E501
+    logger = StructuredLogger("test", cfg)
+    assert logger.log_file.suffix == ".jsonl"
+    logger.file_handler.max_bytes = 200
+    for i in range(5):
+        logger.info(f"entry {i}")
+    # The active file is valid JSON Lines without closing the logger
+    with open(logger.log_file, "r") as f:
+        assert all(json.loads(line) for line in f)
+    logger.close()
+    log_directory = test_logging_config["log_directory"]
+    rotated = sorted(log_directory.glob("*.jsonl.gz"))
+    assert rotated
+    entries = []
+    for log_file in rotated:
+        with gzip.open(log_file, "rt") as f:
+            entries.extend(json.loads(line) for line in f)
+    for log_file in sorted(log_directory.glob("*.jsonl")):
+        with open(log_file, "r") as f:
+            entries.extend(json.loads(line) for line in f)
+    assert sorted(entry["message"] for entry in entries) == [f"entry {i}" for i in range(5)]  # noqa:E501
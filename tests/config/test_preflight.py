@@ -0,0 +1,54 @@
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+
+from scraper.config.validator import ConfigError, PreflightConfig
+from scraper.config.preflight import run_checks, run_preflight
+
+
+@pytest.fixture
+def preflight_cfg(mock_logging_config, mock_docker_config):
+    return {
+        "logging": mock_logging_config,
+        "docker": mock_docker_config,
+        "preflight": PreflightConfig(timeout=0.5),
+    }
+
+
+def test_run_checks_in_parallel_with_timeout():
+    def fail():
+        raise ValueError("Insufficient disk space")
+
+    start = time.monotonic()
+    results = run_checks({
+        "fast": lambda: True,
+        "failing": fail,
+        "hung": lambda: time.sleep(2),
+        "slow": lambda: time.sleep(0.2),
+    }, timeout=0.5)
+    assert time.monotonic() - start < 1
+    assert results == {
+        "fast": None,
+        "failing": "Insufficient disk space",
+        "hung": "timed out after 0.5s",
+        "slow": None,
+    }
+
+
+def test_run_preflight_caches_success(preflight_cfg):
+    check = MagicMock(return_value=True)
+    with patch("scraper.config.preflight.build_checks", return_value={"docker": check}):  # noqa:E501
+        assert run_preflight(preflight_cfg)
+        assert not run_preflight(preflight_cfg)
+        preflight_cfg["preflight"] = PreflightConfig(cpu_threshold=0.5)
+        assert run_preflight(preflight_cfg)
+    assert check.call_count == 2
+
+
+def test_run_preflight_failure_is_not_cached(preflight_cfg):
+    check = MagicMock(side_effect=ValueError("Docker daemon is not running"))
+    with patch("scraper.config.preflight.build_checks", return_value={"docker": check}):  # noqa:E501
+        for _ in range(2):
+            with pytest.raises(ConfigError, match="docker: Docker daemon is not running"):  # noqa:E501
+                run_preflight(preflight_cfg)
+    assert check.call_count == 2
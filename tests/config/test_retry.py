@@ -0,0 +1,140 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from scraper.config import deadline, retry
+from scraper.config.deadline import Deadline
+from scraper.config.retry import RetryBudget, RetryPolicy
+from scraper.config.validator import Interaction, RetryConfig
+from scraper.etl.exceptions import ClickException
+from scraper.etl.helper import TRANSIENT_ERRORS, click
+from scraper.etl.startup import StartupManager
+from scraper.telemetry import metrics
+from scraper.web.connection import ConnectionData
+from scraper.web.controller import WebController
+from scraper.web.proxy import UsageError
+
+
+def flaky(failures, result="ok"):
+    calls = []
+
+    def fn():
+        calls.append(None)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return result
+    return fn, calls
+
+
+def test_backoff_is_capped_and_jittered():
+    policy = RetryPolicy(initial_delay=1, max_delay=5, multiplier=2, jitter=False)
+    assert [policy.backoff(retry) for retry in (1, 2, 3, 4)] == [1, 2, 4, 5]
+    policy.jitter = True
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+
+
+def test_call_retries_transient_errors():
+    fn, calls = flaky([TimeoutException("slow"), TimeoutException("slow")])
+    on_retry = MagicMock()
+    with patch("time.sleep") as sleep:
+        assert RetryPolicy(attempts=3, jitter=False).call(fn, "test", (TimeoutException,), on_retry) == "ok"  # noqa:E501
+    assert len(calls) == 3
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+    assert [call.args[1:] for call in on_retry.call_args_list] == [(1, 0.5), (2, 1.0)]  # noqa:E501
+
+
+def test_call_gives_up_on_permanent_errors_and_exhaustion():
+    fn, calls = flaky([ValueError("bad config")])
+    with pytest.raises(ValueError):
+        RetryPolicy().call(fn, "test", (TimeoutException,))
+    assert len(calls) == 1
+    fn, calls = flaky([TimeoutException("slow")] * 5)
+    with patch("time.sleep"), pytest.raises(TimeoutException):
+        RetryPolicy(attempts=2).call(fn, "test", (TimeoutException,))
+    assert len(calls) == 2
+
+
+def test_classification_follows_causes_and_config():
+    try:
+        raise ClickException("click failed") from TimeoutException("slow")
+    except ClickException as e:
+        wrapped = e
+    policy = RetryPolicy()
+    assert policy.is_retryable(wrapped, TRANSIENT_ERRORS)
+    assert not policy.is_retryable(ValueError(), TRANSIENT_ERRORS)
+    assert RetryPolicy(retry_on=["ValueError"]).is_retryable(ValueError(), TRANSIENT_ERRORS)  # noqa:E501
+    assert not RetryPolicy(give_up_on=["TimeoutException"]).is_retryable(wrapped, TRANSIENT_ERRORS)  # noqa:E501
+
+
+def test_budget_limits_retry_storms():
+    budget = RetryBudget(ratio=0.5, min_retries=1, window=60)
+    for _ in range(4):
+        budget.record_call()
+    assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+    policy = RetryPolicy(attempts=5, budget=RetryBudget(ratio=0, min_retries=1))
+    fn, calls = flaky([TimeoutException("slow")] * 5)
+    with metrics.scope(target="retry-budget"), patch("time.sleep"), pytest.raises(TimeoutException):  # noqa:E501
+        policy.call(fn, "navigation", (TimeoutException,))
+    assert len(calls) == 2
+    assert metrics.RETRIES.value(operation="navigation", target="retry-budget", outcome="budget_exhausted") == 1  # noqa:E501
+
+
+def test_policy_from_target_config():
+    policy = RetryPolicy.from_config(RetryConfig(attempts=5, budget_ratio=0.1, give_up_on=["UsageError"]))  # noqa:E501
+    assert policy.attempts == 5 and policy.budget.ratio == 0.1
+    assert policy.give_up_on == ("UsageError",)
+
+
+def test_click_retries_with_scoped_policy():
+    stale = ClickException("stale")
+    stale.__cause__ = TimeoutException()
+    driver = MagicMock()
+    driver.find_element.side_effect = WebDriverException("intercepted")
+    with retry.scope(RetryPolicy(attempts=3, initial_delay=0)), \
+         patch("scraper.etl.helper.retry_click", side_effect=[stale, None]) as retry_click:  # noqa:E501
+        click(driver, "#next", "id", 0)
+    assert retry_click.call_count == 2
+    with retry.scope(RetryPolicy(attempts=3, initial_delay=0)), \
+         patch("scraper.etl.helper.retry_click") as retry_click, pytest.raises(ClickException):  # noqa:E501
+        click(driver, "#next", "shadow root", 0)
+    retry_click.assert_not_called()
+
+
+def test_make_request_rotation_is_bounded(mock_structured_logger):
+    connection = ConnectionData("test", "4444", proxy="127.0.0.1:8080", driver=MagicMock(spec=WebDriver))  # noqa:E501
+    controller = WebController(mock_structured_logger, {"test": connection})
+    controller.proxy_manager = MagicMock()
+    controller.proxy_manager.increment_usage.side_effect = UsageError("limit")
+    with retry.scope(RetryPolicy(attempts=3)), \
+         patch.object(controller, "rotate_proxy") as rotate, \
+         patch.object(mock_structured_logger, "error") as error:
+        controller.make_request("test", "https://example.com")
+    assert rotate.call_count == 2
+    assert connection.driver.get.call_count == 3
+    assert "limit" in error.call_args.args[0]
+
+
+def test_call_skips_retries_past_the_deadline():
+    policy = RetryPolicy(attempts=5, initial_delay=1, jitter=False)
+    fn, calls = flaky([WebDriverException("slow")] * 4)
+    with deadline.scope(Deadline("link", 0.5)), patch("time.sleep") as sleep:
+        with pytest.raises(WebDriverException):
+            policy.call(fn, "navigation")
+    assert len(calls) == 1
+    sleep.assert_not_called()
+
+
+def test_startup_click_retries_at_one_layer(mock_structured_logger):
+    interaction = Interaction(type="click", locator="#accept", locator_type="id", wait_interval=0)  # noqa:E501
+    driver = MagicMock()
+    driver.find_element.side_effect = WebDriverException("intercepted")
+    stale = ClickException("stale")
+    stale.__cause__ = TimeoutException()
+    with retry.scope(RetryPolicy(attempts=3, initial_delay=0)), \
+         patch("scraper.etl.helper.retry_click", side_effect=stale) as retry_click, \
+         pytest.raises(ClickException):
+        StartupManager(mock_structured_logger, driver)._perform_startup_action("cookies", interaction)  # noqa:E501
+    # One plain click and two retries, not three of each per startup attempt
+    assert driver.find_element.call_count == 1
+    assert retry_click.call_count == 2
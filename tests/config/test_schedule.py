@@ -0,0 +1,31 @@
+import pytest
+from datetime import datetime
+
+from scraper.config.schedule import CronSchedule, IntervalSchedule, parse_schedule  # noqa:E501
+
+
+@pytest.mark.parametrize("spec, seconds", [("90", 90), ("90s", 90), ("15m", 900), ("1.5h", 5400), ("1d", 86400)])  # noqa:E501
+def test_interval_schedule(spec, seconds):
+    schedule = parse_schedule(spec)
+    assert isinstance(schedule, IntervalSchedule)
+    assert schedule.seconds == seconds
+
+
+@pytest.mark.parametrize("expression, after, expected", [
+    ("0 * * * *", datetime(2024, 5, 1, 10, 0), datetime(2024, 5, 1, 11, 0)),
+    ("*/15 * * * *", datetime(2024, 5, 1, 10, 7, 30), datetime(2024, 5, 1, 10, 15)),  # noqa:E501
+    ("30 2 * * 1-5", datetime(2024, 5, 3, 3, 0), datetime(2024, 5, 6, 2, 30)),  # Friday -> Monday  # noqa:E501
+    ("0 0 31 * *", datetime(2024, 4, 1), datetime(2024, 5, 31)),
+    ("0 12 1 * 0", datetime(2024, 5, 1, 13, 0), datetime(2024, 5, 5, 12, 0)),  # 1st or Sunday  # noqa:E501
+    ("0 0 29 2 *", datetime(2024, 3, 1), datetime(2028, 2, 29)),
+])
+def test_cron_schedule(expression, after, expected):
+    schedule = parse_schedule(expression)
+    assert isinstance(schedule, CronSchedule)
+    assert schedule.next_run(after) == expected
+
+
+@pytest.mark.parametrize("spec", ["soon", "* * * *", "61 * * * *", "* * * * 8", "*/0 * * * *"])  # noqa:E501
+def test_invalid_schedule(spec):
+    with pytest.raises(ValueError):
+        parse_schedule(spec)
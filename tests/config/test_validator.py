@@ -8,6 +8,8 @@ from scraper.config.validator import (
     DockerConfig,
     ProxyConfig,
     DriverConfig,
+    Interaction,
+    ImagePreprocessing,
     load_config,
     check_network_connectivity,
     check_disk_space,
@@ -253,3 +255,34 @@ def test_load_config_invalid_toml(tmp_path):
     with pytest.raises(ConfigError) as exc_info:
         load_config(config_file)
     assert "Error parsing configuration" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("locator_type, by_type", [
+    ("CSS_SELECTOR", "css selector"),
+    ("css selector", "css selector"),
+    (" xpath ", "xpath"),
+    ("partial link text", "partial link text"),
+])
+def test_locator_type_compiled_to_by_type(locator_type, by_type):
+    interaction = Interaction(type="click", locator="#next", locator_type=locator_type)  # noqa:E501
+    assert interaction.locator_type == by_type
+
+
+def test_invalid_locator_type():
+    with pytest.raises(ValueError):
+        Interaction(type="click", locator="#next", locator_type="shadow root")
+
+
+@pytest.mark.parametrize("mod_config, expected_validity", [
+    ({}, True),
+    ({"scale": 1, "median_size": 5, "threshold": 0}, True),
+    ({"median_size": 4}, False),
+    ({"scale": 0}, False),
+    ({"threshold": 256}, False),
+])
+def test_image_preprocessing_validation(mod_config, expected_validity):
+    if expected_validity:
+        ImagePreprocessing(**mod_config)
+    else:
+        with pytest.raises(ValueError):
+            ImagePreprocessing(**mod_config)
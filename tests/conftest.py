@@ -91,7 +91,7 @@ def mock_proxy_config(test_proxy_config):
 
 @pytest.fixture
 def mock_proxy_manager(mock_structured_logger, mock_proxy_config):
-    with patch("scraper.web.proxy.requests.get") as mock_get:
+    with patch("requests.get") as mock_get:
         mock_get.return_value = MagicMock(status_code=200)
         return ProxyManager(mock_structured_logger, mock_proxy_config)
 
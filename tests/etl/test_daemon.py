@@ -0,0 +1,86 @@
+import json
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from scraper.config.validator import DaemonConfig, TargetConfig
+from scraper.etl.daemon import ScrapeDaemon
+
+
+@pytest.fixture
+def targets():
+    return [
+        TargetConfig(name="hourly", domain="https://example.com", schedule="1h"),  # noqa:E501
+        TargetConfig(name="manual", domain="https://example.org"),
+    ]
+
+
+@pytest.fixture
+def daemon(mock_structured_logger, targets):
+    return ScrapeDaemon(mock_structured_logger, MagicMock(), targets, DaemonConfig(port=0, poll_interval=0.05))  # noqa:E501
+
+
+def request(daemon, method, path, headers=None):
+    req = Request(f"http://127.0.0.1:{daemon.port}{path}", method=method, headers=headers or {})  # noqa:E501
+    with urlopen(req) as response:
+        return json.loads(response.read())
+
+
+def test_daemon_runs_due_targets_and_serves_control(daemon):
+    scraped = []
+    done = threading.Event()
+
+    def scrape(target):
+        scraped.append(target.name)
+        if len(scraped) == 2:
+            done.set()
+
+    with patch.object(daemon.target_manager, "scrape_target", side_effect=scrape):  # noqa:E501
+        daemon.start_control_server()
+        runner = threading.Thread(target=daemon.run)
+        runner.start()
+        try:
+            assert request(daemon, "POST", "/targets/manual/run") == {"started": True}  # noqa:E501
+            assert done.wait(5)
+        finally:
+            request(daemon, "POST", "/shutdown")
+            runner.join(5)
+    assert not runner.is_alive()
+    assert sorted(scraped) == ["hourly", "manual"]
+    status = daemon.status()
+    assert status["hourly"]["runs"] == 1
+    assert status["hourly"]["next_run"] > status["hourly"]["last_run"]
+    assert status["manual"]["next_run"] is None
+    assert daemon.controller.ensure_connected.call_count == 2
+    daemon.controller.disconnect.assert_not_called()
+
+
+def test_trigger_unknown_and_running_target(daemon):
+    with pytest.raises(KeyError):
+        daemon.trigger("missing")
+    daemon.targets["manual"].running = True
+    assert not daemon.trigger("manual")
+
+
+def test_control_server_requires_the_token(mock_structured_logger, targets):
+    daemon = ScrapeDaemon(mock_structured_logger, MagicMock(), targets, DaemonConfig(port=0, token="S3cret"))  # noqa:E501
+    daemon.start_control_server()
+    try:
+        for headers in [None, {"Authorization": "Bearer s3cret"}]:
+            with pytest.raises(HTTPError) as e:
+                request(daemon, "POST", "/targets/manual/run", headers)
+            assert e.value.code == 401
+        assert not daemon.targets["manual"].running
+        assert request(daemon, "GET", "/status", {"Authorization": "Bearer S3cret"})["manual"]["runs"] == 0  # noqa:E501
+    finally:
+        daemon._server.shutdown()
+        daemon._server.server_close()
+
+
+def test_remote_bind_requires_a_token():
+    with pytest.raises(ValueError, match="requires a token"):
+        DaemonConfig(host="0.0.0.0")
+    assert DaemonConfig(host="0.0.0.0", token="S3cret").token == "S3cret"
+    assert DaemonConfig(host="::1").token is None
@@ -0,0 +1,60 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from scraper.config.validator import Interaction
+from scraper.etl.exceptions import BatchInteractionException
+from scraper.etl.helper import BATCH_INTERACTION_SCRIPT, batch_interact
+from scraper.etl.interaction import InteractionManager
+
+
+def interactions():
+    return [
+        Interaction(type="click", locator="#filters", locator_type="css selector", wait_interval=1),  # noqa:E501
+        Interaction(type="dropdown", locator="//select", locator_type="xpath", wait_interval=0.5, option_text="Price"),  # noqa:E501
+    ]
+
+
+def test_batch_interact_runs_one_script():
+    driver = MagicMock()
+    driver.timeouts.script = 30
+    driver.execute_async_script.return_value = [{"status": "ok"}, {"status": "no_option"}]  # noqa:E501
+    results = batch_interact(driver, interactions(), settle_quiet=0.1)
+    assert [result["status"] for result in results] == ["ok", "no_option"]
+    script, steps, quiet_ms = driver.execute_async_script.call_args.args
+    assert script == BATCH_INTERACTION_SCRIPT
+    assert steps == [
+        {"type": "click", "by": "css selector", "locator": "#filters", "wait": 1000, "option_text": None},  # noqa:E501
+        {"type": "dropdown", "by": "xpath", "locator": "//select", "wait": 500, "option_text": "Price"},  # noqa:E501
+    ]
+    assert quiet_ms == 100
+    assert [call.args[0] for call in driver.set_script_timeout.call_args_list] == [pytest.approx(8.2), 30]  # noqa:E501
+
+
+def test_batch_interact_raises_on_script_failure():
+    driver = MagicMock()
+    driver.execute_async_script.side_effect = Exception("script timeout")
+    with pytest.raises(BatchInteractionException, match="script timeout"):
+        batch_interact(driver, interactions())
+    driver.execute_async_script.side_effect = None
+    driver.execute_async_script.return_value = None
+    with pytest.raises(BatchInteractionException):
+        batch_interact(driver, interactions())
+
+
+def test_manager_batches_and_reports_steps(mock_structured_logger):
+    driver = MagicMock()
+    driver.execute_async_script.return_value = [
+        {"status": "ok", "message": None, "elapsed": 0.2},
+        {"status": "not_found", "message": None, "elapsed": 0.5},
+    ]
+    steps = interactions() + [Interaction(type="hover", locator="#menu", locator_type="id")]  # noqa:E501
+    with patch.object(mock_structured_logger, "error") as error:
+        InteractionManager(mock_structured_logger, driver).execute("books", steps, batch=True)  # noqa:E501
+    assert driver.execute_async_script.call_count == 1
+    assert len(driver.execute_async_script.call_args.args[1]) == 2
+    driver.find_element.assert_not_called()
+    errors = [call.args[0] for call in error.call_args_list]
+    assert errors == [
+        "Undefined interaction 'hover'",
+        "Element not found during interaction 'dropdown': //select",
+    ]
@@ -0,0 +1,100 @@
+import csv
+from unittest.mock import MagicMock, patch
+
+from scraper.config.validator import TargetConfig
+from scraper.etl import link_queue
+from scraper.etl.link_queue import LinkRetryQueue
+from scraper.etl.target import TargetManager
+
+
+def test_queue_backs_off_and_dead_letters(tmp_path):
+    dead_letter_file = tmp_path / "links.failed.txt"
+    queue = LinkRetryQueue(max_attempts=2, delay=60, dead_letter_file=dead_letter_file)  # noqa:E501
+    assert queue.push({"link": "https://a.com", "additional_data": []}, link_queue.NAVIGATION, "timeout")  # noqa:E501
+    assert len(queue) == 1
+    assert queue.pop_ready() is None  # still backing off
+    assert not queue.push({"link": "https://b.com", "additional_data": ["x"]}, link_queue.PARSE, "bad, html", attempts=2)  # noqa:E501
+    assert dead_letter_file.read_text() == "https://b.com,x\n"
+    with open(tmp_path / "links.failed.errors.csv", newline="") as f:
+        row = next(csv.reader(f))
+    assert row[:3] == ["https://b.com", "parse", "2"]
+    assert row[-1] == "bad, html"
+    with patch("time.sleep") as sleep:
+        failed = queue.pop_next()
+    assert failed.link == "https://a.com" and failed.attempts == 1
+    assert 59 < sleep.call_args.args[0] <= 60
+    assert queue.pop_next() is None
+
+
+def scrape(tmp_path, make_request, max_attempts=3, interleave=False, restarts=None):  # noqa:E501
+    input_file = tmp_path / "links.txt"
+    input_file.write_text("https://a.com\nhttps://b.com\n")
+    target = TargetConfig(name="books", domain="https://a.com", input_file=input_file, extractions=[],  # noqa:E501
+                          link_retry={"max_attempts": max_attempts, "delay": 0, "interleave": interleave})  # noqa:E501
+    controller = MagicMock()
+    controller.apply_restart.return_value = False
+    controller.apply_restart.side_effect = restarts
+    controller.make_request.side_effect = make_request
+    manager = TargetManager(MagicMock(), controller)
+    with patch.object(TargetManager, "_scrape_link", return_value=[]) as scrape_link:  # noqa:E501
+        manager.scrape_target(target)
+    return controller, scrape_link, tmp_path / "links.failed.txt"
+
+
+def test_failed_link_is_retried_on_a_new_proxy_at_the_end(tmp_path):
+    results = iter([False, True, True])
+    controller, scrape_link, dead_letter_file = scrape(tmp_path, lambda name, link: next(results))  # noqa:E501
+    assert [call.args[1] for call in controller.make_request.call_args_list] == ["https://a.com", "https://b.com", "https://a.com"]  # noqa:E501
+    controller.rotate_proxy.assert_called_once()
+    assert controller.rotate_proxy.call_args.args[1] == "a.com"
+    assert scrape_link.call_count == 2
+    assert not dead_letter_file.exists()
+
+
+def test_requested_restart_is_applied_between_links(tmp_path):
+    results = iter([False, True, True])
+    controller, scrape_link, dead_letter_file = scrape(tmp_path, lambda name, link: next(results), restarts=[False, False, True])  # noqa:E501
+    assert controller.apply_restart.call_count == 3
+    # The restart already moved the retry of a.com to a new proxy and driver
+    controller.rotate_proxy.assert_not_called()
+    assert controller.recycle_driver.call_count == 2
+    assert scrape_link.call_count == 2
+
+
+def test_interleaved_retry_and_dead_letter(tmp_path):
+    controller, scrape_link, dead_letter_file = scrape(
+        tmp_path, lambda name, link: link != "https://a.com", max_attempts=2, interleave=True)  # noqa:E501
+    # a.com is retried before b.com, then given up on
+    assert [call.args[1] for call in controller.make_request.call_args_list] == ["https://a.com", "https://a.com", "https://b.com"]  # noqa:E501
+    assert dead_letter_file.read_text() == "https://a.com\n"
+
+
+def test_dead_letter_file_reads_back_as_input(tmp_path):
+    dead_letter_file = tmp_path / "links.failed.txt"
+    queue = LinkRetryQueue(max_attempts=1, dead_letter_file=dead_letter_file)
+    queue.push({"link": "https://a.com/1", "additional_data": ["sku1", "red"]}, link_queue.NAVIGATION, "Message: timeout\n  at line 1, col 2")  # noqa:E501
+    queue.push({"link": "https://a.com/2", "additional_data": []}, link_queue.PARSE, "bad, html")  # noqa:E501
+    target = TargetConfig(name="books", domain="https://a.com", input_file=dead_letter_file, extractions=[],  # noqa:E501
+                          supplemental_input_data=True)
+    links = TargetManager(MagicMock(), MagicMock())._get_target_links(target)
+    assert links == [
+        {"link": "https://a.com/1", "additional_data": ["sku1", "red"]},
+        {"link": "https://a.com/2", "additional_data": []},
+    ]
+    with open(queue.errors_file, newline="") as f:
+        assert [row[-1] for row in csv.reader(f)] == ["Message: timeout\n  at line 1, col 2", "bad, html"]  # noqa:E501
+
+
+def test_partial_results_are_written_on_the_last_attempt(mock_structured_logger):  # noqa:E501
+    target = TargetConfig(name="books", domain="https://a.com", extractions=[])
+    manager = TargetManager(mock_structured_logger, MagicMock())
+    failures = [(link_queue.ELEMENT_NOT_FOUND, "table: missing")]
+    with patch("scraper.etl.target.ExtractionManager") as extraction, \
+         patch.object(TargetManager, "write_output") as write_output:
+        extraction.return_value.execute.return_value = {"out.csv": {"data": [["1"]], "output_type": "csv"}}  # noqa:E501
+        extraction.return_value.failures = failures
+        link_info = {"link": "https://a.com", "additional_data": []}
+        assert manager._scrape_link(target, link_info, MagicMock(), write_partial=False) == failures  # noqa:E501
+        write_output.assert_not_called()
+        assert manager._scrape_link(target, link_info, MagicMock()) == failures
+        write_output.assert_called_once()
@@ -0,0 +1,116 @@
+import base64
+import pytest
+import numpy as np
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+from PIL import Image, ImageFilter, ImageOps
+
+from scraper.config.validator import Extraction
+from scraper.etl.exceptions import OCRException
+from scraper.etl.extraction import ExtractionManager
+from scraper.etl.helper import get_element_image
+from scraper.etl.ocr import OCREngine, recognize
+from scraper.etl.preprocessing import Preprocessor
+
+
+def png(width=1920, height=995):
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_recognize_preprocesses_and_strips():
+    with patch("pytesseract.image_to_string", return_value=" 42\n") as ocr:
+        assert recognize(png()) == "42"
+    image = ocr.call_args.args[0]
+    assert image.size == (300, 180)
+    assert image.mode == "L"
+    assert ocr.call_args.kwargs == {"lang": "eng", "config": "--psm 7"}
+
+
+def test_engine_returns_futures():
+    with OCREngine(workers=1) as engine:
+        futures = engine.submit_batch([b"not an image", b""], preprocessor=None)  # noqa:E501
+        for future in futures:
+            with pytest.raises(OCRException, match="Failed to load the image"):
+                future.result(timeout=30)
+
+
+def test_image_extraction_uses_element_screenshots(mock_structured_logger):
+    first, second = MagicMock(), MagicMock()
+    first.screenshot_as_png = png(120, 40)
+    second.screenshot_as_png = png(80, 30)
+    driver = MagicMock()
+    driver.find_element.return_value = first
+    driver.find_elements.return_value = [first, second]
+    extraction = Extraction(type="img", locator="img.captcha", locator_type="css selector", unique=False,  # noqa:E501
+                            wait_interval=0, output_type="csv", output_file="out.csv")  # noqa:E501
+    with patch("pytesseract.image_to_string", side_effect=["ab12", "cd34"]) as ocr:  # noqa:E501
+        data = ExtractionManager(mock_structured_logger, driver)._perform_extraction(extraction)  # noqa:E501
+    assert data == [["ab12"], ["cd34"]]
+    assert [call.args[0].size for call in ocr.call_args_list] == [(360, 120), (240, 90)]  # noqa:E501
+    driver.get_screenshot_as_png.assert_not_called()
+
+
+def test_get_element_image_from_src():
+    driver, element = MagicMock(), MagicMock()
+    element.get_attribute.return_value = "https://example.com/captcha.png"
+    driver.execute_async_script.return_value = base64.b64encode(b"image").decode()  # noqa:E501
+    assert get_element_image(driver, element, "src") == b"image"
+    driver.execute_async_script.return_value = None
+    with pytest.raises(OCRException):
+        get_element_image(driver, element, "src")
+
+
+def noisy_capture(width=120, height=40, seed=0):
+    rng = np.random.default_rng(seed)
+    pixels = np.full((height, width, 3), 245, dtype=np.int16)
+    pixels[height // 3:height // 2, width // 8:width // 2] = 20  # dark glyph
+    pixels = np.clip(pixels + rng.integers(-40, 40, pixels.shape), 0, 255).astype(np.uint8)  # noqa:E501
+    buffer = BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def legacy_preprocess(raw_image):
+    image = Image.open(BytesIO(raw_image)).convert("RGB")
+    image = image.resize((image.width * 3, image.height * 3), Image.Resampling.LANCZOS)  # noqa:E501
+    return ImageOps.grayscale(image.filter(ImageFilter.MedianFilter(size=3))).point(lambda p: p > 230 and 255)  # noqa:E501
+
+
+def test_preprocessor_matches_legacy_pipeline():
+    captures = [noisy_capture(seed=seed) for seed in range(3)] + [noisy_capture(57, 23)]  # noqa:E501
+    processed = Preprocessor().batch(captures)
+    for capture, image in zip(captures, processed):
+        assert image.mode == "L"
+        assert image.tobytes() == legacy_preprocess(capture).tobytes()
+    # Tesseract gets the same pixels, so it reads the same text
+    with patch("pytesseract.image_to_string", side_effect=lambda image, **kwargs: image.tobytes().hex()) as ocr:  # noqa:E501
+        assert [recognize(capture, Preprocessor()) for capture in captures] == [legacy_preprocess(capture).tobytes().hex() for capture in captures]  # noqa:E501
+    assert ocr.call_count == len(captures)
+
+
+def test_preprocessor_matches_per_image_and_batch():
+    noisy = Image.new("L", (40, 20), 255)
+    noisy.putpixel((5, 5), 0)  # isolated speck, removed by the fast median filter  # noqa:E501
+    for x in range(10, 30):
+        for y in range(8, 12):
+            noisy.putpixel((x, y), 0)
+    buffer = BytesIO()
+    noisy.save(buffer, format="PNG")
+    for preprocessor in (Preprocessor(scale=2), Preprocessor(scale=2, fast=True)):  # noqa:E501
+        single = preprocessor(buffer.getvalue())
+        batch = preprocessor.batch([png(30, 10), buffer.getvalue(), png(30, 10)])  # noqa:E501
+        assert [image.size for image in batch] == [(60, 20), (80, 40), (60, 20)]  # noqa:E501
+        assert single.tobytes() == batch[1].tobytes()
+        assert single.getpixel((40, 20)) == 0
+        assert single.getextrema() == (0, 255)
+    assert single.getpixel((10, 10)) == 255
+
+
+def test_preprocessor_crop_and_errors():
+    assert Preprocessor(crop=(0, 0, 10, 5), scale=1)(png()).size == (10, 5)
+    with pytest.raises(OCRException, match="Failed to load the image"):
+        Preprocessor().batch([png(), b"not an image"])
+    with pytest.raises(ValueError):
+        Preprocessor(median_size=2)
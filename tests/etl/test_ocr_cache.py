@@ -0,0 +1,94 @@
+import os
+import time
+from unittest.mock import patch
+from PIL import Image
+
+from scraper.etl.ocr import OCREngine, recognize
+from scraper.etl.ocr_cache import OCRCache
+from scraper.etl.preprocessing import Preprocessor
+from scraper.telemetry import metrics
+from tests.etl.test_ocr import png
+
+
+def test_lru_evicts_least_recently_used():
+    cache = OCRCache(max_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"
+    cache.put("c", "3")
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+
+
+def test_disk_store_persists_across_instances(tmp_path):
+    OCRCache(directory=tmp_path).put("ab12", "price 9.99")
+    cache = OCRCache(max_entries=0, directory=tmp_path)
+    assert cache.get("ab12") == "price 9.99"
+    assert cache.get("cd34") is None
+    assert len(cache) == 0
+
+
+def test_disk_store_evicts_oldest_files(tmp_path):
+    cache = OCRCache(max_entries=0, directory=tmp_path, max_files=10)
+    for i in range(11):
+        cache.put(f"{i:04}", str(i))
+        path = tmp_path / f"{i:04}"[:2] / f"{i:04}"
+        os.utime(path, (i, i))
+    # The overflowing put freed a tenth of the room, oldest first
+    assert len(list(tmp_path.glob("*/*"))) == 9
+    assert cache.get("0000") is None and cache.get("0001") is None
+    assert cache.get("0010") == "10"
+
+
+def test_disk_store_expires_old_files(tmp_path):
+    OCRCache(directory=tmp_path).put("ab12", "price 9.99")
+    expired = time.time() - 120
+    os.utime(tmp_path / "ab" / "ab12", (expired, expired))
+    OCRCache(directory=tmp_path).put("cd34", "price 1.99")
+    cache = OCRCache(max_entries=0, directory=tmp_path, max_age=60)
+    assert not (tmp_path / "ab" / "ab12").exists()
+    assert cache.get("cd34") == "price 1.99"
+
+
+def test_failed_disk_write_removes_temp_file(tmp_path):
+    cache = OCRCache(max_entries=0, directory=tmp_path)
+    with patch("os.replace", side_effect=OSError("disk full")):
+        cache.put("ab12", "price 9.99")
+    assert list(tmp_path.glob("*/*")) == []
+
+
+def test_key_covers_pixels_and_settings():
+    white, black = Image.new("L", (4, 4), 255), Image.new("L", (4, 4), 0)
+    assert OCRCache.key(white, "eng", "--psm 7") == OCRCache.key(white.copy(), "eng", "--psm 7")  # noqa:E501
+    assert OCRCache.key(white, "eng", "--psm 7") != OCRCache.key(black, "eng", "--psm 7")  # noqa:E501
+    assert OCRCache.key(white, "eng", "--psm 7") != OCRCache.key(white, "deu", "--psm 7")  # noqa:E501
+
+
+def test_repeated_images_skip_tesseract(tmp_path):
+    cache = OCRCache(directory=tmp_path)
+    preprocessor = Preprocessor()
+    with metrics.scope(target="captcha-cache"), \
+         patch("pytesseract.image_to_string", return_value="42") as ocr:
+        results = [recognize(png(60, 20), preprocessor, cache) for _ in range(3)]
+        # A fresh process only has the disk store
+        results.append(recognize(png(60, 20), preprocessor, OCRCache(directory=tmp_path)))  # noqa:E501
+    assert results == ["42"] * 4
+    assert ocr.call_count == 1
+    lookups = {result: metrics.OCR_CACHE.value(target="captcha-cache", result=result) for result in ("miss", "memory_hit", "disk_hit")}  # noqa:E501
+    assert lookups == {"miss": 1, "memory_hit": 2, "disk_hit": 1}
+    assert "scraper_ocr_cache_hit_ratio{target=\"captcha-cache\"} 0.75" in metrics.REGISTRY.render()  # noqa:E501
+
+
+def test_engine_answers_cache_hits_without_workers():
+    cache = OCRCache()
+    preprocessor = Preprocessor()
+    image = preprocessor(png(60, 20))
+    engine = OCREngine(workers=1, cache=cache)
+    cache.put(cache.key(image, engine.lang, engine.config), "cached")
+    with patch.object(engine._executor, "submit") as submit:
+        futures = engine.submit_batch([png(60, 20), b"not an image"], preprocessor)  # noqa:E501
+    engine.close()
+    submit.assert_not_called()
+    assert futures[0].result(timeout=0) == "cached"
+    assert "Failed to load the image" in str(futures[1].exception(timeout=0))
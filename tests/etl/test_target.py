@@ -0,0 +1,52 @@
+import time
+import threading
+from unittest.mock import MagicMock, patch
+
+from scraper.config.validator import Extraction, Startup, TargetConfig
+from scraper.etl.target import TargetManager
+
+
+def startup_target():
+    return TargetConfig(
+        name="books",
+        domain="https://example.com",
+        startup=Startup(actions={"cookies": {"type": "click", "locator": "#accept", "locator_type": "id"}}),  # noqa:E501
+    )
+
+
+def test_startup_saves_session(mock_structured_logger):
+    controller = MagicMock()
+    controller.has_session.return_value = False
+    with patch("scraper.etl.target.StartupManager") as startup, \
+         patch.object(TargetManager, "_get_target_links", return_value=[]):
+        TargetManager(mock_structured_logger, controller).scrape_target(startup_target())  # noqa:E501
+    startup.return_value.execute.assert_called_once()
+    controller.save_session.assert_called_once_with("books")
+
+
+def test_saved_session_skips_startup(mock_structured_logger):
+    controller = MagicMock()
+    controller.has_session.return_value = True
+    with patch("scraper.etl.target.StartupManager") as startup, \
+         patch.object(TargetManager, "_get_target_links", return_value=[]):
+        TargetManager(mock_structured_logger, controller).scrape_target(startup_target())  # noqa:E501
+    startup.assert_not_called()
+    controller.make_request.assert_not_called()
+
+
+def test_concurrent_targets_share_one_ocr_engine(mock_structured_logger, tmp_path):  # noqa:E501
+    extraction = Extraction(type="img", locator="#price", locator_type="css selector", output_type="csv", output_file=tmp_path / "out.csv")  # noqa:E501
+    target = TargetConfig(name="books", domain="https://example.com", extractions=[extraction])  # noqa:E501
+    manager = TargetManager(mock_structured_logger, MagicMock())
+
+    def slow_engine(**kwargs):
+        time.sleep(0.05)
+        return MagicMock()
+
+    with patch("scraper.etl.target.OCREngine", side_effect=slow_engine) as engine:  # noqa:E501
+        threads = [threading.Thread(target=manager._get_ocr_engine, args=(target,)) for _ in range(4)]  # noqa:E501
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    engine.assert_called_once()
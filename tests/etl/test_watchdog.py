@@ -0,0 +1,100 @@
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from scraper.config import deadline
+from scraper.config.deadline import Deadline, DeadlineExceeded
+from scraper.config.validator import DriverConfig, TargetConfig
+from scraper.etl.extraction import ExtractionManager
+from scraper.etl.target import TargetManager
+from scraper.etl.watchdog import LinkWatchdog
+from scraper.web.connection import ConnectionData
+from scraper.web.controller import WebController
+
+
+def test_checkpoints_raise_once_the_deadline_expires():
+    deadline.check()  # no deadline, no budget
+    expired = Deadline("link", 0)
+    with deadline.scope(expired), pytest.raises(DeadlineExceeded):
+        ExtractionManager(MagicMock(), MagicMock()).execute("books", [MagicMock()])  # noqa:E501
+    assert expired.remaining() == 0
+
+
+def test_hung_link_is_aborted_and_requeued(tmp_path):
+    input_file = tmp_path / "links.txt"
+    input_file.write_text("https://a.com\n")
+    target = TargetConfig(name="books", domain="https://a.com", input_file=input_file, extractions=[],  # noqa:E501
+                          link_timeout=0.1, link_abort_grace=1, link_retry={"delay": 0})  # noqa:E501
+    aborted = threading.Event()
+    controller = MagicMock()
+    controller.apply_restart.return_value = False
+    controller.abort.side_effect = lambda name, grace: aborted.set()
+    # The first request hangs until the watchdog aborts the driver
+    results = iter([lambda: aborted.wait(5) and False, lambda: True])
+    controller.make_request.side_effect = lambda name, link: next(results)()
+    manager = TargetManager(MagicMock(), controller)
+    with patch.object(TargetManager, "_scrape_link", return_value=[]) as scrape_link:  # noqa:E501
+        manager.scrape_target(target)
+    manager.close()
+    controller.abort.assert_called_once_with("books", 1)
+    controller.rotate_proxy.assert_called_once()
+    scrape_link.assert_called_once()
+    assert not (tmp_path / "links.failed.txt").exists()
+
+
+def test_finished_link_is_not_aborted():
+    controller = MagicMock()
+    watchdog = LinkWatchdog(MagicMock(), controller)
+    with watchdog.watch("books", 0.05) as link_deadline:
+        pass
+    threading.Event().wait(0.1)
+    watchdog.close()
+    assert not link_deadline.aborted
+    controller.abort.assert_not_called()
+
+
+def aborting_controller(logger):
+    connection = ConnectionData("test", "4444", proxy="127.0.0.1:8080", container=MagicMock(), driver=MagicMock(spec=WebDriver))  # noqa:E501
+    controller = WebController(logger, {"test": connection})
+    controller.driver_manager = MagicMock()
+    controller.docker_manager = MagicMock()
+    return controller, connection
+
+
+def test_abort_quits_the_driver(mock_structured_logger):
+    controller, connection = aborting_controller(mock_structured_logger)
+    driver = connection.driver
+    assert controller.abort("test", grace=1)
+    controller.driver_manager.quit_driver.assert_called_once_with(driver)
+    assert connection.driver is None and connection.container is not None
+    controller.docker_manager.cleanup.assert_not_called()
+
+
+def test_abort_recycles_the_container_of_a_hung_driver(mock_structured_logger):
+    controller, connection = aborting_controller(mock_structured_logger)
+    container = connection.container
+    released = threading.Event()
+    controller.driver_manager.quit_driver.side_effect = lambda driver: released.wait(5)  # noqa:E501
+    assert not controller.abort("test", grace=0.05)
+    released.set()
+    controller.docker_manager.cleanup.assert_called_once_with(container)
+    assert connection.driver is None and connection.container is None
+
+
+def test_ensure_connected_replaces_an_aborted_driver(mock_structured_logger):
+    controller, connection = aborting_controller(mock_structured_logger)
+    controller.proxy_manager = MagicMock()
+    controller.abort("test", grace=1)
+    new_driver = MagicMock(spec=WebDriver)
+    controller.driver_manager.create_driver.return_value = new_driver
+    controller.ensure_connected("test")
+    assert connection.driver is new_driver
+    assert connection.proxy == "127.0.0.1:8080"
+    controller.docker_manager.create_container.assert_not_called()
+
+
+def test_link_budget_is_opt_in():
+    target = TargetConfig(name="books", domain="https://a.com", extractions=[])
+    assert target.link_timeout is None
+    assert DriverConfig(host_network="http://localhost").page_load_timeout is None  # noqa:E501
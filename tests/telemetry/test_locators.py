@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from selenium.common.exceptions import NoSuchElementException
+
+from scraper.etl.exceptions import ElementNotFoundException
+from scraper.etl.helper import get_element
+from scraper.telemetry import metrics
+from scraper.telemetry.locators import PROFILER, LocatorProfiler
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler():
+    PROFILER.reset()
+    yield
+    PROFILER.reset()
+
+
+def test_get_element_records_outcomes():
+    driver = MagicMock()
+    driver.find_element.side_effect = [MagicMock(), NoSuchElementException(), NoSuchElementException()]  # noqa:E501
+    with metrics.scope(target="books", source="extraction"), \
+         patch("scraper.etl.helper.retry_get_element",
+               side_effect=[MagicMock(), ElementNotFoundException("missing")]):
+        get_element(driver, "title", "id", 1)
+        get_element(driver, "title", "id", 1)
+        with pytest.raises(ElementNotFoundException):
+            get_element(driver, "title", "id", 1)
+    [stats] = PROFILER.ranked()
+    assert (stats.target, stats.source, stats.locator_type, stats.locator) == ("books", "extraction", "id", "title")  # noqa:E501
+    assert stats.counts == {"first_try": 1, "after_wait": 1, "timeout": 1}
+    assert 0 < stats.wasted_time <= stats.total_time
+
+
+def test_report_ranks_by_wasted_time(tmp_path):
+    profiler = LocatorProfiler()
+    assert not profiler.write_report(tmp_path / "report.txt")
+    profiler.record("fast", "id", "first_try", 0.01)
+    profiler.record("slow", "xpath", "timeout", 5.0)
+    profiler.record("waits", "css selector", "after_wait", 1.0)
+    assert [stats.locator for stats in profiler.ranked()] == ["slow", "waits", "fast"]  # noqa:E501
+    assert profiler.write_report(tmp_path / "report.txt", limit=2)
+    lines = (tmp_path / "report.txt").read_text().splitlines()
+    assert len(lines) == 3
+    assert lines[1].endswith("xpath=slow")
@@ -0,0 +1,78 @@
+import pytest
+from urllib.request import urlopen
+
+from scraper.telemetry import metrics
+from scraper.telemetry.exporter import MetricsServer, TextfileExporter
+from scraper.telemetry.metrics import MetricsRegistry
+
+
+def test_histogram_render():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "Test durations.", ("stage",), buckets=(0.1, 1))  # noqa:E501
+    histogram.observe(0.05, stage="parse")
+    histogram.observe(0.5, stage="parse")
+    rendered = registry.render()
+    assert "# TYPE test_seconds histogram" in rendered
+    assert 'test_seconds_bucket{stage="parse",le="0.1"} 1' in rendered
+    assert 'test_seconds_bucket{stage="parse",le="+Inf"} 2' in rendered
+    assert 'test_seconds_count{stage="parse"} 2' in rendered
+    assert 'test_seconds_sum{stage="parse"} 0.55' in rendered
+
+
+def test_duplicate_metric_name():
+    registry = MetricsRegistry()
+    registry.counter("test_total", "Test counter.")
+    with pytest.raises(ValueError):
+        registry.counter("test_total", "Test counter.")
+
+
+def test_track_uses_scope_labels():
+    labels = {"stage": "test_stage", "target": "test_target", "proxy": "1.2.3.4:80"}  # noqa:E501
+    count = metrics.STAGE_SECONDS.count(**labels)
+    errors = metrics.STAGE_ERRORS.value(**labels)
+
+    @metrics.track("test_stage")
+    def fail():
+        raise RuntimeError("boom")
+
+    with metrics.scope(target="test_target", proxy="1.2.3.4:80"):
+        with metrics.track("test_stage"):
+            pass
+        with pytest.raises(RuntimeError):
+            fail()
+    assert metrics.current_labels() == {}
+    assert metrics.STAGE_SECONDS.count(**labels) == count + 2
+    assert metrics.STAGE_ERRORS.value(**labels) == errors + 1
+
+
+def test_proxy_labels_disabled():
+    metrics.configure(proxy_labels=False)
+    try:
+        with metrics.scope(target="test_target", proxy="1.2.3.4:80"):
+            assert metrics.current_labels() == {"target": "test_target"}
+    finally:
+        metrics.configure(proxy_labels=True)
+
+
+def test_metrics_server(mock_structured_logger):
+    registry = MetricsRegistry()
+    registry.counter("test_total", "Test counter.").inc(3)
+    server = MetricsServer(mock_structured_logger, port=0, registry=registry)
+    server.start()
+    try:
+        with urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            assert "test_total 3" in response.read().decode()
+    finally:
+        server.stop()
+
+
+def test_textfile_exporter(mock_structured_logger, tmp_path):
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test counter.")
+    path = tmp_path / "metrics" / "scraper.prom"
+    exporter = TextfileExporter(mock_structured_logger, path, interval=60, registry=registry)  # noqa:E501
+    exporter.start()
+    counter.inc()
+    exporter.stop()
+    assert "test_total 1" in path.read_text()
+    assert not path.with_name("scraper.prom.part").exists()
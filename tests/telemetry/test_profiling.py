@@ -0,0 +1,43 @@
+import time
+import pstats
+from unittest.mock import MagicMock, patch
+
+from scraper.cmd.cli import run_cli
+from scraper.telemetry.profiling import Profiler
+
+
+def busy_target(duration):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+
+def test_profile_writes_outputs(mock_structured_logger, tmp_path):
+    profiler = Profiler(mock_structured_logger, tmp_path / "profiles", interval=0.001)  # noqa:E501
+    with profiler.profile("books/target"):
+        busy_target(0.1)
+    outputs = profiler.outputs["books/target"]
+    assert outputs["pstats"].name.endswith("_books_target.pstats")
+    stats = pstats.Stats(str(outputs["pstats"]))
+    assert any(func[2] == "busy_target" for func in stats.stats)
+    lines = outputs["collapsed"].read_text().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert any(f"{__name__}:busy_target" in line for line in lines)
+    # One frame per function, however many lines of it were sampled
+    frames = {frame for line in lines for frame in line.rsplit(" ", 1)[0].split(";")}  # noqa:E501
+    assert f"{__name__}:busy_target" in frames
+    assert not any("(" in frame for frame in frames)
+
+
+def test_profile_is_rejected_in_daemon_mode(capsys):
+    cfg = {"logging": MagicMock(log_profile=False), "daemon": MagicMock(enabled=False)}  # noqa:E501
+    with (
+        patch("sys.argv", ["main.py", "--target-type", "books", "--profile", "--daemon", "--skip-preflight"]),  # noqa:E501
+        patch("scraper.cmd.cli.load_cached_config", return_value=cfg),
+        patch("scraper.cmd.cli.StructuredLogger") as logger,
+    ):
+        assert run_cli() == (None, None)
+    logger.assert_not_called()
+    assert "not supported in daemon mode" in capsys.readouterr().out
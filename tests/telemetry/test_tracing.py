@@ -0,0 +1,55 @@
+import json
+import pytest
+
+from scraper.telemetry import tracing
+
+
+@pytest.fixture
+def span_file(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    tracing.configure(path)
+    yield path
+    tracing.shutdown()
+
+
+def read_spans(path):
+    spans = {}
+    for request in map(json.loads, path.read_text().splitlines()):
+        for resource_spans in request["resourceSpans"]:
+            assert resource_spans["resource"]["attributes"] == [{"key": "service.name", "value": {"stringValue": "scraper"}}]  # noqa:E501
+            for scope_spans in resource_spans["scopeSpans"]:
+                spans.update((span["name"], span) for span in scope_spans["spans"])  # noqa:E501
+    return spans
+
+
+def test_nested_spans(span_file):
+    with tracing.span("scrape_link", link="https://example.com") as root:
+        with tracing.span("extraction", locator="body", unused=None) as child:
+            child.set_attribute("rows", 3)
+        assert tracing.current_span() is root
+    assert tracing.current_span() is None
+    spans = read_spans(span_file)
+    assert spans["extraction"]["traceId"] == spans["scrape_link"]["traceId"]
+    assert spans["extraction"]["parentSpanId"] == spans["scrape_link"]["spanId"]  # noqa:E501
+    assert "parentSpanId" not in spans["scrape_link"]
+    assert spans["scrape_link"]["kind"] == tracing.SPAN_KIND_INTERNAL
+    assert spans["scrape_link"]["status"] == {"code": tracing.STATUS_CODE_OK}
+    assert spans["extraction"]["attributes"] == [
+        {"key": "locator", "value": {"stringValue": "body"}},
+        {"key": "rows", "value": {"intValue": "3"}},
+    ]
+    assert int(spans["scrape_link"]["endTimeUnixNano"]) >= int(spans["extraction"]["endTimeUnixNano"])  # noqa:E501
+
+
+def test_span_records_error(span_file):
+    with pytest.raises(ValueError):
+        with tracing.span("write"):
+            raise ValueError("boom")
+    status = read_spans(span_file)["write"]["status"]
+    assert status == {"code": tracing.STATUS_CODE_ERROR, "message": "ValueError: boom"}  # noqa:E501
+
+
+def test_tracing_disabled():
+    with tracing.span("scrape_link") as span:
+        assert span is None
+    assert tracing.current_span() is None
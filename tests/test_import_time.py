@@ -0,0 +1,10 @@
+import pytest
+
+from benchmarks.import_time import DEFAULT_MODULES, eager_dependencies, import_trace  # noqa:E501
+
+
+@pytest.mark.parametrize("module", DEFAULT_MODULES)
+def test_heavy_dependencies_are_lazy(module):
+    trace = import_trace(module)
+    assert module in trace
+    assert eager_dependencies(trace) == []
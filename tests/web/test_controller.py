@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from selenium.common.exceptions import WebDriverException
 
+from scraper.telemetry import tracing
 from scraper.web.proxy import ProxyReloadError
 
 
@@ -91,3 +92,16 @@ def test_rotate_proxy_failure(mock_web_controller, mock_connection_data):
         with open(mock_web_controller.logger.log_file, "r") as f:
             log_contents = f.read()
             assert "ProxyReloadError" in log_contents
+
+
+def test_make_request_span_hides_proxy_credentials(mock_web_controller, mock_connection_data, tmp_path):  # noqa:E501
+    span_file = tmp_path / "spans.jsonl"
+    tracing.configure(span_file)
+    try:
+        mock_connection_data.proxy = "user:secret@127.0.0.1:8080"
+        mock_web_controller.make_request("test", "https://example.com")
+    finally:
+        tracing.shutdown()
+    spans = span_file.read_text()
+    assert "127.0.0.1:8080" in spans
+    assert "secret" not in spans
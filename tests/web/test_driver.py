@@ -40,6 +40,15 @@ def test_create_driver_with_proxy(mock_driver_manager, mock_connection_data, moc
         assert f"--proxy-server={mock_connection_data.proxy}" in opts.arguments
 
 
+def test_create_driver_adds_proxy_credentials(mock_driver_manager, mock_connection_data, mock_driver):  # noqa:E501
+    mock_driver_manager.proxy_server = True
+    mock_driver_manager.proxy_authentication = {"username": "user", "password": "secret"}  # noqa:E501
+    with patch('selenium.webdriver.Remote', return_value=mock_driver) as mock_remote:
+        mock_driver_manager.create_driver(mock_connection_data)
+        opts = mock_remote.call_args[1]['options']
+        assert f"--proxy-server=user:secret@{mock_connection_data.proxy}" in opts.arguments  # noqa:E501
+
+
 # Test retry mechanism with mocked time.sleep to avoid delay
 def test_create_driver_retry(mock_driver_manager, mock_connection_data, mock_driver):
     with patch('selenium.webdriver.Remote', side_effect=[WebDriverException("Failed to create driver"), mock_driver]), \
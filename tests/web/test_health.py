@@ -0,0 +1,126 @@
+import time
+import pytest
+import threading
+from unittest.mock import patch
+
+from scraper.config.validator import ProxyConfig
+from scraper.web.health import ProxyHealthStore
+from scraper.web.proxy import ProxyManager
+
+
+def test_record_and_load(tmp_path):
+    store = ProxyHealthStore(tmp_path / "health.db")
+    store.record_validation("1.2.3.4:8080", True, 0.25)
+    store.record_usage("1.2.3.4:8080", 7)
+    store.record_usage("5.6.7.8:8080", 3)
+    records = store.load()
+    assert records["1.2.3.4:8080"].healthy
+    assert records["1.2.3.4:8080"].latency == 0.25
+    assert records["1.2.3.4:8080"].usage == 7
+    assert records["5.6.7.8:8080"].last_validated is None
+    assert list(store.load(["5.6.7.8:8080", "9.9.9.9:80"])) == ["5.6.7.8:8080"]
+    store.close()
+
+
+def test_records_persist_across_connections(tmp_path):
+    db_file = tmp_path / "nested" / "health.db"
+    store = ProxyHealthStore(db_file)
+    store.record_validation("1.2.3.4:8080", False)
+    store.close()
+    reopened = ProxyHealthStore(db_file)
+    assert not reopened.load()["1.2.3.4:8080"].healthy
+    reopened.close()
+
+
+def test_records_are_written_in_batches_off_the_calling_thread(tmp_path):
+    store = ProxyHealthStore(tmp_path / "health.db")
+    writes = []
+    store._conn.set_trace_callback(lambda statement: writes.append((threading.current_thread(), statement)))  # noqa:E501
+    for index in range(200):
+        store.record_validation(f"1.2.3.{index}:8080", True, 0.1)
+    store._queued.set()
+    deadline = time.monotonic() + 5
+    while store._validations and time.monotonic() < deadline:
+        time.sleep(0.01)
+    store.flush()
+    assert writes and threading.current_thread() not in {thread for thread, _ in writes}  # noqa:E501
+    assert sum(statement == "COMMIT" for _, statement in writes) < 200
+    assert len(store.load()) == 200
+    store.close()
+
+
+def test_proxy_manager_restores_fresh_proxies(mock_structured_logger, test_proxy_config, tmp_path):  # noqa:E501
+    test_proxy_config["input_file"].write_text("1.1.1.1:80\n2.2.2.2:80\n3.3.3.3:80\n4.4.4.4:80\n")  # noqa:E501
+    db_file = tmp_path / "health.db"
+    store = ProxyHealthStore(db_file)
+    store.record_validation("1.1.1.1:80", True)
+    store.record_usage("1.1.1.1:80", 5)
+    store.record_validation("2.2.2.2:80", False)
+    store.record_validation("3.3.3.3:80", True)
+    store.record_usage("3.3.3.3:80", test_proxy_config["usage_limit"])
+    store.close()
+    cfg = ProxyConfig(**{**test_proxy_config, "validation": True, "health_db": db_file})  # noqa:E501
+
+    def validate_stale(proxies, on_result, on_complete):
+        assert proxies == ["4.4.4.4:80"]
+        on_result("4.4.4.4:80", True, 0.1)
+        on_complete(["4.4.4.4:80"])
+
+    with patch("scraper.web.validation.AsyncProxyValidator.start", side_effect=validate_stale):  # noqa:E501
+        manager = ProxyManager(mock_structured_logger, cfg)
+    assert manager.proxy_pool == {"1.1.1.1:80": (5, False), "4.4.4.4:80": (0, False)}  # noqa:E501
+    assert manager.get_proxy() == "1.1.1.1:80"
+    manager.increment_usage("1.1.1.1:80")
+    assert manager.health_store.load()["1.1.1.1:80"].usage == 7
+    manager.close()
+
+
+def test_proxy_manager_revalidates_stale_proxies(mock_structured_logger, test_proxy_config, tmp_path):  # noqa:E501
+    test_proxy_config["input_file"].write_text("1.1.1.1:80\n")
+    db_file = tmp_path / "health.db"
+    store = ProxyHealthStore(db_file)
+    store.record_validation("1.1.1.1:80", True)
+    store.close()
+    cfg = ProxyConfig(**{**test_proxy_config, "validation": True, "health_db": db_file, "revalidate_after": 1})  # noqa:E501
+    validated = []
+
+    def validate_stale(proxies, on_result, on_complete):
+        validated.extend(proxies)
+        on_result("1.1.1.1:80", True, 0.1)
+        on_complete(proxies)
+
+    with patch("scraper.web.proxy.time.time", return_value=time.time() + 10), \
+         patch("scraper.web.validation.AsyncProxyValidator.start", side_effect=validate_stale):  # noqa:E501
+        ProxyManager(mock_structured_logger, cfg).close()
+    assert validated == ["1.1.1.1:80"]
+
+
+def test_proxy_manager_fails_when_every_proxy_is_skipped(mock_structured_logger, test_proxy_config, tmp_path):  # noqa:E501
+    test_proxy_config["input_file"].write_text("1.1.1.1:80\n2.2.2.2:80\n")
+    db_file = tmp_path / "health.db"
+    store = ProxyHealthStore(db_file)
+    store.record_validation("1.1.1.1:80", False)
+    store.record_validation("2.2.2.2:80", True)
+    store.record_usage("2.2.2.2:80", test_proxy_config["usage_limit"])
+    store.close()
+    cfg = ProxyConfig(**{**test_proxy_config, "validation": True, "health_db": db_file})  # noqa:E501
+    with patch("scraper.web.validation.AsyncProxyValidator.start") as start, \
+         pytest.raises(ValueError, match="No Viable Proxies"):
+        ProxyManager(mock_structured_logger, cfg)
+    start.assert_not_called()
+
+
+def test_usage_is_recorded_after_releasing_the_pool(mock_structured_logger, test_proxy_config, tmp_path):  # noqa:E501
+    cfg = ProxyConfig(**{**test_proxy_config, "health_db": tmp_path / "health.db"})  # noqa:E501
+    manager = ProxyManager(mock_structured_logger, cfg)
+    recorded = []
+
+    def record_usage(proxy, usage):
+        assert not manager._lock._is_owned()
+        recorded.append(usage)
+
+    with patch.object(manager.health_store, "record_usage", side_effect=record_usage):  # noqa:E501
+        proxy = manager.get_proxy()
+        manager.increment_usage(proxy)
+    assert recorded == [1, 2]
+    manager.close()
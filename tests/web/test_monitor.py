@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock, patch
+from docker.models.containers import Container
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from scraper.telemetry import metrics
+from scraper.web.connection import ConnectionData
+from scraper.web.controller import WebController
+from scraper.web.docker import ContainerStats, DockerManager
+from scraper.web.monitor import ContainerMonitor
+
+
+def docker_manager(logger, docker_config):
+    with patch("docker.from_env"):
+        return DockerManager(logger, docker_config)
+
+
+def monitored_controller(logger):
+    connection = ConnectionData("test", "4444", proxy="127.0.0.1:8080", container=MagicMock(spec=Container), driver=MagicMock(spec=WebDriver))  # noqa:E501
+    controller = WebController(logger, {"test": connection})
+    controller.proxy_manager = MagicMock(proxy_pool=[])
+    controller.proxy_manager.get_proxy.return_value = "127.0.0.2:8080"
+    controller.docker_manager = MagicMock()
+    controller.docker_manager.create_container.return_value = MagicMock(spec=Container)  # noqa:E501
+    controller.driver_manager = MagicMock()
+    controller.driver_manager.create_driver.return_value = MagicMock(spec=WebDriver)  # noqa:E501
+    controller.monitor = ContainerMonitor(logger, controller, failures=2)
+    return controller, connection
+
+
+def test_resource_limits_are_applied(mock_structured_logger, mock_docker_config):  # noqa:E501
+    manager = docker_manager(mock_structured_logger, mock_docker_config)
+    manager.client.containers.run.return_value = MagicMock(spec=Container)
+    manager.create_container(ConnectionData("test", 4444))
+    kwargs = manager.client.containers.run.call_args.kwargs
+    assert kwargs["cpu_period"] == 100_000 and kwargs["cpu_quota"] == 50_000
+    assert kwargs["mem_limit"] == kwargs["memswap_limit"] == "1g"
+
+
+def test_stats_reports_state_and_usage(mock_structured_logger, mock_docker_config):  # noqa:E501
+    manager = docker_manager(mock_structured_logger, mock_docker_config)
+    container = MagicMock(status="running", attrs={"State": {"OOMKilled": False}})
+    container.stats.return_value = {
+        "memory_stats": {"usage": 600, "limit": 1000, "stats": {"inactive_file": 100}},  # noqa:E501
+        "cpu_stats": {"cpu_usage": {"total_usage": 300}, "system_cpu_usage": 2000, "online_cpus": 4},  # noqa:E501
+        "precpu_stats": {"cpu_usage": {"total_usage": 100}, "system_cpu_usage": 1000},  # noqa:E501
+    }
+    stats = manager.stats(container)
+    assert stats.running and stats.memory_usage == 500 and stats.memory_limit == 1000  # noqa:E501
+    assert stats.cpu == 0.8
+    container.status, container.attrs = "exited", {"State": {"OOMKilled": True, "ExitCode": 137}}  # noqa:E501
+    stats = manager.stats(container)
+    assert stats.oom_killed and stats.exit_code == 137 and stats.memory_usage is None  # noqa:E501
+
+
+def test_oom_killed_container_is_restarted(mock_structured_logger):
+    controller, connection = monitored_controller(mock_structured_logger)
+    old_container = connection.container
+    old_driver = connection.driver
+    controller.docker_manager.stats.return_value = ContainerStats("exited", oom_killed=True)  # noqa:E501
+    controller.monitor.check()
+    # The restart waits for the link loop, the driver of a running link stays put  # noqa:E501
+    assert connection.container is old_container and connection.driver is old_driver  # noqa:E501
+    controller.monitor.check()
+    controller.docker_manager.stats.assert_called_once()
+    assert controller.apply_restart("test")
+    assert not controller.apply_restart("test")
+    controller.docker_manager.cleanup.assert_called_once_with(old_container)
+    controller.driver_manager.quit_driver.assert_not_called()
+    assert connection.container is controller.docker_manager.create_container.return_value  # noqa:E501
+    assert connection.driver is controller.driver_manager.create_driver.return_value  # noqa:E501
+    assert metrics.CONTAINER_RESTARTS.value(target="test", reason="oom") >= 1
+    assert metrics.CONTAINER_UP.value(target="test") == 0
+
+
+def test_unresponsive_container_is_restarted_after_consecutive_failures(mock_structured_logger):  # noqa:E501
+    controller, connection = monitored_controller(mock_structured_logger)
+    controller.docker_manager.stats.return_value = ContainerStats("running", memory_usage=500, memory_limit=1000, cpu=0.5)  # noqa:E501
+    controller.driver_manager.is_responsive.side_effect = [False, True, False, False]  # noqa:E501
+    for _ in range(3):
+        controller.monitor.check()
+    controller.docker_manager.cleanup.assert_not_called()  # a success resets the count  # noqa:E501
+    assert metrics.CONTAINER_MEMORY.value(target="test") == 500
+    controller.monitor.check()
+    controller.docker_manager.cleanup.assert_not_called()
+    assert controller.restart_pending("test") and controller.apply_restart("test")  # noqa:E501
+    controller.docker_manager.cleanup.assert_called_once()
+    assert connection.container is controller.docker_manager.create_container.return_value  # noqa:E501
+
+
+def test_monitor_skips_connections_being_replaced(mock_structured_logger):
+    controller, connection = monitored_controller(mock_structured_logger)
+    connection.container = None
+    controller.monitor.check()
+    controller.docker_manager.stats.assert_not_called()
+
+
+def test_monitor_is_opt_in(mock_structured_logger, mock_docker_config):
+    assert mock_docker_config.monitor_interval is None
+    controller = WebController(mock_structured_logger, {})
+    with patch("docker.from_env"):
+        controller.init_docker_manager(mock_docker_config)
+    assert controller.monitor is None
@@ -1,7 +1,11 @@
+import os
 import re
+import time
 import pytest
+import threading
 from unittest.mock import MagicMock, patch
-from scraper.web.proxy import UsageError, ProxyReloadError
+from scraper.config.validator import ProxyConfig
+from scraper.web.proxy import ProxyManager, UsageError, ProxyReloadError, proxy_address, with_credentials
 
 
 def test_create_pool(mock_proxy_manager):
@@ -53,21 +57,6 @@ def test_delete_proxy(mock_proxy_manager):
     assert proxy not in mock_proxy_manager.proxy_pool
 
 
-# Test validation with mocked network requests
-@patch('scraper.web.proxy.requests.get')
-def test_validate_proxies_success(mock_get, mock_proxy_manager):
-    mock_get.return_value = MagicMock(status_code=200)
-    validated_proxies = mock_proxy_manager._validate_proxies()
-    assert len(validated_proxies) == len(mock_proxy_manager._format_pool())
-
-
-@patch('scraper.web.proxy.requests.get')
-def test_validate_proxies_failure(mock_get, mock_proxy_manager):
-    mock_get.side_effect = Exception("Failed to connect")
-    with pytest.raises(ValueError):
-        mock_proxy_manager._validate_proxies()
-
-
 # Test formatting
 def test_format_pool_success(mock_proxy_manager):
     formatted_proxies = mock_proxy_manager._format_pool()
@@ -80,6 +69,19 @@ def test_format_pool_failure(mock_proxy_manager):
             mock_proxy_manager._format_pool()
 
 
+def test_proxy_address_strips_credentials():
+    assert proxy_address("user:secret@1.2.3.4:8080") == "1.2.3.4:8080"
+    assert proxy_address("1.2.3.4:8080") == "1.2.3.4:8080"
+    assert proxy_address(None) is None
+
+
+def test_format_pool_keeps_credentials_out_of_the_pool(mock_proxy_manager):
+    mock_proxy_manager.authentication = {"username": "user", "password": "secret"}  # noqa:E501
+    assert mock_proxy_manager._format_pool(["1.2.3.4:8080"]) == ["1.2.3.4:8080"]  # noqa:E501
+    assert with_credentials("1.2.3.4:8080", mock_proxy_manager.authentication) == "user:secret@1.2.3.4:8080"  # noqa:E501
+    assert with_credentials("1.2.3.4:8080", None) == "1.2.3.4:8080"
+
+
 # Test proxy reload success
 def test_proxy_reload_success(mock_proxy_manager):
     # Simulate exhausting the initial proxy pool
@@ -89,7 +91,7 @@ def test_proxy_reload_success(mock_proxy_manager):
     # Mock the behavior of loading and validating new proxies
     new_proxies = ["1.2.3.4:8080", "5.6.7.8:8080"]
     with patch('scraper.web.proxy.ProxyManager._load_proxies', return_value=new_proxies), \
-         patch('scraper.web.proxy.ProxyManager._validate_proxies', return_value=new_proxies):  # noqa:E501
+         patch.object(mock_proxy_manager.validator, "validate", side_effect=fake_validate()):  # noqa:E501
         reloaded_proxy = mock_proxy_manager.get_proxy()
 
     assert reloaded_proxy in new_proxies
@@ -107,13 +109,136 @@ def test_proxy_reload_failure_no_new_proxies(mock_proxy_manager):
         mock_proxy_manager.get_proxy()
 
 
-@patch('scraper.web.proxy.requests.get')
-def test_proxy_reload_with_validation(mock_get, mock_proxy_manager):
+def test_proxy_reload_with_validation(mock_proxy_manager):
     mock_proxy_manager.validation = True
     for _ in range(len(mock_proxy_manager.proxy_pool)):
         mock_proxy_manager.get_proxy()
-    new_proxies = ["11.22.33.44:4080", "invalid_proxy"]
-    mock_get.side_effect = [MagicMock(status_code=200), Exception("Failed to connect")]  # noqa:E501
-    with patch('scraper.web.proxy.ProxyManager._load_proxies', return_value=new_proxies):  # noqa:E501
-        _ = mock_proxy_manager.get_proxy()
+    new_proxies = ["11.22.33.44:4080", "55.66.77.88:4080", "invalid_proxy"]
+    with patch('scraper.web.proxy.ProxyManager._load_proxies', return_value=new_proxies), \
+         patch.object(mock_proxy_manager.validator, "validate", side_effect=fake_validate({"55.66.77.88:4080"})):  # noqa:E501
+        assert mock_proxy_manager.get_proxy() == "11.22.33.44:4080"
     assert len(mock_proxy_manager.proxy_pool) == 2
+
+
+def test_proxy_reload_releases_the_pool_lock(mock_proxy_manager):
+    manager = mock_proxy_manager
+    in_use = [manager.get_proxy() for _ in range(len(manager.proxy_pool))]
+    released = threading.Event()
+
+    def slow_validate(proxies, on_result=None):
+        # Another thread releases a proxy while the reload validates
+        threading.Thread(target=lambda: (manager.release_proxy(in_use[0]), released.set())).start()  # noqa:E501
+        assert released.wait(5), "release_proxy blocked on the reload"
+        return fake_validate()(proxies, on_result)
+
+    with patch('scraper.web.proxy.ProxyManager._load_proxies', return_value=["1.2.3.4:8080"]), \
+         patch.object(manager.validator, "validate", side_effect=slow_validate):  # noqa:E501
+        assert manager.get_proxy() in (in_use[0], "1.2.3.4:8080")
+
+
+def fake_validate(bad_proxies=()):
+    def validate(proxies, on_result=None):
+        passed = []
+        for proxy in proxies:
+            healthy = proxy not in bad_proxies
+            if on_result:
+                on_result(proxy, healthy, 0.1)
+            if healthy:
+                passed.append(proxy)
+        return passed
+    return validate
+
+
+def test_sync_input_file_hot_reload(mock_proxy_manager):
+    manager = mock_proxy_manager
+    in_use = manager.get_proxy()
+    manager.input_file.write_text("1.2.3.4:8080\n")
+    os.utime(manager.input_file, (0, 0))
+    with patch.object(manager.validator, "validate", side_effect=fake_validate()):  # noqa:E501
+        manager._sync_input_file()
+    # Unlisted proxies still in use are kept until released
+    assert set(manager.proxy_pool) == {in_use, "1.2.3.4:8080"}
+
+
+def test_recheck_pool_removes_failing_proxies(mock_proxy_manager):
+    manager = mock_proxy_manager
+    manager.proxy_pool.update({"1.2.3.4:8080": (0, False), "5.6.7.8:8080": (0, False)})  # noqa:E501
+    in_use = manager.get_proxy()
+    bad = {in_use, "1.2.3.4:8080"}
+    with patch.object(manager.validator, "validate", side_effect=fake_validate(bad)):  # noqa:E501
+        manager._recheck_pool()
+    assert set(manager.proxy_pool) == {in_use, "5.6.7.8:8080"}
+    manager.release_proxy(in_use)
+    assert set(manager.proxy_pool) == {"5.6.7.8:8080"}
+
+
+def test_replenish_spares(mock_proxy_manager):
+    manager = mock_proxy_manager
+    manager.min_spares = 3
+    manager._listed = ["127.0.0.2:8080", "1.2.3.4:8080", "5.6.7.8:8080", "9.9.9.9:8080"]  # noqa:E501
+    with patch.object(manager.validator, "validate", side_effect=fake_validate({"1.2.3.4:8080"})):  # noqa:E501
+        manager._replenish_spares()
+    assert set(manager.proxy_pool) == {"127.0.0.2:8080", "5.6.7.8:8080", "9.9.9.9:8080"}  # noqa:E501
+
+
+def test_get_proxy_never_waits_for_maintainer(mock_proxy_manager):
+    manager = mock_proxy_manager
+    manager._listed.append("1.2.3.4:8080")
+    manager.maintenance_interval = 60
+    validated = threading.Event()
+
+    def validate(proxies, on_result=None):
+        result = fake_validate()(proxies, on_result)
+        validated.set()
+        return result
+
+    with patch.object(manager.validator, "validate", side_effect=validate), \
+         patch.object(manager, "_reload_and_get_proxy", side_effect=AssertionError):  # noqa:E501
+        manager.start_maintainer()
+        try:
+            assert manager.get_proxy() == "127.0.0.2:8080"
+            # Taking the last idle proxy woke the maintainer, a whole interval early  # noqa:E501
+            assert validated.wait(5)
+            assert manager.get_proxy() == "1.2.3.4:8080"
+            start = time.monotonic()
+            with pytest.raises(ProxyReloadError):
+                manager.get_proxy()
+            assert time.monotonic() - start < 1
+        finally:
+            manager.close()
+    assert not manager._maintainer_running()
+
+
+@pytest.fixture
+def windowed_proxy_manager(mock_structured_logger, test_proxy_config):
+    test_proxy_config["input_file"].write_text("1.1.1.1:80\n2.2.2.2:80\n")
+    cfg = ProxyConfig(**{**test_proxy_config, "usage_limit": 2, "usage_window": 60, "cooldown": 30})  # noqa:E501
+    return ProxyManager(mock_structured_logger, cfg)
+
+
+def test_domain_usage_cooldown(windowed_proxy_manager):
+    manager = windowed_proxy_manager
+    proxy = manager.get_proxy("a.com")
+    assert proxy == "1.1.1.1:80"
+    manager.increment_usage(proxy, "a.com")
+    manager.increment_usage(proxy, "a.com")
+    with pytest.raises(UsageError):
+        manager.increment_usage(proxy, "a.com")
+    # The proxy stays pooled and keeps its cumulative usage
+    assert manager.proxy_pool[proxy] == (2, True)
+    manager.release_proxy(proxy)
+    assert manager.get_proxy("a.com") == "2.2.2.2:80"
+    assert manager.get_proxy("b.com") == proxy
+    manager.release_proxy(proxy)
+    with patch("scraper.web.proxy.time.monotonic", return_value=time.monotonic() + 31):  # noqa:E501
+        assert manager.get_proxy("a.com") == proxy
+
+
+def test_domain_usage_window_expires(windowed_proxy_manager):
+    manager = windowed_proxy_manager
+    proxy = manager.get_proxy("a.com")
+    manager.increment_usage(proxy, "a.com")
+    manager.increment_usage(proxy, "a.com")
+    with patch("scraper.web.proxy.time.monotonic", return_value=time.monotonic() + 61):  # noqa:E501
+        manager.increment_usage(proxy, "a.com")
+    assert manager.proxy_pool[proxy] == (3, True)
@@ -0,0 +1,92 @@
+import time
+from unittest.mock import MagicMock, patch
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from scraper.config.validator import DriverConfig
+from scraper.web.connection import ConnectionData
+from scraper.web.controller import WebController
+from scraper.web.docker import DockerManager
+from scraper.web.recycle import DriverRecycler, parse_size
+from scraper.web.session import SessionStore
+
+
+def recycling_controller(logger, **recycle):
+    cfg = DriverConfig(host_network="http://localhost", **recycle)
+    connection = ConnectionData("test", "4444", proxy="127.0.0.1:8080", container=MagicMock(), driver=MagicMock(spec=WebDriver))  # noqa:E501
+    controller = WebController(logger, {"test": connection}, SessionStore())
+    controller.driver_manager = MagicMock()
+    controller.docker_manager = MagicMock()
+    controller.recycler = DriverRecycler(logger, controller.driver_manager, controller.docker_manager, cfg)  # noqa:E501
+    return controller, connection
+
+
+def wait_for_swap(controller, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not controller.recycle_driver("test"):
+        assert time.monotonic() < deadline, "driver was not swapped"
+        time.sleep(0.01)
+
+
+def test_parse_size():
+    assert parse_size("1500MB") == 1500 * 1024**2
+    assert parse_size("2g") == 2 * 1024**3
+
+
+def test_due_by_pages_and_age(mock_structured_logger):
+    controller, connection = recycling_controller(mock_structured_logger, recycle_pages=2, recycle_age=60)  # noqa:E501
+    assert controller.recycler.due(connection) is None
+    connection.pages = 2
+    assert controller.recycler.due(connection) == "pages"
+    connection.pages = 0
+    connection.driver_created_at -= 61
+    assert controller.recycler.due(connection) == "age"
+    assert not DriverRecycler.enabled(DriverConfig(host_network="http://localhost"))  # noqa:E501
+
+
+def test_driver_is_replaced_in_the_background_between_links(mock_structured_logger):  # noqa:E501
+    controller, connection = recycling_controller(mock_structured_logger, recycle_pages=2)  # noqa:E501
+    controller.sessions.save("test", MagicMock(cookies=[], **{"age.return_value": 0}))  # noqa:E501
+    old_driver = connection.driver
+    new_driver = MagicMock(spec=WebDriver)
+    controller.driver_manager.create_driver.return_value = new_driver
+    connection.pages = 2
+    assert not controller.recycle_driver("test")  # replacement is being created
+    assert connection.driver is old_driver
+    wait_for_swap(controller)
+    assert connection.driver is new_driver and connection.pages == 0
+    controller.sessions.get("test").apply.assert_called_once_with(new_driver)
+    controller.recycler.close()
+    controller.driver_manager.quit_driver.assert_called_once_with(old_driver)
+
+
+def test_replacement_is_discarded_after_a_proxy_rotation(mock_structured_logger):  # noqa:E501
+    controller, connection = recycling_controller(mock_structured_logger, recycle_pages=1)  # noqa:E501
+    stale_driver = MagicMock(spec=WebDriver)
+    controller.driver_manager.create_driver.return_value = stale_driver
+    connection.pages = 1
+    controller.recycle_driver("test")
+    connection.proxy = "127.0.0.2:8080"
+    connection.pages = 0
+    time.sleep(0.1)
+    assert not controller.recycle_driver("test")
+    controller.recycler.close()
+    controller.driver_manager.quit_driver.assert_called_once_with(stale_driver)
+
+
+def test_container_memory_triggers_recycling(mock_structured_logger):
+    controller, connection = recycling_controller(mock_structured_logger, recycle_memory="1g")  # noqa:E501
+    controller.docker_manager.memory_usage.return_value = 2 * 1024**3
+    controller.driver_manager.create_driver.return_value = MagicMock(spec=WebDriver)  # noqa:E501
+    wait_for_swap(controller)
+    controller.docker_manager.memory_usage.assert_called_once_with(connection.container)  # noqa:E501
+    controller.recycler.close()
+
+
+def test_memory_usage_excludes_page_cache(mock_structured_logger, mock_docker_config):  # noqa:E501
+    with patch("docker.from_env"):
+        docker_manager = DockerManager(mock_structured_logger, mock_docker_config)  # noqa:E501
+    container = MagicMock()
+    container.stats.return_value = {"memory_stats": {"usage": 500, "stats": {"inactive_file": 100}}}  # noqa:E501
+    assert docker_manager.memory_usage(container) == 400
+    container.stats.return_value = {"memory_stats": {}}
+    assert docker_manager.memory_usage(container) is None
@@ -0,0 +1,105 @@
+import json
+import stat
+import time
+from unittest.mock import MagicMock, patch
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from scraper.config.validator import SessionConfig
+from scraper.web.connection import ConnectionData
+from scraper.web.controller import WebController
+from scraper.web.session import RESTORE_STORAGE_SCRIPT, SessionState, SessionStore
+
+
+def session_state(**overrides):
+    data = {
+        "origin": "https://example.com",
+        "cookies": [
+            {"name": "consent", "value": "yes", "path": "/"},
+            {"name": "stale", "value": "1", "path": "/", "expiry": int(time.time()) - 10},  # noqa:E501
+        ],
+        "local_storage": {"locale": "en-GB"},
+        "session_storage": {"token": "abc"},
+        "captured_at": time.time(),
+    }
+    return SessionState.from_dict({**data, **overrides})
+
+
+def test_capture_reads_cookies_and_storage():
+    driver = MagicMock()
+    driver.execute_script.return_value = ["https://example.com", {"locale": "en-GB"}, {}]  # noqa:E501
+    driver.get_cookies.return_value = [{"name": "consent", "value": "yes"}]
+    state = SessionState.capture(driver)
+    assert state.origin == "https://example.com"
+    assert state.cookies == [{"name": "consent", "value": "yes"}]
+    assert state.local_storage == {"locale": "en-GB"}
+
+
+def test_apply_navigates_to_origin_and_skips_expired_cookies():
+    driver = MagicMock()
+    assert session_state().apply(driver) == 1
+    driver.get.assert_called_once_with("https://example.com")
+    driver.add_cookie.assert_called_once_with({"name": "consent", "value": "yes", "path": "/"})  # noqa:E501
+    driver.execute_script.assert_called_once_with(RESTORE_STORAGE_SCRIPT, {"locale": "en-GB"}, {"token": "abc"})  # noqa:E501
+
+
+def test_store_persists_private_snapshots(tmp_path):
+    SessionStore(tmp_path).save("books", session_state())
+    path = tmp_path / "books.json"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    restored = SessionStore(tmp_path).get("books")
+    assert restored.session_storage == {"token": "abc"}
+    SessionStore(tmp_path).discard("books")
+    assert not path.exists()
+
+
+def test_store_ignores_old_snapshots(tmp_path):
+    path = tmp_path / "books.json"
+    path.write_text(json.dumps(session_state(captured_at=time.time() - 7200).to_dict()))  # noqa:E501
+    assert SessionStore(tmp_path, max_age=3600).get("books") is None
+    path.write_text("not json")
+    assert SessionStore(tmp_path).get("books") is None
+
+
+def controller_with_session(logger, save=True):
+    connection = ConnectionData("test", "4444", proxy="127.0.0.1:8080", driver=MagicMock(spec=WebDriver))  # noqa:E501
+    controller = WebController(logger, {"test": connection}, SessionStore())
+    controller.proxy_manager = MagicMock(proxy_pool=[])
+    controller.proxy_manager.get_proxy.return_value = "127.0.0.2:8080"
+    controller.driver_manager = MagicMock()
+    if save:
+        controller.sessions.save("test", session_state())
+    return controller, connection
+
+
+def test_rotation_restores_session(mock_structured_logger):
+    controller, connection = controller_with_session(mock_structured_logger)
+    new_driver = MagicMock(spec=WebDriver)
+    controller.driver_manager.create_driver.return_value = new_driver
+    controller.rotate_proxy(connection)
+    assert connection.driver is new_driver
+    new_driver.get.assert_called_once_with("https://example.com")
+    new_driver.add_cookie.assert_called_once()
+
+
+def test_failed_restore_discards_session(mock_structured_logger):
+    controller, connection = controller_with_session(mock_structured_logger)
+    connection.driver.get.side_effect = Exception("unreachable")
+    controller._restore_session(connection)
+    assert not controller.has_session("test")
+
+
+def test_save_session_captures_driver(mock_structured_logger):
+    controller, connection = controller_with_session(mock_structured_logger, save=False)  # noqa:E501
+    connection.driver.execute_script.return_value = ["https://example.com", {}, {}]  # noqa:E501
+    connection.driver.get_cookies.return_value = []
+    controller.sessions = None
+    controller.save_session("test")
+    assert not controller.has_session("test")
+    controller.sessions = SessionStore()
+    controller.save_session("test")
+    assert controller.has_session("test")
+
+
+def test_snapshots_are_opt_in():
+    # Snapshots hold login cookies, so nothing is written unless enabled
+    assert not SessionConfig().enabled
@@ -0,0 +1,114 @@
+import time
+import socket
+import threading
+import socketserver
+import pytest
+
+from scraper.config.validator import ProxyConfig
+from scraper.web.proxy import ProxyManager
+from scraper.web.validation import AsyncProxyValidator
+
+
+def serve_proxy(status_line: bytes, delay: float = 0):
+    """Starts a fake proxy answering every request with the given status line."""  # noqa:E501
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            self.request.recv(4096)
+            time.sleep(delay)
+            self.request.sendall(status_line + b"\r\nContent-Length: 0\r\n\r\n")
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def proxy_servers():
+    servers = {
+        "ok": serve_proxy(b"HTTP/1.1 200 OK"),
+        "forbidden": serve_proxy(b"HTTP/1.1 403 Forbidden"),
+        "hung": serve_proxy(b"HTTP/1.1 200 OK", delay=2),
+    }
+    yield {name: f"127.0.0.1:{server.server_address[1]}" for name, server in servers.items()}  # noqa:E501
+    for server in servers.values():
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def closed_proxy():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"127.0.0.1:{port}"
+
+
+def test_validate_streams_functional_proxies(mock_structured_logger, proxy_servers, closed_proxy):  # noqa:E501
+    validator = AsyncProxyValidator(mock_structured_logger, "http://example.com/", "http", timeout=1)  # noqa:E501
+    results = {}
+    proxies = [proxy_servers["ok"], proxy_servers["forbidden"], closed_proxy]
+    validated = validator.validate(proxies, on_result=lambda proxy, healthy, latency: results.update({proxy: healthy}))  # noqa:E501
+    assert validated == [proxy_servers["ok"]]
+    assert results == {proxy_servers["ok"]: True, proxy_servers["forbidden"]: False, closed_proxy: False}  # noqa:E501
+
+
+def test_validate_timeout(mock_structured_logger, proxy_servers):
+    validator = AsyncProxyValidator(mock_structured_logger, "http://example.com/", "http", timeout=0.2)  # noqa:E501
+    assert validator.validate([proxy_servers["hung"]]) == []
+
+
+def test_validate_deadline(mock_structured_logger, proxy_servers):
+    validator = AsyncProxyValidator(mock_structured_logger, "http://example.com/", "http", timeout=5, deadline=0.2)  # noqa:E501
+    start = time.monotonic()
+    assert validator.validate([proxy_servers["hung"], proxy_servers["ok"]]) == [proxy_servers["ok"]]  # noqa:E501
+    assert time.monotonic() - start < 1.5
+    with open(mock_structured_logger.log_file, "r") as f:
+        assert "deadline reached with 1 probes unfinished" in f.read()
+
+
+def test_validate_adds_configured_credentials(mock_structured_logger):
+    requests = []
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            requests.append(self.request.recv(4096))
+            self.request.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        proxy = f"127.0.0.1:{server.server_address[1]}"
+        validator = AsyncProxyValidator(mock_structured_logger, "http://example.com/", "http", timeout=1,  # noqa:E501
+                                        authentication={"username": "user", "password": "pass"})  # noqa:E501
+        assert validator.validate([proxy]) == [proxy]
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert b"Proxy-Authorization: Basic dXNlcjpwYXNz" in requests[0]
+
+
+def test_split_proxy_with_credentials():
+    assert AsyncProxyValidator._split_proxy("user:pass@1.2.3.4:8080") == ("user:pass", "1.2.3.4", 8080)  # noqa:E501
+    assert AsyncProxyValidator._split_proxy("1.2.3.4:8080") == (None, "1.2.3.4", 8080)  # noqa:E501
+
+
+def test_proxy_manager_streams_validated_pool(mock_structured_logger, test_proxy_config, proxy_servers, closed_proxy):  # noqa:E501
+    input_file = test_proxy_config["input_file"]
+    input_file.write_text(f"{proxy_servers['ok']}\n{closed_proxy}\n")
+    cfg = ProxyConfig(**{
+        **test_proxy_config,
+        "test_url": "http://example.com/",
+        "validation": True,
+        "validation_timeout": 1,
+    })
+    manager = ProxyManager(mock_structured_logger, cfg)
+    assert manager.get_proxy() == proxy_servers["ok"]
+    assert list(manager.proxy_pool) == [proxy_servers["ok"]]
+
+
+def test_proxy_manager_no_viable_proxies(mock_structured_logger, test_proxy_config, closed_proxy):  # noqa:E501
+    test_proxy_config["input_file"].write_text(f"{closed_proxy}\n")
+    cfg = ProxyConfig(**{**test_proxy_config, "validation": True, "validation_timeout": 1})  # noqa:E501
+    with pytest.raises(ValueError, match="No Viable Proxies"):
+        ProxyManager(mock_structured_logger, cfg)